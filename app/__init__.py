@@ -1,16 +1,16 @@
+import click
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
-from flask_migrate import Migrate
 from flask_mail import Mail 
 from flask_apscheduler import APScheduler 
+from app.db_routing import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 bcrypt = Bcrypt()
 jwt = JWTManager()
-migrate = Migrate()
 mail = Mail() 
 scheduler = APScheduler() 
 
@@ -20,8 +20,14 @@ def create_app():
 
     app.config['JWT_SECRET_KEY'] = app.config['SECRET_KEY']
 
+    from app.json_provider import init_json_provider
+    init_json_provider(app)
+
     db.init_app(app)
-    migrate.init_app(app, db)
+    # Flask-Migrate(alembic) 는 flask 명령(flask db upgrade 등)으로 실행할 때만 불러옵니다. (앱 시작 시간 단축)
+    if click.get_current_context(silent=True) is not None:
+        from flask_migrate import Migrate
+        Migrate(app, db)
     bcrypt.init_app(app)
     jwt.init_app(app)
     mail.init_app(app) 
@@ -29,10 +35,28 @@ def create_app():
     
     scheduler.init_app(app) 
 
+    from app.metrics import metrics
+    metrics.init_app(app)
+
+    from app.query_inspector import query_inspector
+    query_inspector.init_app(app)
+
+    from app.cache import availability_cache
+    availability_cache.init_app(app)
+
+    from app.passwords import password_hasher
+    password_hasher.init_app(app)
+
+    from app.user_cache import user_cache, load_current_user, user_lookup_error
+    user_cache.init_app(app)
+    jwt.user_lookup_loader(load_current_user)
+    jwt.user_lookup_error_loader(user_lookup_error)
+
     
     CORS(app, resources={r"/*": {
         "origins": "*", 
-        "allow_headers": ["Content-Type", "Authorization"]
+        "allow_headers": ["Content-Type", "Authorization", "If-None-Match"],
+        "expose_headers": ["ETag"]
     }})
 
     
@@ -48,8 +72,32 @@ def create_app():
     from app.routes.notification import notification_bp
     app.register_blueprint(notification_bp)
 
+    from app.routes.admin import admin_bp
+    app.register_blueprint(admin_bp)
+
+    from app.routes.health import health_bp
+    app.register_blueprint(health_bp)
+
+    if app.config['METRICS_ENABLED']:
+        from app.routes.metrics import metrics_bp
+        app.register_blueprint(metrics_bp)
+
+    from app.commands import register_commands
+    register_commands(app)
+
     from . import models
-    with app.app_context():
-        db.create_all()
+    # 운영 환경에서는 SCHEMA_AUTO_CREATE=false 로 끄고 migrations/ (flask db upgrade) 로만 스키마를 관리합니다.
+    if app.config['SCHEMA_AUTO_CREATE']:
+        with app.app_context():
+            from sqlalchemy import inspect
+            existing_tables = set(inspect(db.engine).get_table_names())
+            db.create_all()
+            # 예약으로부터 계산하는 테이블을 새로 만들었으면 기존 예약으로 바로 채웁니다. (migrations/ 의 upgrade 와 같게)
+            if 'space_day_occupancy' not in existing_tables:
+                from app.occupancy import rebuild_occupancy
+                rebuild_occupancy()
+            if 'booking_slot' not in existing_tables:
+                from app.booking_slots import rebuild_booking_slots
+                rebuild_booking_slots()
 
     return app
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""
+장소 이용률 분석 (관리자용)
+
+예약 건마다 Python 으로 슬롯을 세지 않고, 이미 유지되고 있는 파생 테이블을 SQL 집계로 읽습니다.
+
+- 이용률: space_day_occupancy (장소/날짜별 예약된 10분 슬롯 수) 를 장소별로 SUM
+- 노쇼율: 시작 시각이 지난 확정 예약 중 체크인(check_in_time)이 없는 비율, 장소별 GROUP BY
+- 요일/시간대 히트맵: booking_slot (취소되지 않은 예약의 10분 슬롯) 을 (요일, 슬롯) 별 COUNT
+  (보관된 예약은 booking_archive 를 (요일, 시작, 종료 시각) 별 COUNT 한 뒤 슬롯으로 펼침)
+
+어느 쿼리도 결과 행 수가 (장소 수) 또는 (7 x 144) 를 넘지 않으므로, 1년치 예약에서도 DB 집계 시간이 대부분입니다.
+"""
+from collections import defaultdict
+
+from sqlalchemy import Integer, case, cast, extract, func
+from sqlalchemy.sql import and_, or_
+
+from app import db
+from app.models import Booking, BookingArchive, BookingSlot, Space, SpaceDayOccupancy
+from app.slots import DAY_END_MINUTES, DAY_START_MINUTES, SLOT_COUNT, SLOT_MINUTES, claim_slot_indexes
+
+WEEKDAY_NAMES = ['월', '화', '수', '목', '금', '토', '일']
+HEATMAP_HOURS = list(range(DAY_START_MINUTES // 60, DAY_END_MINUTES // 60))
+SLOTS_PER_HOUR = 60 // SLOT_MINUTES
+
+
+def _weekday_expr(date_column):
+    """
+    DB별 요일 식과, 그 값을 월요일=0 ~ 일요일=6 으로 바꾸는 함수
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        return func.weekday(date_column), lambda value: int(value)
+    if dialect == 'sqlite':
+        # 일요일=0
+        return cast(func.strftime('%w', date_column), Integer), lambda value: (int(value) + 6) % 7
+    # postgresql: ISO 요일 (월요일=1)
+    return extract('isodow', date_column), lambda value: int(value) - 1
+
+
+def _space_filter(query, space_column, space_id=None, category=None):
+    if space_id is not None:
+        query = query.filter(space_column == space_id)
+    if category is not None:
+        query = query.filter(space_column.in_(db.session.query(Space.id).filter(Space.category == category)))
+    return query
+
+
+def booked_slots_by_space(date_from, date_to, space_id=None, category=None):
+    query = db.session.query(SpaceDayOccupancy.space_id, func.sum(SpaceDayOccupancy.booked_slots))\
+        .filter(SpaceDayOccupancy.date >= date_from, SpaceDayOccupancy.date <= date_to)\
+        .group_by(SpaceDayOccupancy.space_id)
+    query = _space_filter(query, SpaceDayOccupancy.space_id, space_id, category)
+    return {row[0]: int(row[1] or 0) for row in query}
+
+
+def no_shows_by_space(date_from, date_to, now, space_id=None, category=None):
+    """
+    장소별 (시작 시각이 지난 확정/이용중 예약 수, 그중 체크인하지 않은 예약 수)
+    now: KST 기준 naive datetime
+    booking 과 booking_archive (보관된 지난 예약) 를 각각 집계해 더합니다.
+    """
+    totals = defaultdict(lambda: (0, 0))
+    for model in (Booking, BookingArchive):
+        started = or_(
+            model.date < now.date(),
+            and_(model.date == now.date(), model.start_time <= now.time())
+        )
+        query = db.session.query(
+            model.space_id,
+            func.count(model.id),
+            func.sum(case((model.check_in_time.is_(None), 1), else_=0))
+        ).filter(
+            model.date >= date_from,
+            model.date <= date_to,
+            model.status.in_(['확정', '이용중']),
+            started
+        ).group_by(model.space_id)
+        query = _space_filter(query, model.space_id, space_id, category)
+        for row in query:
+            started_count, no_show_count = totals[row[0]]
+            totals[row[0]] = (started_count + int(row[1]), no_show_count + int(row[2] or 0))
+    return dict(totals)
+
+
+def weekday_slot_counts(date_from, date_to, space_id=None, category=None):
+    """{(요일 0~6, 00:00 기준 슬롯 번호): 예약된 슬롯 수}"""
+    weekday, normalize = _weekday_expr(BookingSlot.date)
+    query = db.session.query(weekday, BookingSlot.slot_idx, func.count())\
+        .filter(BookingSlot.date >= date_from, BookingSlot.date <= date_to)\
+        .group_by(weekday, BookingSlot.slot_idx)
+    query = _space_filter(query, BookingSlot.space_id, space_id, category)
+    counts = defaultdict(int)
+    for row in query:
+        counts[(normalize(row[0]), int(row[1]))] += int(row[2])
+
+    # 보관된 예약은 booking_slot 행이 없으므로 (요일, 시작, 종료 시각) 별 예약 수를 세어 슬롯으로 펼칩니다.
+    # (서로 다른 시작/종료 시각 조합은 많지 않으므로 결과 행 수가 작습니다)
+    weekday, normalize = _weekday_expr(BookingArchive.date)
+    query = db.session.query(weekday, BookingArchive.start_time, BookingArchive.end_time, func.count())\
+        .filter(BookingArchive.date >= date_from, BookingArchive.date <= date_to,
+                BookingArchive.status != '취소')\
+        .group_by(weekday, BookingArchive.start_time, BookingArchive.end_time)
+    query = _space_filter(query, BookingArchive.space_id, space_id, category)
+    for row in query:
+        for slot_idx in claim_slot_indexes(row[1], row[2]):
+            counts[(normalize(row[0]), slot_idx)] += int(row[3])
+    return dict(counts)
+
+
+def _rate(numerator, denominator):
+    return round(numerator / denominator, 4) if denominator else 0.0
+
+
+def utilization_report(date_from, date_to, now, space_id=None, category=None, top_n=5):
+    days = (date_to - date_from).days + 1
+
+    spaces_query = db.session.query(Space.id, Space.name, Space.category, Space.location).order_by(Space.id)
+    spaces = _space_filter(spaces_query, Space.id, space_id, category).all()
+    booked = booked_slots_by_space(date_from, date_to, space_id, category)
+    no_shows = no_shows_by_space(date_from, date_to, now, space_id, category)
+
+    space_rows = []
+    categories = defaultdict(lambda: {"spaces": 0, "bookedSlots": 0, "startedBookings": 0, "noShows": 0})
+    for space in spaces:
+        booked_slots = booked.get(space.id, 0)
+        started_count, no_show_count = no_shows.get(space.id, (0, 0))
+        space_rows.append({
+            "spaceId": space.id,
+            "name": space.name,
+            "category": space.category,
+            "location": space.location,
+            "bookedHours": round(booked_slots * SLOT_MINUTES / 60, 1),
+            "utilization": _rate(booked_slots, days * SLOT_COUNT),
+            "startedBookings": started_count,
+            "noShows": no_show_count,
+            "noShowRate": _rate(no_show_count, started_count),
+        })
+
+        totals = categories[space.category]
+        totals["spaces"] += 1
+        totals["bookedSlots"] += booked_slots
+        totals["startedBookings"] += started_count
+        totals["noShows"] += no_show_count
+
+    category_rows = [{
+        "category": name,
+        "spaces": totals["spaces"],
+        "bookedHours": round(totals["bookedSlots"] * SLOT_MINUTES / 60, 1),
+        "utilization": _rate(totals["bookedSlots"], days * SLOT_COUNT * totals["spaces"]),
+        "startedBookings": totals["startedBookings"],
+        "noShows": totals["noShows"],
+        "noShowRate": _rate(totals["noShows"], totals["startedBookings"]),
+    } for name, totals in sorted(categories.items())]
+
+    # 요일 x 시간대 예약 시간(분)과, 같은 요일/시간대 전체 장소-시간 대비 이용률
+    hour_minutes = [[0] * len(HEATMAP_HOURS) for _ in WEEKDAY_NAMES]
+    first_hour = HEATMAP_HOURS[0]
+    for (weekday, slot_idx), count in weekday_slot_counts(date_from, date_to, space_id, category).items():
+        hour_index = slot_idx // SLOTS_PER_HOUR - first_hour
+        if 0 <= hour_index < len(HEATMAP_HOURS):
+            hour_minutes[weekday][hour_index] += count * SLOT_MINUTES
+
+    weekday_days = [0] * 7
+    for offset in range(days):
+        weekday_days[(date_from.weekday() + offset) % 7] += 1
+    hour_utilization = [[
+        _rate(minutes, weekday_days[weekday] * 60 * len(spaces))
+        for minutes in hour_minutes[weekday]
+    ] for weekday in range(7)]
+
+    peaks = sorted(
+        ((hour_utilization[weekday][i], weekday, hour) for weekday in range(7) for i, hour in enumerate(HEATMAP_HOURS)),
+        reverse=True
+    )[:top_n]
+
+    return {
+        "range": {"from": date_from.isoformat(), "to": date_to.isoformat(), "days": days},
+        "spaces": space_rows,
+        "categories": category_rows,
+        "heatmap": {
+            "weekdays": WEEKDAY_NAMES,
+            "hours": HEATMAP_HOURS,
+            "bookedMinutes": hour_minutes,
+            "utilization": hour_utilization,
+        },
+        "peakHours": [
+            {"weekday": WEEKDAY_NAMES[weekday], "hour": hour, "utilization": rate}
+            for rate, weekday, hour in peaks if rate > 0
+        ],
+    }
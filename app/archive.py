@@ -0,0 +1,86 @@
+"""
+지난 예약 보관 (hot / cold 분리)
+
+ARCHIVE_AFTER_DAYS 일보다 오래된 예약을 booking 테이블에서 booking_archive 테이블로 옮겨,
+booking 테이블과 그 인덱스(중복 예약 검사, 알림 스케줄러, 내 예약 목록)를 작게 유지합니다.
+
+- ARCHIVE_BATCH_SIZE 건씩 INSERT ... SELECT 로 복사하고 같은 트랜잭션에서 원래 행을 지운 뒤 커밋합니다.
+  (중간에 멈춰도 옮긴 배치까지는 일관되며, 다시 실행하면 이어서 옮깁니다)
+- 옮긴 예약의 booking_slot (중복 예약 검사용) 과 notification_log (알림 중복 방지용) 행은 지웁니다.
+  지난 날짜에는 더 이상 필요 없고, 둘 다 booking 에 외래 키가 있기 때문입니다.
+- space_day_occupancy 는 그대로 두므로 지난 달 예약 현황과 이용률 분석은 바뀌지 않습니다.
+
+내 예약 목록, 예약 내보내기, 이용률 분석(노쇼율, 히트맵), flask rebuild-occupancy 는 두 테이블을 함께 읽습니다.
+보관된 예약은 수정/취소/체크인할 수 없습니다.
+
+    flask archive-bookings              # ARCHIVE_AFTER_DAYS 일 이전 예약 보관
+    flask archive-bookings --dry-run    # 보관할 예약 수만 확인
+"""
+import time as timer
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import func, insert, literal, select
+
+from app import db
+from app.clock import kst_now
+from app.models import Booking, BookingArchive, BookingSlot, NotificationLog
+
+ARCHIVED_COLUMNS = [column.key for column in Booking.__table__.columns]
+
+
+def archive_column(model, column):
+    """Booking 컬럼이면 model(Booking 또는 BookingArchive)의 같은 컬럼, 아니면(Space 등) 그대로 돌려줍니다."""
+    if getattr(column, 'class_', None) is Booking:
+        return getattr(model, column.key)
+    return column
+
+
+def archive_cutoff(days=None, now=None):
+    """이 날짜 이전(미포함) 예약이 보관 대상입니다."""
+    if days is None:
+        days = current_app.config.get('ARCHIVE_AFTER_DAYS', 180)
+    return (now or kst_now()).date() - timedelta(days=days)
+
+
+def count_archivable(before):
+    return db.session.query(func.count(Booking.id)).filter(Booking.date < before).scalar()
+
+
+def archive_bookings(before, batch_size=None, progress=print):
+    """
+    before 날짜 이전(미포함) 예약을 booking_archive 로 옮깁니다.
+    테이블별로 옮기거나 지운 행 수를 반환합니다.
+    """
+    if before > kst_now().date():
+        # 앞으로의 예약은 중복 예약 검사에 필요합니다.
+        raise ValueError("오늘 이후 날짜의 예약은 보관할 수 없습니다.")
+    batch_size = batch_size or current_app.config.get('ARCHIVE_BATCH_SIZE', 1000)
+
+    counts = {'booking_archive': 0, 'booking_slot': 0, 'notification_log': 0}
+    archived_at = datetime.utcnow()
+    source_columns = [Booking.__table__.c[name] for name in ARCHIVED_COLUMNS]
+    started = timer.perf_counter()
+    while True:
+        booking_ids = [row[0] for row in db.session.query(Booking.id)
+                       .filter(Booking.date < before)
+                       .order_by(Booking.date, Booking.start_time)
+                       .limit(batch_size)]
+        if not booking_ids:
+            break
+
+        source = select(*source_columns, literal(archived_at, db.DateTime))\
+            .where(Booking.id.in_(booking_ids))
+        db.session.execute(
+            insert(BookingArchive.__table__).from_select(ARCHIVED_COLUMNS + ['archived_at'], source)
+        )
+        for model in (BookingSlot, NotificationLog):
+            counts[model.__tablename__] += db.session.query(model)\
+                .filter(model.booking_id.in_(booking_ids)).delete(synchronize_session=False)
+        db.session.query(Booking).filter(Booking.id.in_(booking_ids)).delete(synchronize_session=False)
+        db.session.commit()
+
+        counts['booking_archive'] += len(booking_ids)
+        progress(f"[INFO] 예약 {counts['booking_archive']}건 보관 ({timer.perf_counter() - started:.1f}s)")
+
+    return counts
@@ -0,0 +1,100 @@
+"""
+booking_slot 테이블 관리 (슬롯 점유 기반 중복 예약 감지)
+
+예약이 걸치는 10분 슬롯마다 (space_id, date, slot_idx) 행을 넣습니다.
+같은 슬롯을 동시에 점유하려는 두 번째 트랜잭션은 행 락 대기 없이 고유 키 위반(IntegrityError)으로 실패하고,
+시간이 겹치지 않는 예약들은 같은 장소라도 락 없이 중복 검사를 통과합니다.
+다만 커밋 직전의 space_day_occupancy 요약 행 갱신(app/occupancy.py)은 행 락을 잡으므로,
+같은 (장소, 날짜)의 예약은 그 갱신부터 커밋까지 한 건씩 직렬화됩니다.
+
+두 전략 모두 예약 생성 시 슬롯을 기록하므로, 설정을 바꿔도 테이블은 항상 일관된 상태를 유지합니다.
+"""
+from sqlalchemy import insert
+
+from app import db
+from app.models import Booking, BookingSlot
+from app.slots import claim_slot_indexes
+
+
+def _slot_rows(booking_id, space_id, date_obj, start_time, end_time):
+    return [
+        {'space_id': space_id, 'date': date_obj, 'slot_idx': slot_idx, 'booking_id': booking_id}
+        for slot_idx in claim_slot_indexes(start_time, end_time)
+    ]
+
+
+def claim_booking_slots(booking):
+    """
+    예약의 슬롯들을 한 번의 INSERT 로 점유합니다. 커밋은 호출한 쪽에서 합니다.
+    이미 점유된 슬롯이 있으면 IntegrityError 가 발생합니다.
+    """
+    if booking.id is None:
+        db.session.flush()
+    rows = _slot_rows(booking.id, booking.space_id, booking.date, booking.start_time, booking.end_time)
+    if rows:
+        db.session.execute(insert(BookingSlot.__table__), rows)
+
+
+def release_booking_slots(booking):
+    """예약 취소 시 점유했던 슬롯을 반환합니다."""
+    db.session.query(BookingSlot).filter(BookingSlot.booking_id == booking.id)\
+        .delete(synchronize_session=False)
+
+
+def find_conflicting_booking(space_id, date_obj, start_time, end_time):
+    """고유 키 위반 후, 오류 메시지에 보여줄 기존 예약을 찾습니다."""
+    slot_indexes = claim_slot_indexes(start_time, end_time)
+    return db.session.query(Booking).join(BookingSlot, BookingSlot.booking_id == Booking.id).filter(
+        BookingSlot.space_id == space_id,
+        BookingSlot.date == date_obj,
+        BookingSlot.slot_idx >= slot_indexes.start,
+        BookingSlot.slot_idx < slot_indexes.stop
+    ).first()
+
+
+def _insert_ignore():
+    table = BookingSlot.__table__
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        return insert(table).prefix_with('IGNORE')
+    if dialect == 'sqlite':
+        return insert(table).prefix_with('OR IGNORE')
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    return pg_insert(table).on_conflict_do_nothing()
+
+
+def rebuild_booking_slots(batch_size=2000):
+    """
+    취소되지 않은 모든 예약으로부터 booking_slot 테이블을 다시 만듭니다.
+    (기존 예약 데이터에 슬롯을 채우거나 복구할 때 사용)
+
+    과거 데이터에 이미 겹치는 예약이 있으면 먼저 만들어진 예약이 슬롯을 차지합니다.
+    (생성된 슬롯 수, 겹쳐서 건너뛴 슬롯 수)를 반환합니다.
+    """
+    db.session.query(BookingSlot).delete(synchronize_session=False)
+
+    created = 0
+    skipped = 0
+    last_id = 0
+    while True:
+        # id 기준 키셋 페이지 단위로 읽고 바로 씁니다.
+        bookings = db.session.query(
+            Booking.id, Booking.space_id, Booking.date, Booking.start_time, Booking.end_time
+        ).filter(Booking.status != '취소', Booking.id > last_id)\
+            .order_by(Booking.id).limit(batch_size).all()
+        if not bookings:
+            break
+
+        rows = []
+        for booking_id, space_id, date_obj, start_time, end_time in bookings:
+            rows.extend(_slot_rows(booking_id, space_id, date_obj, start_time, end_time))
+        if rows:
+            result = db.session.execute(_insert_ignore(), rows)
+            inserted = result.rowcount if result.rowcount is not None and result.rowcount >= 0 else len(rows)
+            created += inserted
+            skipped += len(rows) - inserted
+
+        last_id = bookings[-1][0]
+        db.session.commit()
+
+    return created, skipped
@@ -0,0 +1,159 @@
+"""
+예약 현황 캐시
+
+월별/일별 현황, 시간 우선 조회 결과는 해당 (장소, 날짜)의 예약에만 의존하므로 결과를 캐시합니다.
+캐시 키에는 호출한 쪽이 DB 에서 읽은 변경 버전(space_day_occupancy.version, 장소 목록 버전)이 들어갑니다.
+버전은 예약 쓰기와 같은 트랜잭션에서 올라가므로, 어느 프로세스에서 커밋된 변경이든 다음 조회부터
+새 키를 쓰게 되어 이전 결과가 반환되지 않습니다. (쓰기 경로에서 따로 무효화하지 않습니다)
+같은 버전 값으로 ETag 를 만들면 캐시된 본문이 항상 ETag 와 일치합니다.
+
+설정 (config.Config)
+    AVAILABILITY_CACHE_TYPE          'memory' (기본), 'redis', 'null' (캐시 사용 안 함)
+    AVAILABILITY_CACHE_REDIS_URL     redis 백엔드 사용 시 접속 URL
+    AVAILABILITY_CACHE_TTL           캐시 유지 시간(초)
+    AVAILABILITY_CACHE_MAX_ENTRIES   memory 백엔드의 최대 항목 수 (LRU)
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class NullCacheBackend:
+    """캐시를 사용하지 않습니다."""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def __len__(self):
+        return 0
+
+
+class MemoryCacheBackend(NullCacheBackend):
+    """프로세스 내 LRU + TTL 캐시"""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    Redis 호환 서버를 사용하는 캐시. 여러 웹 프로세스가 결과를 공유합니다.
+    (redis 패키지가 필요합니다: pip install redis)
+    """
+
+    def __init__(self, url, prefix='decom:availability:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("AVAILABILITY_CACHE_TYPE='redis' 를 사용하려면 redis 패키지를 설치해야 합니다.")
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key):
+        raw = self._client.get(self._prefix + key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    def set(self, key, value, ttl):
+        self._client.set(self._prefix + key, json.dumps(value), ex=max(int(ttl), 1))
+
+    def delete(self, key):
+        self._client.delete(self._prefix + key)
+
+    def __len__(self):
+        # 다른 용도와 같은 DB 를 쓸 수 있으므로 이 캐시의 키만 셉니다. (SCAN 은 DB 전체 키를 훑으므로 통계 조회에만 사용)
+        return sum(1 for _ in self._client.scan_iter(match=self._prefix + '*', count=1000))
+
+
+class AvailabilityCache:
+
+    def __init__(self, app=None):
+        self.backend = NullCacheBackend()
+        self.ttl = 60
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        cache_type = app.config.get('AVAILABILITY_CACHE_TYPE', 'memory')
+        self.ttl = app.config.get('AVAILABILITY_CACHE_TTL', 60)
+
+        if cache_type == 'redis':
+            self.backend = RedisCacheBackend(app.config['AVAILABILITY_CACHE_REDIS_URL'])
+        elif cache_type == 'memory':
+            self.backend = MemoryCacheBackend(app.config.get('AVAILABILITY_CACHE_MAX_ENTRIES', 4096))
+        else:
+            self.backend = NullCacheBackend()
+
+    def get_or_compute(self, name, versions, compute):
+        """
+        name: 결과를 구분하는 키 (파라미터 포함)
+        versions: 결과가 의존하는 데이터의 DB 변경 버전 목록 (결과를 계산할 때와 같은 DB 에서 먼저 읽은 값)
+        compute: 캐시가 없을 때 결과(JSON 직렬화 가능한 값)를 계산하는 함수
+        """
+        key = name + '@' + '.'.join(str(v) for v in versions)
+
+        value = self.backend.get(key)
+        if value is not None:
+            with self._stats_lock:
+                self.hits += 1
+            return value
+
+        with self._stats_lock:
+            self.misses += 1
+        value = compute()
+        self.backend.set(key, value, self.ttl)
+        return value
+
+    def stats(self):
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend),
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+        }
+
+
+availability_cache = AvailabilityCache()
@@ -0,0 +1,19 @@
+"""
+한국 시간(KST)
+
+DB 의 날짜/시간은 KST 기준 naive 값입니다.
+pytz 는 처음 사용할 때 불러옵니다. (앱 시작 시간 단축)
+"""
+import functools
+from datetime import datetime
+
+
+@functools.lru_cache(maxsize=None)
+def kst():
+    import pytz
+    return pytz.timezone('Asia/Seoul')
+
+
+def kst_now():
+    """현재 KST 시각 (tzinfo 포함)"""
+    return datetime.now(kst())
@@ -0,0 +1,169 @@
+"""
+Flask CLI 명령어 (flask <명령어> 로 실행)
+
+    export FLASK_APP=run.py
+    flask rebuild-occupancy
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+
+import click
+from flask.cli import with_appcontext
+
+from app.occupancy import rebuild_occupancy
+from app.booking_slots import rebuild_booking_slots
+from app.outbox import run_worker
+from app.export import export_bookings, EXPORT_FORMATS
+from app.datagen import generate_dataset, clear_generated
+from app.clock import kst_now
+from app.archive import archive_bookings, archive_cutoff, count_archivable
+
+
+def _parse_date(value):
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise click.BadParameter(f"날짜 형식이 잘못되었습니다 (YYYY-MM-DD): {value}")
+
+
+@click.command('init-db')
+@with_appcontext
+def init_db_command():
+    """
+    빈 DB 에 현재 모델로 모든 테이블을 만들고, 마이그레이션 버전을 최신(head)으로 기록합니다.
+    SCHEMA_AUTO_CREATE=false 로 운영할 때 처음 한 번 실행합니다. 이후 스키마 변경은 flask db upgrade 로 반영합니다.
+    """
+    from flask_migrate import stamp
+    from app import db
+
+    db.create_all()
+    stamp()
+    print("[SUCCESS] 테이블을 만들고 마이그레이션 버전을 head 로 기록했습니다.")
+
+
+@click.command('rebuild-occupancy')
+@click.option('--space-id', type=int, default=None, help='특정 장소만 다시 계산')
+@click.option('--from', 'date_from', default=None, help='시작 날짜 (YYYY-MM-DD, 포함)')
+@click.option('--to', 'date_to', default=None, help='종료 날짜 (YYYY-MM-DD, 포함)')
+@with_appcontext
+def rebuild_occupancy_command(space_id, date_from, date_to):
+    """Booking, BookingArchive 테이블로부터 space_day_occupancy 요약 행을 다시 계산합니다. (서비스 중 실행 가능)"""
+    created = rebuild_occupancy(space_id=space_id, date_from=_parse_date(date_from), date_to=_parse_date(date_to))
+    print(f"[SUCCESS] 점유 요약 {created}건을 다시 생성했습니다.")
+
+
+@click.command('rebuild-booking-slots')
+@with_appcontext
+def rebuild_booking_slots_command():
+    """취소되지 않은 예약으로부터 booking_slot (슬롯 점유) 테이블을 다시 만듭니다."""
+    created, skipped = rebuild_booking_slots()
+    print(f"[SUCCESS] 슬롯 점유 {created}건을 다시 생성했습니다.")
+    if skipped:
+        print(f"[WARNING] 기존 예약끼리 겹치는 슬롯 {skipped}건은 먼저 생성된 예약에 배정했습니다.")
+
+
+@click.command('outbox-worker')
+@click.option('--batch-size', type=int, default=None, help='한 번에 선점할 행 수 (기본: OUTBOX_BATCH_SIZE)')
+@click.option('--poll-interval', type=float, default=None, help='대기 행이 없을 때 확인 간격(초) (기본: OUTBOX_POLL_INTERVAL)')
+@click.option('--worker-id', default=None, help='선점 기록에 남길 워커 이름 (기본: 호스트명:PID)')
+@click.option('--once', is_flag=True, help='대기 중인 메일을 모두 처리한 뒤 종료')
+@with_appcontext
+def outbox_worker_command(batch_size, poll_interval, worker_id, once):
+    """outbox 테이블의 메일을 발송하는 워커를 실행합니다. 여러 프로세스를 동시에 띄워도 됩니다."""
+    try:
+        processed = run_worker(worker_id=worker_id, batch_size=batch_size, poll_interval=poll_interval, once=once)
+        print(f"[SUCCESS] 아웃박스 {processed}건을 처리했습니다.")
+    except KeyboardInterrupt:
+        print("[INFO] 아웃박스 워커를 종료합니다.")
+
+
+@click.command('export-bookings')
+@click.option('--from', 'date_from', required=True, help='시작 날짜 (YYYY-MM-DD, 포함)')
+@click.option('--to', 'date_to', required=True, help='종료 날짜 (YYYY-MM-DD, 포함)')
+@click.option('--format', 'fmt', type=click.Choice(list(EXPORT_FORMATS)), default='ndjson')
+@click.option('--status', default=None, help='상태 필터 (쉼표로 여러 개)')
+@click.option('--output', '-o', type=click.Path(dir_okay=False, writable=True), default=None,
+              help='저장할 파일 (기본: 표준 출력)')
+@with_appcontext
+def export_bookings_command(date_from, date_to, fmt, status, output):
+    """기간 내 예약을 NDJSON 또는 CSV 로 내보냅니다. (테이블 크기와 상관없이 일정한 메모리 사용)"""
+    statuses = status.split(',') if status else None
+    chunks = export_bookings(fmt, _parse_date(date_from), _parse_date(date_to), statuses, bom=output is not None)
+    if output is None:
+        for chunk in chunks:
+            click.echo(chunk, nl=False)
+        return
+
+    with open(output, 'w', encoding='utf-8', newline='') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    print(f"[SUCCESS] 예약을 {output} 파일로 내보냈습니다.", file=sys.stderr)
+
+
+@click.command('generate-data')
+@click.option('--users', type=int, default=1000, show_default=True, help='생성할 사용자 수')
+@click.option('--spaces', type=int, default=60, show_default=True, help='생성할 장소 수')
+@click.option('--from', 'date_from', default=None, help='첫 예약 날짜 (YYYY-MM-DD, 기본: 오늘 - 180일)')
+@click.option('--days', type=int, default=365, show_default=True, help='예약을 만들 일 수')
+@click.option('--now', 'now', default=None,
+              help='예약 상태(지난 예약/앞으로의 예약)를 나누는 기준 시각 (YYYY-MM-DDTHH:MM, 기본: 기간의 가운데)')
+@click.option('--density', type=float, default=1.0, show_default=True, help='예약 밀도 배율 (장소/날짜당 예약 수)')
+@click.option('--seed', type=int, default=42, show_default=True, help='난수 시드 (같은 옵션이면 같은 데이터)')
+@click.option('--batch-size', type=int, default=5000, show_default=True, help='한 번에 INSERT 할 예약 수')
+@click.option('--clear', is_flag=True, help='이전에 생성한 데이터를 먼저 지움')
+@with_appcontext
+def generate_data_command(users, spaces, date_from, days, now, density, seed, batch_size, clear):
+    """성능 테스트용 사용자/장소/예약 데이터를 대량으로 생성합니다. (운영 DB 에서 실행하지 마세요)"""
+    if clear:
+        deleted = clear_generated()
+        print(f"[INFO] 이전에 생성한 데이터를 지웠습니다: {deleted}")
+
+    if date_from is None:
+        date_from = (kst_now().date() - timedelta(days=180)).isoformat()
+    try:
+        now = datetime.strptime(now, '%Y-%m-%dT%H:%M') if now else None
+    except ValueError:
+        raise click.BadParameter(f"시각 형식이 잘못되었습니다 (YYYY-MM-DDTHH:MM): {now}")
+
+    started = time.perf_counter()
+    counts = generate_dataset(
+        users=users, spaces=spaces, date_from=_parse_date(date_from), days=days, now=now,
+        seed=seed, density=density, batch_size=batch_size
+    )
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print(f"[SUCCESS] {total}행 생성 ({elapsed:.1f}s, 초당 {total / elapsed:.0f}행): {counts}")
+
+
+@click.command('archive-bookings')
+@click.option('--before', default=None, help='이 날짜 이전(미포함) 예약을 보관 (YYYY-MM-DD, 기본: 오늘 - ARCHIVE_AFTER_DAYS)')
+@click.option('--days', type=int, default=None, help='오늘로부터 며칠 이전 예약을 보관할지 (기본: ARCHIVE_AFTER_DAYS)')
+@click.option('--batch-size', type=int, default=None, help='한 트랜잭션에서 옮길 예약 수 (기본: ARCHIVE_BATCH_SIZE)')
+@click.option('--dry-run', is_flag=True, help='보관할 예약 수만 출력')
+@with_appcontext
+def archive_bookings_command(before, days, batch_size, dry_run):
+    """지난 예약을 booking 테이블에서 booking_archive 테이블로 옮깁니다. (cron 등으로 주기 실행)"""
+    before = _parse_date(before) or archive_cutoff(days)
+    if dry_run:
+        print(f"[INFO] {before} 이전 예약 {count_archivable(before)}건을 보관할 수 있습니다.")
+        return
+
+    started = time.perf_counter()
+    try:
+        counts = archive_bookings(before, batch_size=batch_size)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    print(f"[SUCCESS] {before} 이전 예약을 보관했습니다 ({time.perf_counter() - started:.1f}s): {counts}")
+
+
+def register_commands(app):
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(rebuild_occupancy_command)
+    app.cli.add_command(rebuild_booking_slots_command)
+    app.cli.add_command(outbox_worker_command)
+    app.cli.add_command(export_bookings_command)
+    app.cli.add_command(generate_data_command)
+    app.cli.add_command(archive_bookings_command)
@@ -0,0 +1,282 @@
+"""
+성능 테스트용 대량 데이터 생성기 (flask generate-data)
+
+사용자, 장소, 서로 겹치지 않는 예약을 만들고 booking_slot / space_day_occupancy 파생 테이블도 함께 채웁니다.
+  - 시간대 분포: 스터디룸/연습실은 오후, 체육 시설은 저녁에 예약이 몰립니다.
+  - 요일 분포: 스터디룸은 평일, 체육 시설은 주말에 많습니다.
+  - 상태: now 이전 예약은 이용중(체크인)/확정(노쇼)/취소/확정대기, 이후 예약은 확정/확정대기/취소
+
+같은 seed 와 같은 옵션(기준 시각 포함)이면 항상 같은 데이터가 만들어집니다.
+ORM 객체를 만들지 않고 batch_size 행씩 executemany INSERT 로 넣으므로 수백만 행도 몇 분 안에 생성됩니다.
+
+생성한 사용자 ID 는 'G' 로 시작하고(실제 학번은 숫자 8자리), 장소 이름은 '[GEN]' 으로 시작합니다.
+clear_generated() (--clear) 로 생성한 데이터만 지울 수 있습니다.
+"""
+import random
+import time as timer
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, or_, text
+
+from app import db
+from app.models import Booking, BookingArchive, BookingSlot, NotificationLog, Outbox, Space, SpaceDayOccupancy, User
+from app.occupancy import _summary_values
+from app.passwords import password_hasher
+from app.slots import DAY_END_MINUTES, DAY_START_MINUTES, DayOccupancy, booking_mask, claim_slot_indexes
+from app.versions import bump_data_version, SPACE_CATALOG
+
+USER_ID_PREFIX = 'G'
+SPACE_NAME_PREFIX = '[GEN]'
+DEFAULT_PASSWORD = 'password'
+
+STEP_MINUTES = 30
+
+# 07시 ~ 21시 시작 시각별 예약 확률 가중치
+HOUR_WEIGHTS = {
+    'study': [0.04, 0.08, 0.2, 0.3, 0.3, 0.25, 0.4, 0.45, 0.45, 0.45, 0.4, 0.35, 0.4, 0.3, 0.15],
+    'sports': [0.08, 0.08, 0.08, 0.12, 0.12, 0.15, 0.12, 0.12, 0.18, 0.3, 0.45, 0.55, 0.55, 0.4, 0.2],
+}
+# 월 ~ 일
+WEEKDAY_FACTORS = {
+    'study': [1.0, 1.0, 1.0, 1.0, 0.85, 0.45, 0.5],
+    'sports': [0.7, 0.7, 0.7, 0.75, 0.9, 1.0, 0.95],
+}
+DURATIONS = {
+    'study': [60, 60, 90, 120, 120, 180],
+    'sports': [60, 60, 90, 120],
+}
+
+# (서브카테고리, 카테고리, 수용 인원, 시간대 분포)
+SPACE_TEMPLATES = [
+    ('인문 스터디룸', '스터디룸', 6, 'study'),
+    ('해동 스터디룸', '스터디룸', 4, 'study'),
+    ('학생라운지 스터디룸', '스터디룸', 8, 'study'),
+    ('가무연습실', '가무연습실', 10, 'study'),
+    ('운동장', '운동장', 30, 'sports'),
+    ('테니스 코트', '테니스 코트', 4, 'sports'),
+    ('농구장', '농구장', 10, 'sports'),
+    ('풋살파크', '풋살파크', 12, 'sports'),
+    ('피클볼 코트', '피클볼 코트', 4, 'sports'),
+]
+
+ORGANIZATION_TYPES = ['개인', '개인', '동아리', '학생회', '학과']
+EVENT_NAMES = ['스터디', '팀 프로젝트 회의', '정기 모임', '연습', '친선 경기', '동아리 활동', '세미나']
+
+# (상태, 가중치)
+PAST_STATUSES = [('이용중', 65), ('확정', 12), ('취소', 15), ('확정대기', 8)]
+FUTURE_STATUSES = [('확정', 55), ('확정대기', 30), ('취소', 15)]
+
+
+def _pick(rng, weighted):
+    total = sum(weight for _, weight in weighted)
+    value = rng.uniform(0, total)
+    for item, weight in weighted:
+        value -= weight
+        if value <= 0:
+            return item
+    return weighted[-1][0]
+
+
+def _minutes_to_time(minutes):
+    return datetime.min.replace(hour=minutes // 60, minute=minutes % 60).time()
+
+
+class _BatchWriter:
+    """테이블별 행을 모아 batch_size 마다 INSERT 합니다. (외래 키 순서대로)"""
+
+    def __init__(self, batch_size):
+        self.batch_size = batch_size
+        self.tables = [Booking.__table__, BookingSlot.__table__, SpaceDayOccupancy.__table__]
+        self.rows = {table: [] for table in self.tables}
+        self.counts = {table.name: 0 for table in self.tables}
+
+    def add(self, table, row):
+        self.rows[table].append(row)
+
+    def maybe_flush(self):
+        if len(self.rows[Booking.__table__]) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        for table in self.tables:
+            rows = self.rows[table]
+            if rows:
+                db.session.execute(insert(table), rows)
+                self.counts[table.name] += len(rows)
+                self.rows[table] = []
+        db.session.commit()
+
+
+def _insert_users(count, batch_size):
+    # bcrypt 를 사용자마다 계산하지 않고 같은 해시를 씁니다.
+    pw_hash = password_hasher.hash(DEFAULT_PASSWORD)
+    user_ids = [f"{USER_ID_PREFIX}{i:07d}" for i in range(1, count + 1)]
+    for start in range(0, count, batch_size):
+        db.session.execute(insert(User.__table__), [
+            {'id': user_id, 'username': f"사용자{user_id[1:]}", 'password': pw_hash}
+            for user_id in user_ids[start:start + batch_size]
+        ])
+    db.session.commit()
+    return user_ids
+
+
+def _insert_spaces(rng, count):
+    rows = []
+    for i in range(1, count + 1):
+        sub_category, category, capacity, _ = SPACE_TEMPLATES[(i - 1) % len(SPACE_TEMPLATES)]
+        rows.append({
+            'name': f"{SPACE_NAME_PREFIX} {sub_category} {i:04d}",
+            'category': category,
+            'subCategory': sub_category,
+            'location': f"GEN-{i:04d}",
+            'capacity': capacity,
+            'latitude': 37.45 + rng.uniform(-0.002, 0.002),
+            'longitude': 126.654 + rng.uniform(-0.003, 0.003),
+        })
+    db.session.execute(insert(Space.__table__), rows)
+    bump_data_version(SPACE_CATALOG)
+    db.session.commit()
+
+    profiles = {template[0]: template[3] for template in SPACE_TEMPLATES}
+    spaces = db.session.query(Space.id, Space.subCategory, Space.capacity)\
+        .filter(Space.name.like(f"{SPACE_NAME_PREFIX} %")).order_by(Space.id).all()
+    return [(space_id, profiles.get(sub_category, 'study'), capacity) for space_id, sub_category, capacity in spaces]
+
+
+def _day_bookings(rng, profile, weekday, density):
+    """하루치 (시작 분, 종료 분) 목록. 앞 예약이 끝난 뒤에만 다음 예약을 시작하므로 겹치지 않습니다."""
+    hour_weights = HOUR_WEIGHTS[profile]
+    factor = WEEKDAY_FACTORS[profile][weekday] * density
+    durations = DURATIONS[profile]
+
+    bookings = []
+    minute = DAY_START_MINUTES
+    while minute < DAY_END_MINUTES:
+        if rng.random() < hour_weights[minute // 60 - DAY_START_MINUTES // 60] * factor:
+            end = min(minute + rng.choice(durations), DAY_END_MINUTES)
+            bookings.append((minute, end))
+            minute = end
+        else:
+            minute += STEP_MINUTES
+    return bookings
+
+
+def _booking_status(rng, booking_date, start, now):
+    start_at = datetime.combine(booking_date, _minutes_to_time(start))
+    if start_at > now:
+        return _pick(rng, FUTURE_STATUSES), None
+
+    status = _pick(rng, PAST_STATUSES)
+    if status == '이용중':
+        # 체크인 가능 시간(시작 15분 전 ~ 시작 후) 안에서 체크인
+        return status, start_at + timedelta(minutes=rng.randint(-15, 10))
+    return status, None
+
+
+def _next_booking_id():
+    return (db.session.query(func.max(Booking.id)).scalar() or 0) + 1
+
+
+def _reset_sequence():
+    if db.session.get_bind().dialect.name == 'postgresql':
+        db.session.execute(text(
+            "SELECT setval(pg_get_serial_sequence('booking', 'id'), (SELECT MAX(id) FROM booking))"
+        ))
+        db.session.commit()
+
+
+def generate_dataset(users=1000, spaces=60, date_from=None, days=365, now=None, seed=42,
+                     density=1.0, batch_size=5000, progress=print):
+    """
+    대량 데이터를 만들고 테이블별 생성 행 수를 반환합니다.
+    now: 예약 상태를 정하는 기준 시각 (KST naive, 기본: date_from + days/2)
+    """
+    rng = random.Random(seed)
+    if now is None:
+        now = datetime.combine(date_from + timedelta(days=days // 2), _minutes_to_time(12 * 60))
+
+    started = timer.perf_counter()
+    user_ids = _insert_users(users, batch_size)
+    space_rows = _insert_spaces(rng, spaces)
+    progress(f"[INFO] 사용자 {len(user_ids)}명, 장소 {len(space_rows)}곳 생성")
+
+    writer = _BatchWriter(batch_size)
+    booking_id = _next_booking_id()
+    for offset in range(days):
+        booking_date = date_from + timedelta(days=offset)
+        weekday = booking_date.weekday()
+        for space_id, profile, capacity in space_rows:
+            occupancy = DayOccupancy()
+            for start, end in _day_bookings(rng, profile, weekday, density):
+                start_time, end_time = _minutes_to_time(start), _minutes_to_time(end)
+                status, check_in_time = _booking_status(rng, booking_date, start, now)
+                user_id = rng.choice(user_ids)
+                writer.add(Booking.__table__, {
+                    'id': booking_id,
+                    'user_id': user_id,
+                    'space_id': space_id,
+                    'date': booking_date,
+                    'start_time': start_time,
+                    'end_time': end_time,
+                    'organizationType': rng.choice(ORGANIZATION_TYPES),
+                    'organizationName': f"단체 {rng.randint(1, 500)}",
+                    'phone': f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+                    'email': f"{user_id.lower()}@example.com",
+                    'event_name': rng.choice(EVENT_NAMES),
+                    'num_people': rng.randint(1, capacity),
+                    'ac_use': rng.choice(['yes', 'no']),
+                    'status': status,
+                    'cancel_reason': '일정 변경' if status == '취소' else None,
+                    'check_in_time': check_in_time,
+                })
+                if status != '취소':
+                    for slot_idx in claim_slot_indexes(start_time, end_time):
+                        writer.add(BookingSlot.__table__, {
+                            'space_id': space_id, 'date': booking_date, 'slot_idx': slot_idx, 'booking_id': booking_id
+                        })
+                    occupancy.mask |= booking_mask(start_time, end_time)
+                booking_id += 1
+
+            if occupancy.mask:
+                values = _summary_values(occupancy)
+                values.update(space_id=space_id, date=booking_date, version=1)
+                writer.add(SpaceDayOccupancy.__table__, values)
+            writer.maybe_flush()
+
+        if (offset + 1) % 30 == 0:
+            progress(f"[INFO] {offset + 1}/{days}일, 예약 {writer.counts['booking'] + len(writer.rows[Booking.__table__])}건 "
+                     f"({timer.perf_counter() - started:.0f}s)")
+
+    writer.flush()
+    _reset_sequence()
+
+    counts = {'user': len(user_ids), 'space': len(space_rows)}
+    counts.update(writer.counts)
+    return counts
+
+
+def clear_generated():
+    """generate_dataset() 이 만든 사용자/장소와 그 예약, 파생 테이블 행을 지웁니다."""
+    space_ids = db.session.query(Space.id).filter(Space.name.like(f"{SPACE_NAME_PREFIX} %"))
+    user_ids = db.session.query(User.id).filter(User.id.like(f"{USER_ID_PREFIX}%"))
+    generated_booking = or_(Booking.space_id.in_(space_ids), Booking.user_id.in_(user_ids))
+    generated_archive = or_(BookingArchive.space_id.in_(space_ids), BookingArchive.user_id.in_(user_ids))
+    booking_ids = db.session.query(Booking.id).filter(generated_booking)
+
+    deleted = {}
+    for model, condition in (
+        (BookingSlot, BookingSlot.booking_id.in_(booking_ids)),
+        (NotificationLog, NotificationLog.booking_id.in_(booking_ids)),
+        (Outbox, Outbox.booking_id.in_(booking_ids)),
+        (SpaceDayOccupancy, SpaceDayOccupancy.space_id.in_(space_ids)),
+        (Booking, generated_booking),
+        (BookingArchive, generated_archive),
+        (Space, Space.name.like(f"{SPACE_NAME_PREFIX} %")),
+        (User, User.id.like(f"{USER_ID_PREFIX}%")),
+    ):
+        deleted[model.__tablename__] = db.session.query(model).filter(condition).delete(synchronize_session=False)
+
+    if deleted['space']:
+        bump_data_version(SPACE_CATALOG)
+    db.session.commit()
+    return deleted
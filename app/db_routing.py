@@ -0,0 +1,83 @@
+"""
+읽기 전용 복제본(replica) 라우팅과 연결 풀 상태
+
+DATABASE_REPLICA_URI 를 설정하면 SQLALCHEMY_BINDS['replica'] 로 복제본 엔진을 만들고,
+@use_replica 를 붙인 조회 API 의 SELECT 문은 복제본으로 보냅니다.
+다음 경우에는 항상 주 DB 를 사용합니다.
+  - flush (INSERT / UPDATE / DELETE)
+  - SELECT ... FOR UPDATE (with_for_update)
+  - session.execute() 로 실행하는 SELECT 가 아닌 문장
+복제본을 설정하지 않으면 모든 쿼리가 주 DB 로 갑니다.
+
+복제 지연이 있으면 방금 만든 예약이 조회 API 에 복제 지연만큼 늦게 보일 수 있습니다.
+예약 현황 캐시 키와 ETag 는 본문과 같은 복제본에서, 본문보다 먼저 읽은 변경 버전으로 만듭니다.
+(app/routes/space.py) 그래서 지연된 복제본이 계산한 본문은 이전 버전 키에만 저장되고,
+복제본이 따라잡으면 새 버전 키로 다시 계산하므로 오래된 본문이 새 ETag 로 나가지 않습니다.
+"""
+import functools
+
+from flask import g, has_app_context
+from flask_sqlalchemy.session import Session
+
+REPLICA_BIND = 'replica'
+
+
+class RoutingSession(Session):
+    """@use_replica 요청 안에서는 읽기 쿼리를 복제본 엔진으로 보내는 세션"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and _replica_requested() and _is_plain_select(clause):
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _replica_requested():
+    return has_app_context() and g.get('db_use_replica', False)
+
+
+def _is_plain_select(clause):
+    if clause is None:
+        # 지연 로딩 등 clause 없이 호출되는 경우
+        return True
+    return bool(getattr(clause, 'is_select', False)) and getattr(clause, '_for_update_arg', None) is None
+
+
+def use_replica(view):
+    """조회 전용 라우트의 읽기 쿼리를 복제본으로 보냅니다."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        g.db_use_replica = True
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def pool_stats(engine):
+    """연결 풀 사용 현황 (QueuePool 이 아니면 풀 종류와 상태 문자열만)"""
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__, "status": pool.status()}
+    if not hasattr(pool, 'checkedout'):
+        return stats
+
+    size = pool.size()
+    max_overflow = max(pool._max_overflow, 0)
+    checked_out = pool.checkedout()
+    capacity = size + max_overflow
+    stats.update({
+        "size": size,
+        "maxOverflow": pool._max_overflow,
+        "checkedIn": pool.checkedin(),
+        "checkedOut": checked_out,
+        "overflow": max(pool.overflow(), 0),
+        # max_overflow 가 음수(무제한)이면 size 기준
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+    })
+    return stats
+
+
+def all_pool_stats(db):
+    return {
+        'primary' if key is None else key: pool_stats(engine)
+        for key, engine in db.engines.items()
+    }
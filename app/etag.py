@@ -0,0 +1,28 @@
+"""
+ETag / If-None-Match 처리
+
+응답 본문을 만들기 전에 변경 버전만으로 ETag 를 계산하고, 클라이언트가 보낸
+If-None-Match 와 같으면 본문 없이 304 를 반환합니다.
+"""
+from flask import request, make_response
+
+
+def make_etag(*parts):
+    return '-'.join(str(part) for part in parts)
+
+
+def not_modified(etag):
+    """
+    If-None-Match 가 etag 와 일치하면 304 응답을, 아니면 None 을 반환합니다.
+    """
+    if not request.if_none_match.contains(etag):
+        return None
+    response = make_response('', 304)
+    return set_etag(response, etag)
+
+
+def set_etag(response, etag):
+    response.set_etag(etag)
+    # 캐시해 두되 매번 서버에 재검증하도록 합니다.
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
@@ -0,0 +1,90 @@
+"""
+체크인 위치 확인 (지오펜스)
+
+체크인 반경(수십 m)에서는 타원체 측지선 계산(geopy geodesic) 대신, 장소 위도에서의 지구 곡률 반경으로
+위경도 차이를 미터 단위 평면 좌표로 바꾸어 거리를 구해도 오차가 수 cm 이내입니다.
+장소별 환산 계수는 장소 목록 버전마다 한 번만 계산해 두고, 사용자 위치는 사각형 범위로 먼저 걸러낸 뒤 거리를 계산합니다.
+"""
+import math
+import threading
+
+# WGS84 타원체
+WGS84_A = 6378137.0
+WGS84_E2 = 6.69437999014e-3
+# 사각형 범위 밖(먼 거리)의 안내용 거리 계산에 쓰는 평균 반지름
+EARTH_MEAN_RADIUS = 6371008.8
+
+
+class SpaceFence:
+    """장소 좌표와 그 위도에서의 1도당 미터 환산 계수"""
+    __slots__ = ('latitude', 'longitude', 'meters_per_deg_lat', 'meters_per_deg_lng')
+
+    def __init__(self, latitude, longitude):
+        self.latitude = latitude
+        self.longitude = longitude
+
+        phi = math.radians(latitude)
+        w = 1 - WGS84_E2 * math.sin(phi) ** 2
+        # 자오선 곡률 반경(M), 묘유선 곡률 반경(N)
+        meridional = WGS84_A * (1 - WGS84_E2) / w ** 1.5
+        prime_vertical = WGS84_A / math.sqrt(w)
+        self.meters_per_deg_lat = math.radians(1) * meridional
+        self.meters_per_deg_lng = math.radians(1) * prime_vertical * math.cos(phi)
+
+    def offset(self, latitude, longitude):
+        """장소 기준 (동쪽, 북쪽) 방향 거리(m)"""
+        return ((longitude - self.longitude) * self.meters_per_deg_lng,
+                (latitude - self.latitude) * self.meters_per_deg_lat)
+
+    def distance(self, latitude, longitude):
+        dx, dy = self.offset(latitude, longitude)
+        return math.hypot(dx, dy)
+
+    def check(self, latitude, longitude, radius):
+        """
+        (반경 안인지 여부, 거리(m)) 를 반환합니다.
+        사각형 범위 밖이면 바로 거절하고, 안내용 거리는 haversine 으로 구합니다.
+        """
+        dx, dy = self.offset(latitude, longitude)
+        if abs(dx) > radius or abs(dy) > radius:
+            return False, haversine(self.latitude, self.longitude, latitude, longitude)
+        distance = math.hypot(dx, dy)
+        return distance <= radius, distance
+
+
+def haversine(lat1, lng1, lat2, lng2):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_MEAN_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+# (장소 목록 버전, {장소 ID: SpaceFence})
+_fences = (None, {})
+_fences_lock = threading.Lock()
+
+
+def get_fence(space, catalog_version):
+    """
+    장소의 SpaceFence 를 반환합니다. 좌표가 없으면 None.
+    catalog_version: 장소 목록 버전 (seed.py, generate-data 가 장소를 바꾸면 올라감)
+    버전이 바뀌면 계산해 둔 환산 계수를 모두 버리고, 버전 없이 좌표만 바뀐 경우에도 새로 계산합니다.
+    """
+    if space.latitude is None or space.longitude is None:
+        return None
+
+    global _fences
+    version, fences = _fences
+    if version != catalog_version:
+        with _fences_lock:
+            if _fences[0] != catalog_version:
+                _fences = (catalog_version, {})
+            version, fences = _fences
+
+    fence = fences.get(space.id)
+    if fence is None or fence.latitude != space.latitude or fence.longitude != space.longitude:
+        fence = SpaceFence(space.latitude, space.longitude)
+        with _fences_lock:
+            fences[space.id] = fence
+    return fence
@@ -0,0 +1,70 @@
+"""
+JSON 직렬화
+
+orjson 이 설치되어 있으면 Flask 의 jsonify / request.get_json 이 orjson 을 사용하도록 합니다.
+(pip install orjson, 없으면 Flask 기본 json 을 그대로 씁니다)
+
+기본 제공자와 같은 규칙을 따릅니다.
+  - 키 정렬, 디버그 모드에서는 들여쓰기
+  - date / datetime 은 HTTP 날짜 형식 문자열
+  - 그 밖의 타입(Decimal, UUID, dataclass 등)은 기본 제공자의 변환 규칙 사용
+한글 등 ASCII 가 아닌 문자는 \\uXXXX 로 바꾸지 않고 UTF-8 그대로 내보냅니다. (JSON 으로는 같은 값입니다)
+
+설정 (config.Config)
+    JSON_PROVIDER   'auto' (orjson 이 있으면 사용, 기본) / 'orjson' / 'default'
+"""
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+
+    def _options(self, **kwargs):
+        # date / datetime 은 orjson 의 ISO 형식 대신 기본 제공자의 default 로 넘깁니다.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps_bytes(self, obj, **kwargs):
+        option = self._options(**kwargs)
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj, **kwargs).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self._options()
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        body = orjson.dumps(obj, default=self.default, option=option) + b"\n"
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def init_json_provider(app):
+    choice = app.config.get('JSON_PROVIDER', 'auto')
+    if choice == 'default' or (choice == 'auto' and orjson is None):
+        return
+    if orjson is None:
+        raise RuntimeError("JSON_PROVIDER='orjson' 을 사용하려면 orjson 패키지를 설치해야 합니다.")
+    app.json = OrjsonProvider(app)
+
+
+def json_bytes(obj):
+    """현재 앱의 JSON 제공자로 obj 를 직렬화한 bytes (미리 직렬화해 둘 응답 본문용)"""
+    provider = current_app.json
+    if isinstance(provider, OrjsonProvider):
+        return provider.dumps_bytes(obj)
+    return provider.dumps(obj).encode('utf-8')
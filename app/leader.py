@@ -0,0 +1,161 @@
+"""
+스케줄러 리더 선출 (lease 행 + 하트비트)
+
+여러 웹 프로세스(gunicorn 워커, 여러 서버)가 각자 스케줄러를 띄워도 예약 작업은 하나의 프로세스에서만 실행되도록,
+scheduler_lease 테이블의 행 하나를 임대(lease)합니다.
+
+- 하트비트 작업이 SCHEDULER_LEASE_HEARTBEAT 초마다 임대를 갱신합니다.
+  만료되지 않은 다른 holder 가 있으면 갱신에 실패하고, 그 프로세스는 HTTP 요청만 처리합니다.
+- 리더가 죽어 하트비트가 멈추면 SCHEDULER_LEASE_TTL 초 뒤 임대가 만료되고, 다른 프로세스의 다음 하트비트가 이어받습니다.
+- @leader_only 를 붙인 작업은 이 프로세스가 유효한 임대를 가지고 있을 때만 실행됩니다.
+
+DB 전용 락(MySQL GET_LOCK 등)은 연결 하나를 계속 붙잡고 있어야 하므로, 어떤 DB에서나 동작하는 임대 행 방식을 씁니다.
+만료 판단은 각 프로세스의 시계(UTC)를 쓰므로 서버 간 시계는 NTP 등으로 맞춰져 있어야 합니다.
+
+설정 (config.Config)
+    SCHEDULER_LEADER_ELECTION    False 이면 선출 없이 모든 프로세스가 작업을 실행합니다 (단일 프로세스 운영)
+    SCHEDULER_LEASE_TTL          임대 유지 시간(초)
+    SCHEDULER_LEASE_HEARTBEAT    임대 갱신 주기(초), TTL 보다 충분히 짧아야 합니다
+    SCHEDULER_AUTOSTART          True 이면 WSGI 서버(gunicorn 등)가 run.py 를 불러올 때 스케줄러를 시작합니다
+"""
+import atexit
+import functools
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import or_
+
+from app import db, scheduler
+from app.metrics import metrics
+from app.models import SchedulerLease
+
+LEASE_NAME = 'scheduler'
+HEARTBEAT_JOB_ID = 'scheduler_lease_heartbeat'
+
+# 프로세스마다 고유한 holder 이름 (같은 호스트에서 PID 가 재사용되어도 겹치지 않도록 난수를 붙입니다)
+HOLDER_ID = f"{socket.gethostname()[:60]}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+_lease_lock = threading.Lock()
+_lease_expires_at = None
+
+
+def _set_local_lease(expires_at):
+    global _lease_expires_at
+    with _lease_lock:
+        _lease_expires_at = expires_at
+
+
+def try_acquire_lease(ttl, name=LEASE_NAME):
+    """
+    임대를 새로 얻거나 갱신합니다. 이 프로세스가 리더이면 True 를 반환합니다.
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl)
+    table = SchedulerLease.__table__
+
+    # 내가 가진 임대이거나 만료된 임대만 가져옵니다. (acquired_at 은 holder 가 바뀌기 전 값으로 판단해야 하므로 먼저 씁니다)
+    result = db.session.execute(
+        update(table)
+        .where(table.c.name == name, or_(table.c.holder == HOLDER_ID, table.c.expires_at < now))
+        .ordered_values(
+            (table.c.acquired_at, case((table.c.holder == HOLDER_ID, table.c.acquired_at), else_=now)),
+            (table.c.holder, HOLDER_ID),
+            (table.c.expires_at, expires_at),
+        )
+    )
+    acquired = result.rowcount == 1
+
+    if not acquired and db.session.get(SchedulerLease, name) is None:
+        try:
+            with db.session.begin_nested():
+                db.session.add(SchedulerLease(name, HOLDER_ID, now, expires_at))
+            acquired = True
+        except IntegrityError:
+            # 다른 프로세스가 먼저 행을 만든 경우
+            acquired = False
+
+    db.session.commit()
+    _set_local_lease(expires_at if acquired else None)
+    return acquired
+
+
+def release_lease(name=LEASE_NAME):
+    """종료 시 임대를 바로 만료시켜 다른 프로세스가 기다리지 않고 이어받게 합니다."""
+    db.session.query(SchedulerLease).filter(
+        SchedulerLease.name == name,
+        SchedulerLease.holder == HOLDER_ID
+    ).update({SchedulerLease.expires_at: datetime.utcnow()}, synchronize_session=False)
+    db.session.commit()
+    _set_local_lease(None)
+
+
+def is_leader():
+    app = scheduler.app
+    if not app.config.get('SCHEDULER_LEADER_ELECTION', True):
+        return True
+    with _lease_lock:
+        return _lease_expires_at is not None and datetime.utcnow() < _lease_expires_at
+
+
+def leader_only(func):
+    """리더 프로세스에서만 예약 작업을 실행합니다."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not is_leader():
+            return None
+        return func(*args, **kwargs)
+    return wrapper
+
+
+@metrics.timed_job(HEARTBEAT_JOB_ID)
+def heartbeat():
+    """임대 갱신 작업 (모든 프로세스에서 실행)"""
+    app = scheduler.app
+    with app.app_context():
+        was_leader = is_leader()
+        try:
+            leader = try_acquire_lease(app.config['SCHEDULER_LEASE_TTL'])
+        except Exception as e:
+            db.session.rollback()
+            _set_local_lease(None)
+            print(f"[ERROR] 스케줄러 임대 갱신 실패: {str(e)}")
+            return
+
+        if leader and not was_leader:
+            print(f"[INFO] 스케줄러 리더가 되었습니다. ({HOLDER_ID})")
+        elif was_leader and not leader:
+            print(f"[WARNING] 스케줄러 리더 지위를 잃었습니다. ({HOLDER_ID})")
+
+
+def _release_on_exit(app):
+    try:
+        with app.app_context():
+            release_lease()
+    except Exception:
+        pass
+
+
+def start_scheduler(app):
+    """
+    스케줄러를 시작합니다. 리더 선출을 사용하면 첫 하트비트를 바로 실행한 뒤 주기적으로 갱신합니다.
+    """
+    if scheduler.running:
+        return
+
+    if app.config.get('SCHEDULER_LEADER_ELECTION', True):
+        scheduler.add_job(
+            id=HEARTBEAT_JOB_ID, func=heartbeat, trigger='interval',
+            seconds=app.config['SCHEDULER_LEASE_HEARTBEAT'], replace_existing=True
+        )
+        heartbeat()
+        atexit.register(_release_on_exit, app)
+
+    with app.app_context():
+        scheduler.start()
+    print(f"[INFO] APScheduler started (leader election: {app.config.get('SCHEDULER_LEADER_ELECTION', True)}, "
+          f"leader: {is_leader()})")
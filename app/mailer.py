@@ -0,0 +1,91 @@
+"""
+배치 메일 발송
+
+메시지마다 SMTP 연결(TLS 핸드셰이크 포함)을 새로 맺지 않고, 메시지 묶음(chunk)마다
+mail.connect() 로 연결 하나를 재사용합니다. 묶음들은 크기가 제한된 스레드 풀에서 병렬로 발송됩니다.
+
+설정 (config.Config)
+    MAIL_BATCH_WORKERS      동시에 열 SMTP 연결(스레드) 수
+    MAIL_BATCH_CHUNK_SIZE   연결 하나로 보낼 최대 메시지 수
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app import mail
+
+
+class BatchReport:
+    def __init__(self):
+        self.sent = []
+        self.failed = []
+        # 실패한 키별 오류 메시지
+        self.errors = {}
+        self.connections = 0
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        return (f"<BatchReport sent={len(self.sent)} failed={len(self.failed)} "
+                f"connections={self.connections} elapsed={self.elapsed:.2f}s>")
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _send_chunk(app, chunk):
+    """연결 하나로 chunk 의 메시지를 보냅니다. 연결이 끊기면 다시 연결해서 이어 보냅니다."""
+    sent, failed, errors, connections = [], [], {}, 0
+    with app.app_context():
+        remaining = list(chunk)
+        while remaining:
+            try:
+                with mail.connect() as conn:
+                    connections += 1
+                    while remaining:
+                        key, message = remaining[0]
+                        try:
+                            conn.send(message)
+                        except Exception as e:
+                            print(f"[ERROR] 메일 발송 실패: {str(e)} (키: {key})")
+                            failed.append(key)
+                            errors[key] = str(e)
+                            remaining.pop(0)
+                            # 연결 상태를 알 수 없으므로 새 연결로 이어서 보냅니다.
+                            break
+                        sent.append(key)
+                        remaining.pop(0)
+            except Exception as e:
+                # 연결 자체에 실패하면 남은 메시지는 모두 실패 처리합니다.
+                print(f"[ERROR] SMTP 연결 실패: {str(e)} (남은 메시지 {len(remaining)}건)")
+                for key, _ in remaining:
+                    failed.append(key)
+                    errors[key] = str(e)
+                remaining = []
+    return sent, failed, errors, connections
+
+
+def deliver_batch(app, messages, workers=None, chunk_size=None):
+    """
+    messages: (키, flask_mail.Message) 목록. 키는 결과 보고에 쓰입니다 (예: 예약 ID).
+    발송 결과(BatchReport)를 반환합니다.
+    """
+    workers = workers or app.config.get('MAIL_BATCH_WORKERS', 4)
+    chunk_size = chunk_size or app.config.get('MAIL_BATCH_CHUNK_SIZE', 50)
+
+    report = BatchReport()
+    if not messages:
+        return report
+
+    started = time.perf_counter()
+    chunks = _chunks(list(messages), chunk_size)
+    with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        for sent, failed, errors, connections in pool.map(lambda chunk: _send_chunk(app, chunk), chunks):
+            report.sent.extend(sent)
+            report.failed.extend(failed)
+            report.errors.update(errors)
+            report.connections += connections
+    report.elapsed = time.perf_counter() - started
+
+    print(f"[INFO] 메일 배치 발송 완료: 성공 {len(report.sent)}건, 실패 {len(report.failed)}건, "
+          f"연결 {report.connections}개, {report.elapsed:.2f}s")
+    return report
@@ -0,0 +1,238 @@
+"""
+요청 / DB / 스케줄러 계측 (Prometheus 텍스트 형식)
+
+- HTTP 요청: 라우트(URL 규칙)별 처리 시간 히스토그램, 요청마다 실행한 SQL 문 수와 DB 시간 히스토그램
+- DB: SQLAlchemy before_cursor_execute / after_cursor_execute 이벤트로 SQL 문 하나하나의 실행 시간 측정
+- 스케줄러: 예약 작업(job)별 실행 시간 히스토그램
+- 연결 풀: 수집 시점의 엔진별 사용 중 연결 수, 포화도
+
+측정값은 프로세스 메모리에 쌓이며 GET /metrics 로 내보냅니다.
+gunicorn 처럼 여러 프로세스로 실행하면 프로세스마다 값이 따로 있으므로, 각 프로세스를 따로 수집해야 합니다.
+스트리밍 응답(예약 내보내기 등)은 본문을 다 보내기 전에 측정이 끝납니다.
+
+설정 (config.Config)
+    METRICS_ENABLED   계측 사용 여부 (기본 true)
+    METRICS_TOKEN     설정하면 /metrics 에 'Authorization: Bearer <토큰>' 헤더가 필요합니다.
+"""
+import functools
+import threading
+import time
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+from app import db
+from app.db_routing import all_pool_stats
+
+# 초 단위 (Prometheus 기본 버킷과 같음)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+JOB_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_number(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for label_values, value in items:
+            lines.append(f"{self.name}{_format_labels(self.label_names, label_values)} {_format_number(value)}")
+        return lines
+
+
+class Histogram:
+
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # {라벨 값: [버킷별 개수(누적 아님)..., +Inf 개수, 합계]}
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            state = self._values.get(label_values)
+            if state is None:
+                state = self._values[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+        for label_values, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), state[:-1]):
+                cumulative += count
+                labels = _format_labels(self.label_names, label_values, f'le="{_format_number(float(bound))}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_number(state[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class PoolCollector:
+    """수집 시점의 DB 연결 풀 사용 현황 (엔진별)"""
+
+    GAUGES = (
+        ('db_pool_size', 'size', '연결 풀 크기'),
+        ('db_pool_checked_out', 'checkedOut', '사용 중인 연결 수'),
+        ('db_pool_overflow', 'overflow', '풀 크기를 넘어 만든 연결 수'),
+        ('db_pool_saturation', 'saturation', '사용 중인 연결 / (풀 크기 + max_overflow)'),
+    )
+
+    def render(self):
+        stats = all_pool_stats(db)
+        lines = []
+        for name, key, documentation in self.GAUGES:
+            lines += [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+            for bind, values in sorted(stats.items()):
+                if key in values:
+                    lines.append(f"{name}{_format_labels(('bind',), (bind,))} {_format_number(values[key])}")
+        return lines
+
+
+class Metrics:
+    """앱 전체에서 함께 쓰는 측정값 모음"""
+
+    def __init__(self, app=None):
+        self.enabled = False
+        self.request_duration = Histogram(
+            'http_request_duration_seconds', 'HTTP 요청 처리 시간', ('method', 'route', 'status'))
+        self.request_queries = Histogram(
+            'http_request_db_queries', '요청 하나가 실행한 SQL 문 수', ('method', 'route'), QUERY_COUNT_BUCKETS)
+        self.request_db_time = Histogram(
+            'http_request_db_seconds', '요청 하나의 SQL 실행 시간 합계', ('method', 'route'))
+        self.query_duration = Histogram(
+            'db_query_duration_seconds', 'SQL 문 하나의 실행 시간', ('context',))
+        self.job_duration = Histogram(
+            'scheduler_job_duration_seconds', '스케줄러 작업 실행 시간', ('job',), JOB_BUCKETS)
+        self.job_runs = Counter(
+            'scheduler_job_runs_total', '스케줄러 작업 실행 횟수', ('job', 'result'))
+        self.collectors = [
+            self.request_duration, self.request_queries, self.request_db_time,
+            self.query_duration, self.job_duration, self.job_runs, PoolCollector(),
+        ]
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.enabled = app.config.get('METRICS_ENABLED', True)
+        if not self.enabled:
+            return
+
+        app.before_request(_start_request)
+        app.after_request(self._finish_request)
+
+        with app.app_context():
+            for engine in db.engines.values():
+                if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+                    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+                    event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, '_metrics_query_start', None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+
+        if has_request_context() and 'metrics_started' in g:
+            g.metrics_queries += 1
+            g.metrics_db_time += elapsed
+            self.query_duration.observe(elapsed, 'request')
+        else:
+            self.query_duration.observe(elapsed, 'background')
+
+    def _finish_request(self, response):
+        started = g.pop('metrics_started', None)
+        if started is None:
+            return response
+
+        # URL 규칙(/api/bookings/<int:booking_id>/cancel) 단위로 모아 라벨 수가 늘어나지 않게 합니다.
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        self.request_duration.observe(time.perf_counter() - started, request.method, route, response.status_code)
+        self.request_queries.observe(g.metrics_queries, request.method, route)
+        self.request_db_time.observe(g.metrics_db_time, request.method, route)
+        return response
+
+    def timed_job(self, job_id):
+        """스케줄러 작업 함수의 실행 시간과 결과(ok / error)를 기록하는 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter()
+                result = 'error'
+                try:
+                    value = func(*args, **kwargs)
+                    result = 'ok'
+                    return value
+                finally:
+                    self.job_duration.observe(time.perf_counter() - started, job_id)
+                    self.job_runs.inc(job_id, result)
+            return wrapper
+        return decorator
+
+    def render(self):
+        lines = []
+        for collector in self.collectors:
+            lines.extend(collector.render())
+        return '\n'.join(lines) + '\n'
+
+
+def _start_request():
+    g.metrics_started = time.perf_counter()
+    g.metrics_queries = 0
+    g.metrics_db_time = 0.0
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 실행 컨텍스트는 SQL 문마다 새로 만들어지므로, 실패해서 after_cursor_execute 가 오지 않아도 남는 값이 없습니다.
+    if context is not None:
+        context._metrics_query_start = time.perf_counter()
+
+
+metrics = Metrics()
@@ -1,4 +1,5 @@
-from app import db, bcrypt
+from app import db
+from app.passwords import password_hasher
 from datetime import datetime
 
 class User(db.Model):
@@ -14,10 +15,20 @@ class User(db.Model):
     def __init__(self, id, username, password):
         self.id = id
         self.username = username
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8') 
+        self.password = password_hasher.hash(password)
 
     def check_password(self, password):
-       return bcrypt.check_password_hash(self.password, password)
+       return password_hasher.check(self.password, password)
+
+    def rehash_password_if_needed(self, password):
+        """
+        저장된 해시의 cost 가 현재 설정(BCRYPT_LOG_ROUNDS)과 다르면 다시 해시합니다.
+        로그인에 성공해 평문 비밀번호를 알고 있을 때만 호출합니다. 커밋은 호출한 쪽에서 합니다.
+        """
+        if not password_hasher.needs_rehash(self.password):
+            return False
+        self.password = password_hasher.hash(password)
+        return True
 
 
 class Space(db.Model):
@@ -25,6 +36,10 @@ class Space(db.Model):
     시설/장소 마스터 테이블
     """
     __tablename__ = 'space'
+    __table_args__ = (
+        # seed.py 가 (이름, 위치) 로 장소를 찾아 추가/갱신합니다. (upsert)
+        db.Index('uq_space_name_location', 'name', 'location', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -53,6 +68,14 @@ class Booking(db.Model):
     예약 정보 테이블
     """
     __tablename__ = 'booking'
+    __table_args__ = (
+        # 장소별 월/일 현황, 중복 예약 검사 (space_id, date, start_time 범위)
+        db.Index('ix_booking_space_date_start', 'space_id', 'date', 'start_time'),
+        # 시간 우선 예약 조회, 예약 알림 스케줄러 (date, start_time, status)
+        db.Index('ix_booking_date_start_status', 'date', 'start_time', 'status'),
+        # 내 예약 목록 (user_id, date, start_time 내림차순 키셋 페이지네이션)
+        db.Index('ix_booking_user_date_start', 'user_id', 'date', 'start_time'),
+    )
     
     id = db.Column(db.Integer, primary_key=True) 
 
@@ -102,6 +125,128 @@ class Booking(db.Model):
         self.status = status
 
 
+class BookingArchive(db.Model):
+    """
+    보관된 지난 예약 (flask archive-bookings 가 booking 테이블에서 옮김, app/archive.py)
+    Booking 과 같은 컬럼에 원래 예약 ID 를 그대로 사용하며, 내 예약 목록/내보내기/분석이 함께 읽습니다.
+    """
+    __tablename__ = 'booking_archive'
+    __table_args__ = (
+        # 내 예약 목록 (user_id, date, start_time 내림차순)
+        db.Index('ix_booking_archive_user_date_start', 'user_id', 'date', 'start_time'),
+        # 내보내기, 분석 (날짜 범위)
+        db.Index('ix_booking_archive_date_start', 'date', 'start_time'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+
+    user_id = db.Column(db.String(8), db.ForeignKey('user.id'), nullable=False)
+    space_id = db.Column(db.Integer, db.ForeignKey('space.id'), nullable=False)
+
+    date = db.Column(db.Date, nullable=False)
+    start_time = db.Column(db.Time, nullable=False)
+    end_time = db.Column(db.Time, nullable=False)
+
+    organizationType = db.Column(db.String(50))
+    organizationName = db.Column(db.String(100), nullable=False)
+    phone = db.Column(db.String(20), nullable=False)
+    email = db.Column(db.String(100), nullable=False)
+    event_name = db.Column(db.String(200), nullable=False)
+    num_people = db.Column(db.Integer, nullable=False)
+    ac_use = db.Column(db.String(3), default='no')
+
+    status = db.Column(db.String(20), nullable=False)
+    cancel_reason = db.Column(db.Text, nullable=True)
+    check_in_time = db.Column(db.DateTime, nullable=True)
+
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __init__(self, booking, archived_at=None):
+        for column in Booking.__table__.columns:
+            setattr(self, column.key, getattr(booking, column.key))
+        self.archived_at = archived_at or datetime.utcnow()
+
+
+class BookingSlot(db.Model):
+    """
+    예약이 차지한 10분 슬롯 (장소, 날짜, 슬롯 번호가 고유 키)
+    BOOKING_CONFLICT_STRATEGY = 'slot_claim' 일 때 중복 예약을 고유 키 위반으로 감지합니다.
+    """
+    __tablename__ = 'booking_slot'
+
+    space_id = db.Column(db.Integer, db.ForeignKey('space.id'), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    # 00:00 부터 10분 단위 슬롯 번호 (0 ~ 143)
+    slot_idx = db.Column(db.SmallInteger, primary_key=True, autoincrement=False)
+    booking_id = db.Column(db.Integer, db.ForeignKey('booking.id'), nullable=False, index=True)
+
+    def __init__(self, space_id, date, slot_idx, booking_id):
+        self.space_id = space_id
+        self.date = date
+        self.slot_idx = slot_idx
+        self.booking_id = booking_id
+
+
+class NotificationLog(db.Model):
+    """
+    발송한(또는 발송 중인) 알림 기록. (booking_id, kind) 고유 키로 같은 알림의 중복 발송을 막습니다.
+    """
+    __tablename__ = 'notification_log'
+    __table_args__ = (
+        db.UniqueConstraint('booking_id', 'kind', name='uq_notification_log_booking_kind'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    booking_id = db.Column(db.Integer, db.ForeignKey('booking.id'), nullable=False)
+    kind = db.Column(db.String(30), nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+    def __init__(self, booking_id, kind):
+        self.booking_id = booking_id
+        self.kind = kind
+
+
+class Outbox(db.Model):
+    """
+    발송 대기 메일 (트랜잭셔널 아웃박스)
+    예약/알림 코드가 같은 트랜잭션에서 행을 추가하고, 별도 워커(flask outbox-worker)가 꺼내 발송합니다.
+    예약이 삭제/보관되어도 발송 기록은 남도록 booking_id 에는 외래 키를 두지 않습니다.
+    """
+    __tablename__ = 'outbox'
+    __table_args__ = (
+        db.Index('ix_outbox_status_next_attempt', 'status', 'next_attempt_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(30), nullable=False)
+    booking_id = db.Column(db.Integer, nullable=True)
+    recipient = db.Column(db.String(255), nullable=False)
+    subject = db.Column(db.String(255), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+
+    # 'pending' (발송 대기/재시도 대기), 'sent', 'dead' (최대 시도 횟수 초과)
+    status = db.Column(db.String(10), nullable=False, default='pending')
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    # 워커가 선점한 시각과 선점 토큰 (오래된 선점은 다른 워커가 다시 가져갑니다)
+    locked_at = db.Column(db.DateTime, nullable=True)
+    locked_by = db.Column(db.String(64), nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+    def __init__(self, kind, recipient, subject, body, booking_id=None):
+        self.kind = kind
+        self.recipient = recipient
+        self.subject = subject
+        self.body = body
+        self.booking_id = booking_id
+        self.status = 'pending'
+        self.attempts = 0
+        self.next_attempt_at = datetime.utcnow()
+
+
 class Complaint(db.Model):
     """
     민원/시설 제보 테이블
@@ -119,4 +264,68 @@ class Complaint(db.Model):
     def __init__(self, content, user_id=None, space_id=None):
         self.content = content
         self.user_id = user_id
-        self.space_id = space_id
\ No newline at end of file
+        self.space_id = space_id
+
+class SpaceDayOccupancy(db.Model):
+    """
+    장소별/날짜별 예약 점유 요약 테이블 (Booking 변경 시 같은 트랜잭션에서 갱신)
+    """
+    __tablename__ = 'space_day_occupancy'
+    __table_args__ = (
+        # 날짜 단위 변경 버전 (시간 우선 조회 캐시 키, app.occupancy.date_version)
+        db.Index('ix_space_day_occupancy_date_version', 'date', 'version'),
+    )
+
+    space_id = db.Column(db.Integer, db.ForeignKey('space.id'), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+
+    booked_slots = db.Column(db.Integer, nullable=False, default=0)
+    morning_slots = db.Column(db.Integer, nullable=False, default=0)
+    afternoon_slots = db.Column(db.Integer, nullable=False, default=0)
+    evening_slots = db.Column(db.Integer, nullable=False, default=0)
+    # 10분 슬롯 비트마스크 (16진수 문자열)
+    slot_mask = db.Column(db.String(32), nullable=False, default='0')
+    # 갱신될 때마다 1씩 증가 (ETag 용 변경 버전)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    def __init__(self, space_id, date):
+        self.space_id = space_id
+        self.date = date
+        self.booked_slots = 0
+        self.morning_slots = 0
+        self.afternoon_slots = 0
+        self.evening_slots = 0
+        self.slot_mask = '0'
+        self.version = 0
+
+
+class DataVersion(db.Model):
+    """
+    데이터 묶음별 변경 버전 (예: 'space_catalog' 는 seed.py 가 장소 목록을 바꿀 때 증가)
+    """
+    __tablename__ = 'data_version'
+
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    def __init__(self, name, version=0):
+        self.name = name
+        self.version = version
+
+
+class SchedulerLease(db.Model):
+    """
+    스케줄러 리더 임대(lease). 여러 웹 프로세스 중 expires_at 이 지나지 않은 holder 하나만 예약 작업을 실행합니다.
+    """
+    __tablename__ = 'scheduler_lease'
+
+    name = db.Column(db.String(50), primary_key=True)
+    holder = db.Column(db.String(100), nullable=False)
+    acquired_at = db.Column(db.DateTime, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    def __init__(self, name, holder, acquired_at, expires_at):
+        self.name = name
+        self.holder = holder
+        self.acquired_at = acquired_at
+        self.expires_at = expires_at
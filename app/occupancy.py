@@ -0,0 +1,187 @@
+"""
+space_day_occupancy 요약 테이블 관리
+
+예약 생성/취소 등 점유 상태를 바꾸는 쓰기 경로는 커밋 직전에 occupy_day_slots() /
+release_day_slots() 를 호출하여, 같은 트랜잭션 안에서 해당 (장소, 날짜)의 요약 행을 갱신합니다.
+"""
+from sqlalchemy import func, tuple_
+
+from app import db
+from app.models import Booking, BookingArchive, SpaceDayOccupancy
+from app.slots import DayOccupancy, booking_mask
+
+
+def occupancy_from_summary(summary):
+    if summary is None:
+        return DayOccupancy()
+    return DayOccupancy(int(summary.slot_mask, 16))
+
+
+def _summary_values(occupancy):
+    counts = occupancy.period_counts()
+    return {
+        'booked_slots': occupancy.booked_count,
+        'morning_slots': counts["morning"],
+        'afternoon_slots': counts["afternoon"],
+        'evening_slots': counts["evening"],
+        'slot_mask': format(occupancy.mask, 'x'),
+    }
+
+
+def _apply(summary, occupancy):
+    for column, value in _summary_values(occupancy).items():
+        setattr(summary, column, value)
+
+
+def _lock_summary(space_id, date_obj):
+    """
+    요약 행을 (없으면 만든 뒤) 행 락을 잡고 최신 커밋 상태로 읽어옵니다.
+    같은 (장소, 날짜)를 갱신하는 트랜잭션은 이 지점부터 커밋까지 직렬화됩니다.
+    (BOOKING_CONFLICT_STRATEGY=slot_claim 에서도 마찬가지입니다)
+    """
+    table = SpaceDayOccupancy.__table__
+    values = dict(
+        space_id=space_id, date=date_obj, booked_slots=0, morning_slots=0,
+        afternoon_slots=0, evening_slots=0, slot_mask='0', version=0
+    )
+
+    # SELECT ... FOR UPDATE 로 없는 행을 먼저 찾으면 갭 락끼리 교착 상태가 생기므로,
+    # 행이 있으면 아무 것도 바꾸지 않는 INSERT 로 존재를 보장합니다.
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+        stmt = mysql_insert(table).values(**values).on_duplicate_key_update(version=table.c.version)
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        stmt = sqlite_insert(table).values(**values).on_conflict_do_nothing()
+    else:
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        stmt = pg_insert(table).values(**values).on_conflict_do_nothing()
+    db.session.execute(stmt)
+
+    return SpaceDayOccupancy.query.filter_by(space_id=space_id, date=date_obj)\
+        .with_for_update().populate_existing().one()
+
+
+def _update_day_mask(space_id, date_obj, update):
+    summary = _lock_summary(space_id, date_obj)
+    occupancy = occupancy_from_summary(summary)
+    occupancy.mask = update(occupancy.mask)
+    _apply(summary, occupancy)
+    summary.version += 1
+    return summary
+
+
+def occupy_day_slots(booking):
+    """
+    예약이 생성되었을 때 해당 날짜의 요약 행에 예약 슬롯을 더합니다. 커밋은 호출한 쪽에서 합니다.
+    (확정된 예약끼리는 시간이 겹치지 않으므로 OR / AND NOT 만으로 정확하게 유지됩니다)
+    """
+    mask = booking_mask(booking.start_time, booking.end_time)
+    return _update_day_mask(booking.space_id, booking.date, lambda current: current | mask)
+
+
+def release_day_slots(booking):
+    """
+    예약이 취소되었을 때 해당 날짜의 요약 행에서 예약 슬롯을 뺍니다. 커밋은 호출한 쪽에서 합니다.
+    """
+    mask = booking_mask(booking.start_time, booking.end_time)
+    return _update_day_mask(booking.space_id, booking.date, lambda current: current & ~mask)
+
+
+def day_version(space_id, date_obj):
+    """(장소, 날짜)의 변경 버전. 요약 행이 없으면 0 입니다."""
+    version = db.session.query(SpaceDayOccupancy.version).filter(
+        SpaceDayOccupancy.space_id == space_id,
+        SpaceDayOccupancy.date == date_obj
+    ).scalar()
+    return version or 0
+
+
+def month_version(space_id, month_start, next_month_start):
+    """
+    월 단위 변경 버전. 요약 행은 지워지지 않고 버전만 증가하므로
+    (행 수, 버전 합)은 해당 월의 예약이 바뀔 때마다 달라집니다.
+    """
+    row_count, version_sum = db.session.query(
+        func.count(SpaceDayOccupancy.date), func.coalesce(func.sum(SpaceDayOccupancy.version), 0)
+    ).filter(
+        SpaceDayOccupancy.space_id == space_id,
+        SpaceDayOccupancy.date >= month_start,
+        SpaceDayOccupancy.date < next_month_start
+    ).one()
+    return f"{row_count}.{version_sum}"
+
+
+def date_version(date_obj):
+    """
+    날짜 단위 변경 버전 (모든 장소). month_version 과 같은 방식으로 (행 수, 버전 합)을 사용합니다.
+    ix_space_day_occupancy_date_version 인덱스만 읽습니다.
+    """
+    row_count, version_sum = db.session.query(
+        func.count(SpaceDayOccupancy.space_id), func.coalesce(func.sum(SpaceDayOccupancy.version), 0)
+    ).filter(SpaceDayOccupancy.date == date_obj).one()
+    return f"{row_count}.{version_sum}"
+
+
+def _day_masks(keys):
+    """(장소, 날짜) 목록의 취소되지 않은 예약(보관된 예약 포함)으로 날짜별 슬롯 마스크를 계산합니다."""
+    masks = {}
+    for model in (BookingArchive, Booking):
+        rows = db.session.query(model.space_id, model.date, model.start_time, model.end_time).filter(
+            tuple_(model.space_id, model.date).in_(keys),
+            model.status != '취소'
+        )
+        for row_space_id, row_date, start_time, end_time in rows:
+            key = (row_space_id, row_date)
+            masks[key] = masks.get(key, 0) | booking_mask(start_time, end_time)
+    return masks
+
+
+def _read_committed():
+    """
+    이번 트랜잭션의 조회가 트랜잭션 시작 시점의 스냅샷이 아니라 조회 시점까지 커밋된 데이터를 읽게 합니다.
+    (MySQL 기본값은 REPEATABLE READ, 트랜잭션을 시작하기 전에 호출해야 합니다)
+    """
+    if db.session.get_bind().dialect.name == 'mysql':
+        db.session.connection(execution_options={'isolation_level': 'READ COMMITTED'})
+
+
+def rebuild_occupancy(space_id=None, date_from=None, date_to=None, batch_size=500):
+    """
+    Booking, BookingArchive 테이블 전체(또는 주어진 범위)로부터 요약 행을 다시 계산합니다. (복구용)
+    date_to 는 포함 범위입니다. 다시 계산한 요약 행 수를 반환합니다.
+
+    서비스 중에도 실행할 수 있도록 (장소, 날짜)마다 예약 생성/취소와 같은 행 락(_lock_summary)을 잡은 뒤
+    예약을 읽어 덮어씁니다. 락을 잡기 전에 커밋된 예약은 모두 반영되고, 그 사이에 진행 중이던 예약은
+    락이 풀린 뒤 자신의 트랜잭션에서 마스크를 더합니다. batch_size 개의 (장소, 날짜)마다 커밋합니다.
+    ETag 가 이전 값과 겹치지 않도록 버전은 항상 올립니다.
+    """
+    keys = set()
+    for model in (SpaceDayOccupancy, BookingArchive, Booking):
+        key_query = db.session.query(model.space_id, model.date)
+        if model is not SpaceDayOccupancy:
+            key_query = key_query.filter(model.status != '취소')
+        if space_id is not None:
+            key_query = key_query.filter(model.space_id == space_id)
+        if date_from is not None:
+            key_query = key_query.filter(model.date >= date_from)
+        if date_to is not None:
+            key_query = key_query.filter(model.date <= date_to)
+        keys.update((row_space_id, row_date) for row_space_id, row_date in key_query.distinct())
+    db.session.commit()
+
+    # 같은 순서로 락을 잡으므로 여러 rebuild 가 동시에 실행되어도 교착 상태가 생기지 않습니다.
+    keys = sorted(keys)
+    for offset in range(0, len(keys), batch_size):
+        _read_committed()
+        batch = keys[offset:offset + batch_size]
+        summaries = [_lock_summary(row_space_id, row_date) for row_space_id, row_date in batch]
+        # 락을 모두 잡은 뒤에 예약을 읽습니다.
+        masks = _day_masks(batch)
+        for summary in summaries:
+            _apply(summary, DayOccupancy(masks.get((summary.space_id, summary.date), 0)))
+            summary.version += 1
+        db.session.commit()
+
+    return len(keys)
@@ -0,0 +1,183 @@
+"""
+트랜잭셔널 아웃박스
+
+예약/알림 코드는 메일을 직접 보내지 않고, 자신의 트랜잭션 안에서 outbox 행을 추가합니다.
+별도 프로세스로 실행하는 워커(flask outbox-worker)가 행을 묶음으로 선점해 발송하므로
+웹 워커에는 SMTP 지연이 전혀 생기지 않고, 알림량이 늘면 워커 프로세스만 늘리면 됩니다.
+
+선점: SELECT ... FOR UPDATE SKIP LOCKED 로 후보를 고른 뒤 선점 토큰(locked_by)을 기록하고 커밋합니다.
+      (SQLite 처럼 SKIP LOCKED 가 없는 DB에서는 UPDATE 조건으로만 경합을 막습니다)
+재시도: 실패하면 OUTBOX_BACKOFF_SECONDS * 2^(시도 횟수-1) 뒤에 다시 시도하고,
+        OUTBOX_MAX_ATTEMPTS 번 실패하면 'dead' 상태로 남깁니다.
+
+설정 (config.Config)
+    NOTIFICATION_DELIVERY        'inline' (스케줄러가 직접 발송, 기본) / 'outbox' (아웃박스에 넣고 워커가 발송)
+    OUTBOX_BATCH_SIZE            워커가 한 번에 선점할 행 수
+    OUTBOX_POLL_INTERVAL         대기 행이 없을 때 다시 확인하기까지의 시간(초)
+    OUTBOX_MAX_ATTEMPTS          최대 발송 시도 횟수
+    OUTBOX_BACKOFF_SECONDS       첫 재시도 대기 시간(초)
+    OUTBOX_BACKOFF_MAX_SECONDS   재시도 대기 시간 상한(초)
+    OUTBOX_LOCK_TIMEOUT          선점 후 이 시간(초)이 지나도록 끝나지 않은 행은 다른 워커가 다시 가져갑니다
+"""
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from flask import current_app
+from flask_mail import Message
+from sqlalchemy.sql import and_, or_
+
+from app import db
+from app.mailer import deliver_batch
+from app.models import NotificationLog, Outbox
+
+
+def enqueue_message(message, kind, booking_id=None):
+    """
+    flask_mail.Message 를 아웃박스에 추가합니다. 커밋은 호출한 쪽의 트랜잭션에서 합니다.
+    """
+    row = Outbox(
+        kind=kind,
+        recipient=','.join(message.recipients),
+        subject=message.subject,
+        body=message.body,
+        booking_id=booking_id
+    )
+    db.session.add(row)
+    return row
+
+
+def _claimable(now, lock_timeout):
+    return and_(
+        Outbox.status == 'pending',
+        Outbox.next_attempt_at <= now,
+        or_(Outbox.locked_at.is_(None), Outbox.locked_at < now - timedelta(seconds=lock_timeout))
+    )
+
+
+def claim_batch(worker_id, batch_size, lock_timeout):
+    """발송할 행을 최대 batch_size 개 선점하고, 선점 토큰과 행 목록을 반환합니다."""
+    now = datetime.utcnow()
+    claimable = _claimable(now, lock_timeout)
+
+    ids = [row.id for row in db.session.query(Outbox.id).filter(claimable)
+           .order_by(Outbox.next_attempt_at, Outbox.id)
+           .limit(batch_size)
+           .with_for_update(skip_locked=True)]
+    if not ids:
+        db.session.commit()
+        return None, []
+
+    token = f"{worker_id[:40]}:{uuid.uuid4().hex[:12]}"
+    # 다른 워커가 그 사이 가져간 행은 조건에 걸려 갱신되지 않습니다.
+    db.session.query(Outbox).filter(Outbox.id.in_(ids), claimable)\
+        .update({Outbox.locked_at: now, Outbox.locked_by: token}, synchronize_session=False)
+    db.session.commit()
+
+    rows = Outbox.query.filter(Outbox.locked_by == token).order_by(Outbox.id).all()
+    return token, rows
+
+
+def backoff_delay(attempts, base, maximum):
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), maximum))
+
+
+def finish_batch(token, rows, report, config):
+    """발송 결과를 반영하고 선점을 풉니다. 선점이 다른 워커로 넘어간 행은 건드리지 않습니다."""
+    now = datetime.utcnow()
+    sent_ids = set(report.sent)
+
+    sent_rows = [row for row in rows if row.id in sent_ids]
+    if sent_rows:
+        Outbox.query.filter(Outbox.id.in_([row.id for row in sent_rows]), Outbox.locked_by == token).update({
+            Outbox.status: 'sent',
+            Outbox.sent_at: now,
+            Outbox.attempts: Outbox.attempts + 1,
+            Outbox.locked_at: None,
+            Outbox.locked_by: None,
+        }, synchronize_session=False)
+
+        # 예약 알림은 notification_log 에도 발송 시각을 남깁니다.
+        by_kind = {}
+        for row in sent_rows:
+            if row.booking_id is not None:
+                by_kind.setdefault(row.kind, []).append(row.booking_id)
+        for kind, booking_ids in by_kind.items():
+            NotificationLog.query.filter(
+                NotificationLog.booking_id.in_(booking_ids),
+                NotificationLog.kind == kind
+            ).update({NotificationLog.sent_at: now}, synchronize_session=False)
+
+    dead = 0
+    for row in rows:
+        if row.id in sent_ids:
+            continue
+        attempts = row.attempts + 1
+        values = {
+            Outbox.attempts: attempts,
+            Outbox.last_error: report.errors.get(row.id, '발송 결과 없음')[:1000],
+            Outbox.locked_at: None,
+            Outbox.locked_by: None,
+        }
+        if attempts >= config['OUTBOX_MAX_ATTEMPTS']:
+            values[Outbox.status] = 'dead'
+            dead += 1
+        else:
+            values[Outbox.next_attempt_at] = now + backoff_delay(
+                attempts, config['OUTBOX_BACKOFF_SECONDS'], config['OUTBOX_BACKOFF_MAX_SECONDS'])
+        Outbox.query.filter(Outbox.id == row.id, Outbox.locked_by == token)\
+            .update(values, synchronize_session=False)
+
+    db.session.commit()
+    return len(sent_rows), len(rows) - len(sent_rows), dead
+
+
+def _build_message(row):
+    return Message(subject=row.subject, recipients=row.recipient.split(','), body=row.body)
+
+
+def process_batch(worker_id, batch_size=None):
+    """
+    한 묶음을 선점해서 발송합니다. 처리한 행이 없으면 0 을 반환합니다.
+    """
+    app = current_app._get_current_object()
+    config = app.config
+    token, rows = claim_batch(worker_id, batch_size or config['OUTBOX_BATCH_SIZE'], config['OUTBOX_LOCK_TIMEOUT'])
+    if not rows:
+        return 0
+
+    report = deliver_batch(app, [(row.id, _build_message(row)) for row in rows])
+    sent, failed, dead = finish_batch(token, rows, report, config)
+    print(f"[INFO] 아웃박스 처리: 성공 {sent}건, 실패 {failed}건 (재시도 포기 {dead}건)")
+    return len(rows)
+
+
+def run_worker(worker_id=None, batch_size=None, poll_interval=None, once=False):
+    """
+    아웃박스 워커 루프. once=True 이면 대기 행을 모두 처리한 뒤 종료합니다.
+    처리한 행 수를 반환합니다.
+    """
+    config = current_app.config
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    poll_interval = poll_interval if poll_interval is not None else config['OUTBOX_POLL_INTERVAL']
+    print(f"[INFO] 아웃박스 워커 시작 (worker: {worker_id})")
+
+    processed = 0
+    while True:
+        try:
+            handled = process_batch(worker_id, batch_size)
+        except Exception as e:
+            db.session.rollback()
+            print(f"[ERROR] 아웃박스 처리 중 오류 발생: {str(e)}")
+            if once:
+                raise
+            handled = 0
+
+        processed += handled
+        if handled:
+            continue
+        if once:
+            return processed
+        time.sleep(poll_interval)
@@ -0,0 +1,114 @@
+"""
+비밀번호 해시 (bcrypt)
+
+bcrypt 는 일부러 느리게 만든 CPU 작업이라, 학기 초 로그인이 몰리면 요청 스레드가 모두 해시 계산에 묶입니다.
+해시 생성/검증을 크기가 작은 스레드 풀에서 실행하고, 동시에 처리 중인 작업 수도 제한하여
+나머지 요청은 계속 처리되도록 합니다. (bcrypt 는 해시 계산 중 GIL 을 놓으므로 스레드로도 여러 코어를 사용합니다)
+풀은 웹 워커 프로세스마다 따로 생기므로, 워커 수 x BCRYPT_POOL_SIZE 가 코어 수를 크게 넘지 않게 설정합니다.
+
+Flask-Bcrypt 와 같은 형식의 해시를 만들므로 기존에 저장된 해시를 그대로 검증할 수 있습니다.
+저장된 해시의 cost 가 BCRYPT_LOG_ROUNDS 와 다르면 로그인 성공 시 새 cost 로 다시 해시합니다.
+
+설정 (config.Config)
+    BCRYPT_LOG_ROUNDS    bcrypt cost (2^rounds 번 반복)
+    BCRYPT_POOL_SIZE     해시 계산 스레드 수 (0 이면 요청 스레드에서 직접 계산)
+"""
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+
+def _prepare(password, handle_long_passwords):
+    if isinstance(password, str):
+        password = password.encode('utf-8')
+    if handle_long_passwords:
+        password = hashlib.sha256(password).hexdigest().encode('utf-8')
+    return password
+
+
+# 아래 두 함수는 풀의 작업 스레드에서 실행됩니다.
+def _hashpw(password, rounds, prefix):
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds, prefix=prefix))
+
+
+def _checkpw(password, pw_hash):
+    return bcrypt.checkpw(password, pw_hash)
+
+
+def hash_rounds(pw_hash):
+    """'$2b$12$...' 형식 해시의 cost 를 반환합니다. 형식이 다르면 None."""
+    try:
+        return int(pw_hash.split('$')[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+
+    def __init__(self, app=None):
+        self.rounds = 12
+        self.prefix = b'2b'
+        self.handle_long_passwords = False
+        self.pool_size = 0
+        self._pool = None
+        self._slots = None
+        self._pool_lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        # Flask-Bcrypt 와 같은 설정 키를 사용합니다.
+        self.configure(
+            rounds=app.config.get('BCRYPT_LOG_ROUNDS', 12),
+            pool_size=app.config.get('BCRYPT_POOL_SIZE', 0),
+            prefix=app.config.get('BCRYPT_HASH_PREFIX', '2b'),
+            handle_long_passwords=app.config.get('BCRYPT_HANDLE_LONG_PASSWORDS', False)
+        )
+
+    def configure(self, rounds=12, pool_size=0, prefix='2b', handle_long_passwords=False):
+        self.shutdown()
+        self.rounds = rounds
+        self.pool_size = pool_size
+        self.prefix = prefix.encode('ascii') if isinstance(prefix, str) else prefix
+        self.handle_long_passwords = handle_long_passwords
+        # 풀에 쌓아 둘 수 있는 작업 수 제한 (넘치면 요청 스레드가 차례를 기다립니다)
+        self._slots = threading.BoundedSemaphore(max(pool_size, 1) * 4)
+
+    def _executor(self):
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix='bcrypt')
+            return self._pool
+
+    def _run(self, func, *args):
+        if self.pool_size <= 0:
+            return func(*args)
+
+        with self._slots:
+            return self._executor().submit(func, *args).result()
+
+    def hash(self, password, rounds=None):
+        if not password:
+            raise ValueError('Password must be non-empty.')
+        password = _prepare(password, self.handle_long_passwords)
+        return self._run(_hashpw, password, rounds or self.rounds, self.prefix).decode('utf-8')
+
+    def check(self, pw_hash, password):
+        password = _prepare(password, self.handle_long_passwords)
+        if isinstance(pw_hash, str):
+            pw_hash = pw_hash.encode('utf-8')
+        return self._run(_checkpw, password, pw_hash)
+
+    def needs_rehash(self, pw_hash):
+        return hash_rounds(pw_hash) != self.rounds
+
+    def shutdown(self):
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,22 @@
+"""
+권한 확인 데코레이터
+"""
+from functools import wraps
+
+from flask import current_app, jsonify
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+
+def is_admin(user_id):
+    return user_id in current_app.config.get('ADMIN_USER_IDS', [])
+
+
+def admin_required(view):
+    """로그인한 사용자가 관리자(ADMIN_USER_IDS 에 포함된 학번)인지 확인합니다."""
+    @wraps(view)
+    @jwt_required()
+    def wrapper(*args, **kwargs):
+        if not is_admin(get_jwt_identity()):
+            return jsonify({"error": "관리자 권한이 필요합니다."}), 403
+        return view(*args, **kwargs)
+    return wrapper
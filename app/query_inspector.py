@@ -0,0 +1,153 @@
+"""
+느린 쿼리 / N+1 감지 (개발, 스테이징용)
+
+QUERY_INSPECTOR 를 켜면 모든 SQL 문을 SQLAlchemy 커서 이벤트로 지켜보면서
+  - SLOW_QUERY_MS 보다 오래 걸린 SELECT 문은 실행 계획(EXPLAIN)과 함께 로그에 남기고
+  - 요청 하나에서 같은 SQL 문(파라미터만 다른 문장)이 N_PLUS_ONE_THRESHOLD 번을 넘게 실행되면
+    N+1 의심으로 로그에 남깁니다. (반복문 안에서 관계(booking.space 등)를 지연 로딩하는 경우)
+
+teardown_request 는 응답 본문을 보내기 전에 실행되므로, 요청 중 느린 쿼리는 teardown 에서 큐에 넣기만 하고
+EXPLAIN 과 로그 출력은 백그라운드 스레드가 원래 쿼리와 다른 연결에서 합니다. (응답을 늦추지 않음)
+큐가 가득 차면(EXPLAIN_QUEUE_SIZE) 실행 계획 없이 로그만 남깁니다.
+요청 밖(스케줄러 작업, CLI 명령)의 느린 쿼리는 프로세스가 먼저 끝날 수 있으므로 바로 EXPLAIN 합니다.
+운영 환경에서는 켜지 마세요.
+
+설정 (config.Config)
+    QUERY_INSPECTOR        사용 여부 (기본 false)
+    SLOW_QUERY_MS          느린 쿼리 기준 (밀리초, 0 이면 검사하지 않음)
+    N_PLUS_ONE_THRESHOLD   요청당 같은 SQL 문 허용 횟수 (0 이면 검사하지 않음)
+"""
+import queue
+import threading
+import time
+from collections import Counter
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+from app import db
+
+_STATEMENT_PREVIEW = 300
+EXPLAIN_QUEUE_SIZE = 100
+
+
+def _preview(statement):
+    statement = ' '.join(statement.split())
+    if len(statement) > _STATEMENT_PREVIEW:
+        return statement[:_STATEMENT_PREVIEW] + ' ...'
+    return statement
+
+
+def explain(engine, statement, parameters):
+    """statement 의 실행 계획을 문자열 줄 목록으로 돌려줍니다."""
+    prefix = 'EXPLAIN QUERY PLAN ' if engine.dialect.name == 'sqlite' else 'EXPLAIN '
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(prefix + statement, parameters or ()).fetchall()
+    return [' | '.join('' if value is None else str(value) for value in row) for row in rows]
+
+
+class QueryInspector:
+
+    def __init__(self, app=None):
+        self.enabled = False
+        self.slow_seconds = 0
+        self.n_plus_one_threshold = 0
+        self._explain_queue = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.enabled = app.config.get('QUERY_INSPECTOR', False)
+        if not self.enabled:
+            return
+        self.slow_seconds = app.config.get('SLOW_QUERY_MS', 200) / 1000
+        self.n_plus_one_threshold = app.config.get('N_PLUS_ONE_THRESHOLD', 5)
+
+        app.before_request(_start_request)
+        app.teardown_request(self._finish_request)
+
+        self._explain_queue = queue.Queue(maxsize=EXPLAIN_QUEUE_SIZE)
+        threading.Thread(target=self._explain_worker, name='query-inspector-explain', daemon=True).start()
+
+        with app.app_context():
+            for engine in db.engines.values():
+                event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+                event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+        print(f"[INFO] 쿼리 검사 사용: 느린 쿼리 {app.config.get('SLOW_QUERY_MS')}ms, "
+              f"N+1 기준 {self.n_plus_one_threshold}회")
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # SQL 문마다 새로 만들어지는 실행 컨텍스트에 둡니다. (실패한 문장은 after_cursor_execute 가 오지 않음)
+        if context is not None:
+            context._query_inspector_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, '_query_inspector_start', None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        if statement.startswith('EXPLAIN'):
+            return
+
+        in_request = has_request_context() and 'query_inspector_statements' in g
+        if in_request:
+            g.query_inspector_statements[statement] += 1
+
+        if not self.slow_seconds or elapsed < self.slow_seconds:
+            return
+        # executemany 나 SELECT 가 아닌 문장(INSERT/UPDATE 등)은 EXPLAIN 하지 않습니다.
+        explainable = not executemany and statement.lstrip().upper().startswith(('SELECT', 'WITH'))
+        slow = (conn.engine, statement, parameters if explainable else None, elapsed)
+        if in_request:
+            g.query_inspector_slow.append(slow)
+        else:
+            self._report_slow(slow, '요청 밖')
+
+    def _report_slow(self, slow, where):
+        engine, statement, parameters, elapsed = slow
+        print(f"[WARNING] 느린 쿼리 ({elapsed * 1000:.1f}ms, {where}): {_preview(statement)}")
+        if parameters is None:
+            return
+        try:
+            for line in explain(engine, statement, parameters):
+                print(f"          {line}")
+        except Exception as e:
+            print(f"[WARNING] EXPLAIN 실패: {str(e)}")
+
+    def _explain_worker(self):
+        while True:
+            slow, where = self._explain_queue.get()
+            try:
+                self._report_slow(slow, where)
+            except Exception as e:
+                print(f"[WARNING] 느린 쿼리 로그 실패: {str(e)}")
+
+    def _finish_request(self, exc=None):
+        statements = g.pop('query_inspector_statements', None)
+        slow_queries = g.pop('query_inspector_slow', [])
+        if statements is None:
+            return
+
+        where = f"{request.method} {request.path}"
+        for slow in slow_queries:
+            try:
+                self._explain_queue.put_nowait((slow, where))
+            except queue.Full:
+                engine, statement, _, elapsed = slow
+                self._report_slow((engine, statement, None, elapsed), where)
+
+        if not self.n_plus_one_threshold:
+            return
+        for statement, count in statements.items():
+            if count > self.n_plus_one_threshold:
+                print(f"[WARNING] N+1 의심 ({where}): 같은 SQL 문이 {count}번 실행되었습니다. "
+                      f"{_preview(statement)}")
+
+
+def _start_request():
+    g.query_inspector_statements = Counter()
+    g.query_inspector_slow = []
+
+
+query_inspector = QueryInspector()
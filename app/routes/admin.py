@@ -0,0 +1,76 @@
+from flask import Blueprint, jsonify, request, Response, stream_with_context
+from app.permissions import admin_required
+from app.db_routing import use_replica
+from app.export import export_bookings, EXPORT_FORMATS
+from app.analytics import utilization_report
+from app.clock import kst_now
+from datetime import datetime
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
+
+
+@admin_bp.route("/bookings/export", methods=['GET'])
+@use_replica
+@admin_required
+def export_bookings_route():
+    """
+    기간 내 예약을 NDJSON 또는 CSV 로 스트리밍합니다. (관리자 전용)
+
+    쿼리 파라미터
+        from, to  날짜 범위 (YYYY-MM-DD, 포함, 필수)
+        format    ndjson (기본) / csv
+        status    상태 필터 (쉼표로 여러 개, 선택)
+    """
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": "format 은 ndjson 또는 csv 여야 합니다."}), 400
+
+    try:
+        date_from = datetime.strptime(request.args['from'], '%Y-%m-%d').date()
+        date_to = datetime.strptime(request.args['to'], '%Y-%m-%d').date()
+    except KeyError:
+        return jsonify({"error": "from, to 는 필수 파라미터입니다."}), 400
+    except ValueError:
+        return jsonify({"error": "날짜 형식이 잘못되었습니다 (YYYY-MM-DD)."}), 400
+
+    statuses = request.args['status'].split(',') if request.args.get('status') else None
+    mimetype, extension = EXPORT_FORMATS[fmt]
+    filename = f"bookings_{date_from.isoformat()}_{date_to.isoformat()}.{extension}"
+
+    # 응답을 보내는 동안 제너레이터가 DB 세션을 쓰므로 요청 컨텍스트를 유지합니다.
+    body = stream_with_context(export_bookings(fmt, date_from, date_to, statuses))
+    return Response(body, mimetype=mimetype, headers={
+        "Content-Disposition": f"attachment; filename={filename}"
+    })
+
+
+@admin_bp.route("/analytics/utilization", methods=['GET'])
+@use_replica
+@admin_required
+def get_utilization():
+    """
+    기간 내 장소/카테고리별 이용률, 노쇼율, 요일 x 시간대 히트맵 (관리자 전용)
+
+    쿼리 파라미터
+        from, to   날짜 범위 (YYYY-MM-DD, 포함, 필수)
+        spaceId    특정 장소만 (선택)
+        category   특정 카테고리만 (선택)
+    """
+    try:
+        date_from = datetime.strptime(request.args['from'], '%Y-%m-%d').date()
+        date_to = datetime.strptime(request.args['to'], '%Y-%m-%d').date()
+        space_id = request.args.get('spaceId', type=int)
+    except KeyError:
+        return jsonify({"error": "from, to 는 필수 파라미터입니다."}), 400
+    except ValueError:
+        return jsonify({"error": "날짜 형식이 잘못되었습니다 (YYYY-MM-DD)."}), 400
+
+    if date_to < date_from:
+        return jsonify({"error": "to 는 from 이후 날짜여야 합니다."}), 400
+
+    try:
+        now = kst_now().replace(tzinfo=None)
+        report = utilization_report(date_from, date_to, now, space_id=space_id, category=request.args.get('category'))
+        return jsonify(report), 200
+    except Exception as e:
+        return jsonify({"error": "이용률 분석 중 오류 발생", "details": str(e)}), 500
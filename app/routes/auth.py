@@ -1,7 +1,7 @@
 from flask import Blueprint, request, jsonify
-from app import db, bcrypt 
+from app import db
 from app.models import User
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from flask_jwt_extended import create_access_token, jwt_required, current_user
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/api')
 
@@ -53,6 +53,14 @@ def login():
     if not user or not user.check_password(password):
         return jsonify({"error": "학번이 존재하지 않거나 비밀번호가 올바르지 않습니다."}), 401
 
+    # 설정된 cost 와 다른 해시는 로그인 성공 시 새 cost 로 바꿉니다. (실패해도 로그인은 진행)
+    try:
+        if user.rehash_password_if_needed(password):
+            db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"[WARNING] 비밀번호 재해시 실패: {str(e)} (사용자: {user.id})")
+
     
     access_token = create_access_token(identity=user.id)
 
@@ -67,14 +75,8 @@ def login():
 @auth_bp.route("/my-profile", methods=['GET'])
 @jwt_required() 
 def my_profile():
-    current_user_id = get_jwt_identity()
-    user = User.query.filter_by(id=current_user_id).first()
-
-    if not user:
-        return jsonify({"error": "사용자를 찾을 수 없습니다."}), 404
-
-    
+    # current_user 는 사용자 정보 캐시에서 읽습니다. (없는 사용자면 jwt_required 단계에서 404)
     return jsonify({
-        "id": user.id,
-        "username": user.username
+        "id": current_user.id,
+        "username": current_user.username
     }), 200
\ No newline at end of file
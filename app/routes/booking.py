@@ -1,52 +1,195 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, current_app
 from app import db
-from app.models import Booking, Space 
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.models import Booking, BookingArchive, Space
+from app.occupancy import occupy_day_slots, release_day_slots
+from app.booking_slots import claim_booking_slots, release_booking_slots, find_conflicting_booking
+from flask_jwt_extended import jwt_required, get_jwt_identity, current_user
 from datetime import datetime, timedelta, time
-import pytz
-from geopy.distance import geodesic 
-from sqlalchemy.sql import and_ 
-from sqlalchemy.exc import OperationalError 
+from app.geofence import get_fence
+from app.versions import get_data_version, SPACE_CATALOG
+from app.clock import kst_now
+from app.db_routing import use_replica
+from app.archive import archive_column
+from app.slots import SLOT_MINUTES, is_slot_aligned
+from sqlalchemy.orm import joinedload
+from sqlalchemy.sql import and_, or_
+import base64
+import json
+from sqlalchemy.exc import OperationalError, IntegrityError 
 
 booking_bp = Blueprint('booking', __name__, url_prefix='/api')
 
 
+# 내 예약 목록 응답 필드 -> (조회할 컬럼, 값 변환 함수)
+MY_BOOKING_FIELDS = {
+    "id": (Booking.id, None),
+    "space_id": (Booking.space_id, None),
+    "date": (Booking.date, lambda v: v.isoformat()),
+    "startTime": (Booking.start_time, lambda v: v.strftime('%H:%M')),
+    "endTime": (Booking.end_time, lambda v: v.strftime('%H:%M')),
+    "room": (Space.name, None),
+    "location": (Space.location, None),
+    "applicant": (Booking.organizationName, None),
+    "phone": (Booking.phone, None),
+    "email": (Booking.email, None),
+    "eventName": (Booking.event_name, None),
+    "numPeople": (Booking.num_people, None),
+    "acUse": (Booking.ac_use, None),
+    "status": (Booking.status, None),
+    "cancelReason": (Booking.cancel_reason, None),
+    "organizationType": (Booking.organizationType, None),
+}
+MY_BOOKINGS_MAX_LIMIT = 100
+MY_BOOKINGS_DEFAULT_LIMIT = 20
+
+
+def _encode_cursor(booking_date, start_time, booking_id):
+    raw = json.dumps([booking_date.isoformat(), start_time.strftime('%H:%M:%S'), booking_id])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+        date_str, time_str, booking_id = json.loads(raw)
+        return (datetime.strptime(date_str, '%Y-%m-%d').date(),
+                datetime.strptime(time_str, '%H:%M:%S').time(),
+                int(booking_id))
+    except Exception:
+        raise ValueError("잘못된 cursor 입니다.")
+
+
+def _before_cursor(model, booking_date, start_time, booking_id):
+    """(date, start_time, id) 내림차순에서 커서 다음(더 과거)에 오는 예약 조건"""
+    return or_(
+        model.date < booking_date,
+        and_(model.date == booking_date, model.start_time < start_time),
+        and_(model.date == booking_date, model.start_time == start_time, model.id < booking_id)
+    )
+
+
+def _my_bookings_query(model, user_id, fields, cursor, limit):
+    """model(Booking 또는 BookingArchive) 에서 내 예약 목록 한 페이지를 조회하는 쿼리와 조회 컬럼"""
+    # 응답에 필요한 컬럼만 조회합니다. (정렬/커서용 컬럼은 항상 포함)
+    columns = [model.id, model.date, model.start_time]
+    columns += [archive_column(model, MY_BOOKING_FIELDS[name][0])
+                for name in fields if name not in ('id', 'date', 'startTime')]
+    query = db.session.query(*columns).filter(model.user_id == user_id)
+    if any(MY_BOOKING_FIELDS[name][0].class_ is Space for name in fields):
+        query = query.join(Space, model.space_id == Space.id)
+
+    if request.args.get('status'):
+        query = query.filter(model.status.in_(request.args['status'].split(',')))
+    if request.args.get('from'):
+        query = query.filter(model.date >= datetime.strptime(request.args['from'], '%Y-%m-%d').date())
+    if request.args.get('to'):
+        query = query.filter(model.date <= datetime.strptime(request.args['to'], '%Y-%m-%d').date())
+    if cursor:
+        query = query.filter(_before_cursor(model, *cursor))
+
+    query = query.order_by(model.date.desc(), model.start_time.desc(), model.id.desc())
+    if limit is not None:
+        # 다음 페이지가 있는지 알기 위해 한 건 더 조회합니다.
+        query = query.limit(limit + 1)
+    return query, columns
+
+
 @booking_bp.route("/bookings/my", methods=['GET'])
+@use_replica
 @jwt_required()
 def get_my_bookings():
+    """
+    내 예약 목록 (최신순)
+
+    쿼리 파라미터 (모두 선택)
+        limit   한 페이지 크기 (1 ~ 100, cursor 만 주면 20). limit 또는 cursor 를 주면 {"items": [...], "nextCursor": ...} 형태로 응답합니다.
+        cursor  이전 응답의 nextCursor
+        status  상태 필터 (쉼표로 여러 개, 예: 확정,확정대기)
+        from, to  날짜 범위 (YYYY-MM-DD, 포함)
+        fields  응답에 포함할 필드 (쉼표로 여러 개, 예: id,date,startTime,room,status)
+    """
     current_user_id = get_jwt_identity()
     try:
-        bookings_query = db.session.query(Booking, Space)\
-            .join(Space, Booking.space_id == Space.id)\
-            .filter(Booking.user_id == current_user_id)\
-            .order_by(Booking.date.desc(), Booking.start_time.desc())\
-            .all()
-
+        limit = request.args.get('limit')
+        cursor = request.args.get('cursor')
+        paginated = limit is not None or cursor is not None
+        if limit is not None:
+            if not limit.isdigit() or not 1 <= int(limit) <= MY_BOOKINGS_MAX_LIMIT:
+                return jsonify({"error": f"limit 은 1 이상 {MY_BOOKINGS_MAX_LIMIT} 이하의 정수여야 합니다."}), 400
+            limit = int(limit)
+        elif paginated:
+            limit = MY_BOOKINGS_DEFAULT_LIMIT
+
+        fields = list(MY_BOOKING_FIELDS)
+        if request.args.get('fields'):
+            fields = [name.strip() for name in request.args['fields'].split(',') if name.strip()]
+            unknown = [name for name in fields if name not in MY_BOOKING_FIELDS]
+            if unknown:
+                return jsonify({"error": f"알 수 없는 필드입니다: {', '.join(unknown)}"}), 400
+
+        cursor = _decode_cursor(cursor) if cursor else None
+        page_limit = limit if paginated else None
+
+        # 지난 예약은 booking_archive 로 옮겨지므로(app/archive.py) 두 테이블에서 같은 조건으로 조회해 합칩니다.
+        # 예약 ID 는 보관 후에도 그대로이므로 (date, start_time, id) 정렬과 커서는 두 테이블에 똑같이 적용됩니다.
+        query, columns = _my_bookings_query(Booking, current_user_id, fields, cursor, page_limit)
+        rows = query.all()
+        archived_query, _ = _my_bookings_query(BookingArchive, current_user_id, fields, cursor, page_limit)
+        archived_rows = archived_query.all()
+        if archived_rows:
+            rows = sorted(rows + archived_rows, key=lambda row: (row[1], row[2], row[0]), reverse=True)
+
+        next_cursor = None
+        if paginated and len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = _encode_cursor(last[1], last[2], last[0])
+
+        keys = [column.key for column in columns]
         results = []
-        for booking, space in bookings_query:
-            results.append({
-                "id": booking.id,
-                "space_id": booking.space_id,
-                "date": booking.date.isoformat(), 
-                "startTime": booking.start_time.strftime('%H:%M'),
-                "endTime": booking.end_time.strftime('%H:%M'), 
-                "room": space.name,
-                "location": space.location,
-                "applicant": booking.organizationName,
-                "phone": booking.phone,
-                "email": booking.email,
-                "eventName": booking.event_name,
-                "numPeople": booking.num_people,
-                "acUse": booking.ac_use,
-                "status": booking.status,
-                "cancelReason": booking.cancel_reason,
-                "organizationType": booking.organizationType 
-            })
+        for row in rows:
+            values = dict(zip(keys, row))
+            item = {}
+            for name in fields:
+                column, formatter = MY_BOOKING_FIELDS[name]
+                value = values[column.key]
+                item[name] = formatter(value) if formatter and value is not None else value
+            results.append(item)
+
+        if paginated:
+            return jsonify({"items": results, "nextCursor": next_cursor}), 200
         return jsonify(results), 200
+    except ValueError as e:
+        return jsonify({"error": "잘못된 요청 파라미터입니다.", "details": str(e)}), 400
     except Exception as e:
         return jsonify({"error": "예약 내역 조회 중 오류 발생", "details": str(e)}), 500
 
 
+def _build_booking(data, user_id, space_id):
+    return Booking(
+        user_id=user_id,
+        space_id=space_id,
+        date=data.get('date'), 
+        start_time=data.get('startTime'), 
+        end_time=data.get('endTime'), 
+        organizationType=data.get('organizationType'),
+        organizationName=data.get('applicant'),
+        phone=data.get('phone'),
+        email=data.get('email'),
+        event_name=data.get('eventName'),
+        num_people=data.get('numPeople'),
+        ac_use=data.get('acUse'),
+        status=data.get('status', '확정대기')
+    )
+
+
+def _conflict_response(conflicting_booking):
+    response = {"error": "해당 시간대에 이미 다른 예약이 존재합니다."}
+    if conflicting_booking:
+        response["details"] = f"기존 예약: {conflicting_booking.start_time.strftime('%H:%M')}~{conflicting_booking.end_time.strftime('%H:%M')}"
+    return jsonify(response), 409
+
+
 @booking_bp.route("/bookings", methods=['POST'])
 @jwt_required()
 def create_booking():
@@ -73,53 +216,56 @@ def create_booking():
         except ValueError:
             return jsonify({"error": "잘못된 날짜 또는 시간 형식입니다. (YYYY-MM-DD, HH:MM)"}), 400
 
+        # 슬롯 점유(booking_slot)와 점유 요약(space_day_occupancy)이 같은 슬롯을 가리키도록 10분 단위만 받습니다.
+        if not is_slot_aligned(start_obj) or not is_slot_aligned(end_obj):
+            return jsonify({"error": f"예약 시간은 {SLOT_MINUTES}분 단위여야 합니다. (예: 09:00, 09:10)"}), 400
+
     except Exception as e:
         return jsonify({"error": "입력 데이터 파싱 중 오류 발생", "details": str(e)}), 400
 
 
-    #  락 사용한 트랜잭션 처리 
+    # 중복 예약 감지 전략: 'lock' (Space 행 락) / 'slot_claim' (슬롯 점유 고유 키)
+    strategy = current_app.config.get('BOOKING_CONFLICT_STRATEGY', 'lock')
+
     try:
-       
-        locked_space = db.session.query(Space).filter_by(id=space.id).with_for_update().first()
-        
-        if not locked_space:
-            raise Exception("Space 리소스를 찾을 수 없거나 락을 걸 수 없습니다.")
-
-         # 락을 획득한 상태에서 중복 예약을 검사합
-        conflicting_booking = db.session.query(Booking).filter(
-            Booking.space_id == locked_space.id,
-            Booking.date == date_obj, 
-            Booking.status != '취소',
-            and_(
-                Booking.start_time < end_obj,   
-                Booking.end_time > start_obj    
-            )
-        ).first() 
-
-        if conflicting_booking:
-            # 중복이 발견되면 롤백하고 락 해제
+        if strategy == 'slot_claim':
+            # 락 없이 예약을 넣고, 슬롯 점유 INSERT 의 고유 키 위반으로 중복을 감지합니다.
+            new_booking = _build_booking(data, current_user_id, space.id)
+            db.session.add(new_booking)
+        else:
+            #  락 사용한 트랜잭션 처리 
+            locked_space = db.session.query(Space).filter_by(id=space.id).with_for_update().first()
+            
+            if not locked_space:
+                raise Exception("Space 리소스를 찾을 수 없거나 락을 걸 수 없습니다.")
+
+             # 락을 획득한 상태에서 중복 예약을 검사합
+            conflicting_booking = db.session.query(Booking).filter(
+                Booking.space_id == locked_space.id,
+                Booking.date == date_obj, 
+                Booking.status != '취소',
+                and_(
+                    Booking.start_time < end_obj,   
+                    Booking.end_time > start_obj    
+                )
+            ).first() 
+
+            if conflicting_booking:
+                # 중복이 발견되면 롤백하고 락 해제
+                db.session.rollback()
+                return _conflict_response(conflicting_booking)
+            
+            new_booking = _build_booking(data, current_user_id, locked_space.id)
+            db.session.add(new_booking)
+
+        db.session.flush()
+        try:
+            claim_booking_slots(new_booking)
+        except IntegrityError:
             db.session.rollback()
-            return jsonify({
-                "error": "해당 시간대에 이미 다른 예약이 존재합니다.",
-                "details": f"기존 예약: {conflicting_booking.start_time.strftime('%H:%M')}~{conflicting_booking.end_time.strftime('%H:%M')}"
-            }), 409
-        
-        new_booking = Booking(
-            user_id=current_user_id,
-            space_id=locked_space.id,
-            date=date_str, 
-            start_time=start_time_str, 
-            end_time=end_time_str, 
-            organizationType=data.get('organizationType'),
-            organizationName=data.get('applicant'),
-            phone=data.get('phone'),
-            email=data.get('email'),
-            event_name=data.get('eventName'),
-            num_people=data.get('numPeople'),
-            ac_use=data.get('acUse'),
-            status=data.get('status', '확정대기')
-        )
-        db.session.add(new_booking)
+            return _conflict_response(find_conflicting_booking(space.id, date_obj, start_obj, end_obj))
+
+        occupy_day_slots(new_booking)
         
         # DB에 최종 반영하고 락을 해제
         db.session.commit()
@@ -152,6 +298,8 @@ def cancel_booking(booking_id):
 
         booking.status = '취소'
         booking.cancel_reason = '사용자 요청' 
+        release_booking_slots(booking)
+        release_day_slots(booking)
         
         db.session.commit()
         
@@ -215,8 +363,7 @@ def check_in_booking():
         return jsonify({"error": "잘못된 space_id 형식입니다."}), 400
 
     
-    kst = pytz.timezone('Asia/Seoul')
-    current_time_kst = datetime.now(kst)
+    current_time_kst = kst_now()
     current_date_obj = current_time_kst.date() 
     current_time_obj = current_time_kst.time() 
     
@@ -225,7 +372,10 @@ def check_in_booking():
    
 
     try:
-        booking = Booking.query.filter(
+        # 예약과 장소를 한 번의 JOIN 쿼리로 가져옵니다. (사용자 이름은 current_user 캐시 사용)
+        booking = Booking.query.options(
+            joinedload(Booking.space)
+        ).filter(
             Booking.user_id == current_user_id,
             Booking.space_id == space_id,
             Booking.date == current_date_obj 
@@ -235,14 +385,12 @@ def check_in_booking():
             return jsonify({"error": f"오늘({current_date_obj.isoformat()}) 해당 장소({space_id})에 대한 예약 내역이 없습니다."}), 404
 
         
-        space = booking.space 
+        fence = get_fence(booking.space, get_data_version(SPACE_CATALOG))
         
-        if space.latitude and space.longitude:
-            user_location = (user_lat, user_lng)
-            space_location = (space.latitude, space.longitude)
-            distance = geodesic(user_location, space_location).meters
+        if fence is not None:
+            inside, distance = fence.check(user_lat, user_lng, GPS_THRESHOLD_METERS)
             
-            if distance > GPS_THRESHOLD_METERS:
+            if not inside:
                 return jsonify({
                     "error": "체크인 실패: 현재 위치가 예약 장소와 너무 멉니다.",
                     "details": f"현재 거리: {int(distance)}m (허용 반경: {GPS_THRESHOLD_METERS}m)"
@@ -252,7 +400,7 @@ def check_in_booking():
         if booking.status == '이용중' or booking.check_in_time:
             return jsonify({
                 "message": "이미 체크인되었습니다.",
-                "user_name": booking.user.username,
+                "user_name": current_user.username,
                 "space_name": booking.space.name,
                 "start_time": booking.start_time.strftime('%H:%M'), 
                 "end_time": booking.end_time.strftime('%H:%M')   
@@ -275,7 +423,7 @@ def check_in_booking():
 
         return jsonify({
             "message": "체크인 완료",
-            "user_name": booking.user.username,
+            "user_name": current_user.username,
             "space_name": booking.space.name,
             "start_time": booking.start_time.strftime('%H:%M'), 
             "end_time": booking.end_time.strftime('%H:%M')   
@@ -0,0 +1,34 @@
+from flask import Blueprint, jsonify
+from app import db
+from app.db_routing import pool_stats
+from sqlalchemy import text
+
+health_bp = Blueprint('health', __name__, url_prefix='/api')
+
+
+@health_bp.route("/health", methods=['GET'])
+def get_health():
+    """
+    DB 연결 확인과 연결 풀 사용 현황 (주 DB, 복제본)
+    주 DB 에 연결할 수 없으면 503, 복제본만 실패하면 200 (status: degraded)
+    """
+    databases = {}
+    for key, engine in db.engines.items():
+        name = 'primary' if key is None else key
+        # 확인용 연결을 빌리기 전의 풀 상태
+        stats = pool_stats(engine)
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            databases[name] = {"ok": True}
+        except Exception as e:
+            databases[name] = {"ok": False, "details": str(e)}
+        databases[name]["pool"] = stats
+
+    if not databases['primary']["ok"]:
+        status, code = "down", 503
+    elif all(result["ok"] for result in databases.values()):
+        status, code = "ok", 200
+    else:
+        status, code = "degraded", 200
+    return jsonify({"status": status, "databases": databases}), code
@@ -0,0 +1,17 @@
+from flask import Blueprint, current_app, jsonify, request
+from app.metrics import metrics, CONTENT_TYPE
+import hmac
+
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.route("/metrics", methods=['GET'])
+def get_metrics():
+    """Prometheus 수집용 측정값 (텍스트 형식)"""
+    token = current_app.config.get('METRICS_TOKEN')
+    if token:
+        supplied = request.headers.get('Authorization', '')
+        if not hmac.compare_digest(supplied.encode(), f"Bearer {token}".encode()):
+            return jsonify({"error": "인증이 필요합니다."}), 401
+
+    return current_app.response_class(metrics.render(), mimetype=None, content_type=CONTENT_TYPE)
@@ -1,32 +1,34 @@
-from flask import Blueprint
-from app import mail, scheduler, db
-from app.models import Booking, User, Space
+from flask import Blueprint, current_app
+from app import scheduler, db
+from app.models import Booking, NotificationLog, Outbox
+from app.mailer import deliver_batch
+from app.outbox import enqueue_message
+from app.leader import leader_only
+from app.metrics import metrics
+from app.clock import kst_now
 from flask_mail import Message
-from datetime import datetime, timedelta, time
-import pytz
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from sqlalchemy.orm import joinedload
+from sqlalchemy.sql import and_, or_
 
 notification_bp = Blueprint('notification', __name__, url_prefix='/api')
 
-# 실제 이메일을 발송하는 함수
-def send_reminder_email(booking, app):
+# 알림 메일 메시지를 만드는 함수
+def build_reminder_message(booking):
     """
-    백그라운드 스레드에서 실행되므로, app context를 명시적으로 받아야 합니다.
+    예약 10분 전 알림 메일을 만듭니다. (booking.space 는 미리 로드되어 있어야 합니다)
     """
-    with app.app_context():
-        try:
-            
-            recipient_email = booking.email
-            user_name = booking.organizationName
-            space_name = booking.space.name
-            start_time_str = booking.start_time.strftime('%H:%M') 
-
-            msg = Message(
-                subject=f"[INHA-DECOM] 예약 알림: {space_name} ({start_time_str})",
-                recipients=[recipient_email]
-            )
-            
-            msg.body = f"""
-            안녕하세요, {user_name}님.
+    space_name = booking.space.name
+    start_time_str = booking.start_time.strftime('%H:%M') 
+
+    msg = Message(
+        subject=f"[INHA-DECOM] 예약 알림: {space_name} ({start_time_str})",
+        recipients=[booking.email]
+    )
+    
+    msg.body = f"""
+            안녕하세요, {booking.organizationName}님.
             INHA-DECOM 예약 시스템입니다.
 
             잠시 후 {start_time_str}에 예약하신 '{space_name}' 이용 시간이 시작됩니다.
@@ -40,57 +42,178 @@ def send_reminder_email(booking, app):
             
             감사합니다.
             """
-            
-            mail.send(msg)
-            print(f"[SUCCESS] 알림 메일 발송 성공: {recipient_email} (예약 ID: {booking.id})")
+    return msg
 
-        except Exception as e:
-            print(f"[ERROR] 알림 메일 발송 실패: {str(e)} (예약 ID: {booking.id})")
+
+REMINDER_KIND = 'reminder_10m'
+REMINDER_LEAD = timedelta(minutes=10)
+
+
+def _starts_within(lower, upper):
+    """
+    예약 시작 시각(date + start_time)이 (lower, upper] 구간에 있는 조건.
+    자정을 넘는 구간도 처리합니다.
+    """
+    lower_date, lower_time = lower.date(), lower.time()
+    upper_date, upper_time = upper.date(), upper.time()
+
+    if lower_date == upper_date:
+        return and_(
+            Booking.date == lower_date,
+            Booking.start_time > lower_time,
+            Booking.start_time <= upper_time
+        )
+    return or_(
+        and_(Booking.date == lower_date, Booking.start_time > lower_time),
+        and_(Booking.date > lower_date, Booking.date < upper_date),
+        and_(Booking.date == upper_date, Booking.start_time <= upper_time)
+    )
+
+
+def _claim_expired_before():
+    """이 시각(UTC) 이전에 선점되고 아직 발송 시각이 없는 알림은 선점한 실행이 중간에 멈춘 것으로 봅니다."""
+    return datetime.utcnow() - timedelta(seconds=current_app.config.get('REMINDER_CLAIM_TIMEOUT', 300))
+
+
+def find_due_reminders(now):
+    """
+    아직 시작하지 않았고 10분 안에 시작하는 예약 중, 알림 기록이 없는 예약을 한 번의 쿼리로 찾습니다.
+
+    정확히 10분 뒤 1분만 보지 않고 (now, now+10분] 전체를 보므로, 스케줄러가 몇 분 늦게 돌거나
+    재시작되어도 아직 시작하지 않은 예약은 알림을 받습니다. 마지막 실행 시각은 따로 기록하지 않으므로,
+    스케줄러가 멈춘 사이에 이미 시작한 예약에는 (늦은 알림이 의미가 없으므로) 알림을 보내지 않습니다.
+    """
+    in_outbox = db.session.query(Outbox.id).filter(
+        Outbox.booking_id == Booking.id,
+        Outbox.kind == REMINDER_KIND
+    ).exists()
+    # 발송했거나, 발송 중이거나(선점 후 REMINDER_CLAIM_TIMEOUT 이내), 아웃박스 워커에 넘긴 알림
+    already_notified = db.session.query(NotificationLog.id).filter(
+        NotificationLog.booking_id == Booking.id,
+        NotificationLog.kind == REMINDER_KIND,
+        or_(
+            NotificationLog.sent_at.isnot(None),
+            NotificationLog.created_at >= _claim_expired_before(),
+            in_outbox
+        )
+    ).exists()
+
+    return Booking.query.options(joinedload(Booking.space)).filter(
+        _starts_within(now, now + REMINDER_LEAD),
+        Booking.status.in_(['확정', '확정대기']), # 확정대기는 나중에 제외
+        ~already_notified
+    ).order_by(Booking.date, Booking.start_time).all()
+
+
+def _insert_ignore(table):
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        return insert(table).prefix_with('IGNORE')
+    if dialect == 'sqlite':
+        return insert(table).prefix_with('OR IGNORE')
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    return pg_insert(table).on_conflict_do_nothing()
+
+
+def _claim_reminder(booking_id, claimed_at, expired_before):
+    """알림 한 건을 선점합니다. 다른 실행이 이미 선점했거나 발송했으면 False 를 반환합니다."""
+    inserted = db.session.execute(_insert_ignore(NotificationLog.__table__).values(
+        booking_id=booking_id, kind=REMINDER_KIND, created_at=claimed_at
+    ))
+    if inserted.rowcount == 1:
+        return True
+
+    # 선점한 실행이 발송 결과를 남기기 전에 멈춘 알림은 선점 시각을 바꿔 다시 가져옵니다.
+    reclaimed = NotificationLog.query.filter(
+        NotificationLog.booking_id == booking_id,
+        NotificationLog.kind == REMINDER_KIND,
+        NotificationLog.sent_at.is_(None),
+        NotificationLog.created_at < expired_before
+    ).update({NotificationLog.created_at: claimed_at}, synchronize_session=False)
+    return reclaimed == 1
+
+
+def claim_reminders(bookings, use_outbox=False):
+    """
+    발송 전에 알림 기록을 먼저 커밋하여 선점하고, 이번 실행이 선점한 예약 목록을 반환합니다.
+    use_outbox=True 이면 같은 트랜잭션에서 선점한 알림 메일을 아웃박스에 넣습니다.
+
+    예약마다 고유 키 위반을 무시하는 INSERT 로 선점하므로, 다른 실행이 이미 선점한 예약만 빠지고
+    나머지 예약은 그대로 발송됩니다.
+    """
+    claimed_at = datetime.utcnow()
+    expired_before = _claim_expired_before()
+    claimed = [booking for booking in bookings if _claim_reminder(booking.id, claimed_at, expired_before)]
+    if use_outbox:
+        for booking in claimed:
+            enqueue_message(build_reminder_message(booking), REMINDER_KIND, booking_id=booking.id)
+    db.session.commit()
+    return claimed
+
+
+def finish_reminders(sent_ids, failed_ids):
+    """발송 성공한 알림은 발송 시각을 기록하고, 실패한 알림은 선점을 풀어 다음 실행에서 다시 시도합니다."""
+    if sent_ids:
+        NotificationLog.query.filter(
+            NotificationLog.booking_id.in_(sent_ids),
+            NotificationLog.kind == REMINDER_KIND
+        ).update({NotificationLog.sent_at: datetime.utcnow()}, synchronize_session=False)
+    if failed_ids:
+        NotificationLog.query.filter(
+            NotificationLog.booking_id.in_(failed_ids),
+            NotificationLog.kind == REMINDER_KIND
+        ).delete(synchronize_session=False)
+    db.session.commit()
 
 
 # 스케줄러가 1분마다 실행할 작업 함수 
 def check_upcoming_bookings():
     """
-    1분마다 실행되며, 정확히 10분 뒤에 시작하는 예약을 찾아 메일을 발송합니다.
+    1분마다 실행되며, 10분 안에 시작하는 예약 중 아직 알림을 받지 않은 예약에 메일을 발송합니다.
     """
     
     
     app = scheduler.app
     with app.app_context():
         
-        kst = pytz.timezone('Asia/Seoul')
-        now = datetime.now(kst)
-        
-        
-        target_datetime = now + timedelta(minutes=10)
-        target_date_obj = target_datetime.date()
-        
-        target_time_obj = target_datetime.time().replace(second=0, microsecond=0)
+        # DB의 날짜/시간은 KST 기준 naive 값입니다.
+        now = kst_now().replace(tzinfo=None)
 
         try:
-            
-            upcoming_bookings = Booking.query.join(Space).filter(
-                Booking.date == target_date_obj,
-                Booking.start_time == target_time_obj,
-                Booking.status.in_(['확정', '확정대기']) # 확정대기는 나중에 제외
-                
-            ).all()
-
-            if upcoming_bookings:
-                print(f"[{now.strftime('%H:%M')}] {len(upcoming_bookings)}개의 예약 알림 발송 시작... (타겟: {target_date_obj} {target_time_obj})")
-                for booking in upcoming_bookings:
-                    
-                    send_reminder_email(booking, app)
-            
-            # 디버깅용
-            else:
-               print(f"[{now.strftime('%H:%M')}] 알림 대상 예약 없음. (타겟: {target_date_obj} {target_time_obj})")
+            upcoming_bookings = find_due_reminders(now)
+
+            if not upcoming_bookings:
+                # 디버깅용
+                print(f"[{now.strftime('%H:%M')}] 알림 대상 예약 없음. (구간: {now.strftime('%H:%M:%S')} ~ {(now + REMINDER_LEAD).strftime('%H:%M:%S')})")
+                return
+
+            use_outbox = app.config.get('NOTIFICATION_DELIVERY') == 'outbox'
+            claimed = claim_reminders(upcoming_bookings, use_outbox=use_outbox)
+            if len(claimed) < len(upcoming_bookings):
+                print(f"[{now.strftime('%H:%M')}] {len(upcoming_bookings) - len(claimed)}개의 예약 알림은 다른 실행이 이미 처리 중입니다.")
+            if not claimed:
+                return
+            upcoming_bookings = claimed
+
+            if use_outbox:
+                # 발송은 아웃박스 워커가 합니다.
+                print(f"[{now.strftime('%H:%M')}] {len(upcoming_bookings)}개의 예약 알림을 아웃박스에 넣었습니다.")
+                return
+
+            print(f"[{now.strftime('%H:%M')}] {len(upcoming_bookings)}개의 예약 알림 발송 시작...")
+            messages = [(booking.id, build_reminder_message(booking)) for booking in upcoming_bookings]
+            report = deliver_batch(app, messages)
+
+            finish_reminders(report.sent, report.failed)
 
         except Exception as e:
+            db.session.rollback()
             print(f"[ERROR] 스케줄러 작업 중 오류 발생: {str(e)}")
 
 
 @scheduler.task('interval', id='check_bookings_job', minutes=1, misfire_grace_time=900)
+@leader_only
+@metrics.timed_job('check_bookings_job')
 def scheduled_job():
-    """APScheduler가 1분마다 이 함수를 실행합니다."""
+    """APScheduler가 1분마다 이 함수를 실행합니다. (여러 프로세스 중 리더에서만 실행)"""
     check_upcoming_bookings()
\ No newline at end of file
@@ -1,123 +1,168 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, current_app
 from app import db
-from app.models import Space, Booking 
+from app.models import Space, Booking, SpaceDayOccupancy
+from app.occupancy import occupancy_from_summary, day_version, month_version, date_version
+from app.versions import get_data_version, SPACE_CATALOG
+from app.etag import make_etag, not_modified, set_etag
+from app.cache import availability_cache
+from app.permissions import admin_required
+from app.slots import SLOT_COUNT, SLOT_LABELS
+from app.json_provider import json_bytes
+from app.db_routing import use_replica
 import calendar 
-from sqlalchemy.sql import extract, and_ 
-from datetime import datetime, time 
+from sqlalchemy.sql import and_ 
+from datetime import datetime, date 
 
 space_bp = Blueprint('space', __name__, url_prefix='/api')
 
 def get_all_10_min_slots():
     """
-    07:00 부터 21:50 까지 10분 단위 시간표(총 89개 슬롯)를 생성합니다.
+    07:00 부터 21:50 까지 10분 단위 시간표를 생성합니다.
     """
-    slots = {}
-    for h in range(7, 22): 
-        for m in range(0, 60, 10): 
-            if h == 21 and m > 50:
-                break
-            slot_key = f"{str(h).zfill(2)}:{str(m).zfill(2)}"
-            slots[slot_key] = True 
-    return slots
-
-def _calculate_booked_slots_count(bookings_for_day, all_slots_template):
+    return dict.fromkeys(SLOT_LABELS, True)
+
+
+def month_date_range(year, month):
     """
-    특정 날짜의 예약 리스트를 받아, 몇 개의 10분 슬롯이 찼는지 계산합니다.
-    (bookings_for_day의 예약은 time 객체를 가지고 있습니다)
+    해당 월의 반열린 날짜 범위 [1일, 다음 달 1일) 를 반환합니다.
     """
-    if not bookings_for_day:
-        return 0
-    
-    time_slot_status = dict(all_slots_template) 
-    
-    # 문자열 슬롯과 time 객체를 비교하기 위해, 슬롯 문자열을 time 객체로 변환하며 비교
-    for slot_time_str in time_slot_status:
-        try:
-            slot_time_obj = datetime.strptime(slot_time_str, '%H:%M').time()
-        except ValueError:
-            continue 
-            
-        for booking in bookings_for_day:
-            if slot_time_obj >= booking.start_time and slot_time_obj < booking.end_time:
-                time_slot_status[slot_time_str] = False 
-                break 
+    month_start = date(year, month, 1)
+    if month == 12:
+        return month_start, date(year + 1, 1, 1)
+    return month_start, date(year, month + 1, 1)
 
-    booked_count = sum(1 for status in time_slot_status.values() if not status)
-    return booked_count
 
 
-def _calculate_period_status(bookings_for_day, all_slots_template):
-    """
-    오전(07:00-12:00), 오후(12:00-17:00), 저녁(17:00-22:00)의
-    예약 상태(available, partial, booked)를 계산합니다.
-    """
-    periods = {
-        "morning": {"start": time(7, 0), "end": time(12, 0), "total_slots": 0, "booked_slots": 0},
-        "afternoon": {"start": time(12, 0), "end": time(17, 0), "total_slots": 0, "booked_slots": 0},
-        "evening": {"start": time(17, 0), "end": time(22, 0), "total_slots": 0, "booked_slots": 0}
-    }
-    
-    
-    for slot_str in all_slots_template:
-        slot_time = datetime.strptime(slot_str, '%H:%M').time()
-        for period, data in periods.items():
-            if data["start"] <= slot_time < data["end"]:
-                data["total_slots"] += 1
-                break
-                
-    
-    if bookings_for_day:
-        for slot_str in all_slots_template:
-            slot_time = datetime.strptime(slot_str, '%H:%M').time()
-            is_booked = False
-            for booking in bookings_for_day:
-                if booking.start_time <= slot_time < booking.end_time:
-                    is_booked = True
-                    break
-            
-            if is_booked:
-                for period, data in periods.items():
-                    if data["start"] <= slot_time < data["end"]:
-                        data["booked_slots"] += 1
-                        break
+def _build_monthly_availability(room_id, year, month):
+    total_slots_count = SLOT_COUNT
+
+    # extract(year/month) 대신 [이번 달 1일, 다음 달 1일) 범위로 조회해야 인덱스를 탈 수 있습니다.
+    month_start, next_month_start = month_date_range(year, month)
+
+    # 예약 변경 시 갱신되는 장소/날짜별 요약 테이블에서 최대 31행만 읽습니다.
+    summaries = SpaceDayOccupancy.query.filter(
+        SpaceDayOccupancy.space_id == room_id,
+        SpaceDayOccupancy.date >= month_start,
+        SpaceDayOccupancy.date < next_month_start
+    ).all()
+    summary_by_day = {summary.date: summary for summary in summaries}
+
+    availability_data = {}
+    num_days_in_month = calendar.monthrange(year, month)[1]
+
+    for day in range(1, num_days_in_month + 1):
+        date_obj = datetime(year, month, day).date()
+        date_key = date_obj.isoformat() 
+        
+        occupancy = occupancy_from_summary(summary_by_day.get(date_obj))
+        booked_count = occupancy.booked_count
+        
+        period_status = occupancy.period_status()
+        
+        percentage = 0.0
+        status = "available"
+        
+        if booked_count > 0:
+            percentage = round(booked_count / total_slots_count, 2)
+            if booked_count >= total_slots_count:
+                status = "booked"
+                percentage = 1.0
+            else:
+                status = "partial"
+        
+        availability_data[date_key] = {
+            "status": status,
+            "percentage": percentage,
+            "period_status": period_status 
+        }
+
+    return availability_data
+
+
+def _build_daily_availability(room_id, date_obj):
+    summary = db.session.get(SpaceDayOccupancy, (room_id, date_obj))
+    return occupancy_from_summary(summary).slot_map()
 
+
+def _build_available_spaces(date_obj, start_obj, end_obj):
+    conflicting_bookings_query = db.session.query(Booking.space_id)\
+        .filter(
+            Booking.date == date_obj, 
+            Booking.status != '취소',
+            and_(
+                Booking.start_time < end_obj,  
+                Booking.end_time > start_obj   
+            )
+        )\
+        .distinct()
+
+    conflicting_space_ids = [b[0] for b in conflicting_bookings_query.all()]
+
+    available_spaces = Space.query.filter(
+        Space.id.notin_(conflicting_space_ids)
+    ).all()
     
-    result = {}
-    for period, data in periods.items():
-        if data["booked_slots"] == 0:
-            result[period] = "available"
-        elif data["total_slots"] > 0 and data["booked_slots"] >= data["total_slots"]:
-            result[period] = "booked"
-        elif data["booked_slots"] > 0:
-            result[period] = "partial"
-        else: 
-            result[period] = "available"
-            
-    return result
+    results = []
+    for space in available_spaces:
+        results.append({
+            "id": space.id,
+            "name": space.name,
+            "category": space.category,
+            "subCategory": space.subCategory,
+            "location": space.location,
+            "capacity": space.capacity
+        })
+    return results
+
 
+# (장소 목록 버전, 직렬화된 JSON 본문)
+_space_catalog = (None, None)
+
+
+def _space_catalog_body(version):
+    """
+    장소 목록 JSON 본문(bytes). 장소 목록 버전(seed.py 가 올림)이 바뀔 때만 다시 만듭니다.
+    """
+    global _space_catalog
+    cached_version, body = _space_catalog
+    if cached_version == version:
+        return body
+
+    spaces = db.session.query(
+        Space.id, Space.name, Space.category, Space.subCategory, Space.location, Space.capacity
+    ).order_by(Space.id).all()
+    body = json_bytes([{
+        "id": space.id,
+        "name": space.name,
+        "category": space.category,
+        "subCategory": space.subCategory,
+        "location": space.location,
+        "capacity": space.capacity
+    } for space in spaces])
+    _space_catalog = (version, body)
+    return body
 
 
 @space_bp.route("/masters/spaces", methods=['GET'])
+@use_replica
 def get_master_spaces():
     try:
-        spaces = Space.query.all()
-        results = []
-        for space in spaces:
-            results.append({
-                "id": space.id,
-                "name": space.name,
-                "category": space.category,
-                "subCategory": space.subCategory,
-                "location": space.location,
-                "capacity": space.capacity
-            })
-        return jsonify(results), 200
+        catalog_version = get_data_version(SPACE_CATALOG)
+        etag = make_etag('spaces', catalog_version)
+        unchanged = not_modified(etag)
+        if unchanged:
+            return unchanged
+
+        body = _space_catalog_body(catalog_version)
+        response = current_app.response_class(body, mimetype=current_app.json.mimetype)
+        return set_etag(response, etag), 200
     except Exception as e:
         return jsonify({"error": "장소 목록 조회 중 오류 발생", "details": str(e)}), 500
 
 
 
 @space_bp.route("/availability/monthly", methods=['GET'])
+@use_replica
 def get_monthly_availability():
     try:
         room_id = request.args.get('roomId', type=int)
@@ -129,55 +174,22 @@ def get_monthly_availability():
         return jsonify({"error": "잘못된 파라미터 타입입니다."}), 400
 
     try:
-        all_slots_template = get_all_10_min_slots()
-        total_slots_count = len(all_slots_template)
-        if total_slots_count == 0:
-             return jsonify({"error": "슬롯 계산 오류"}), 500
-
-        bookings_in_month = Booking.query.filter(
-            Booking.space_id == room_id,
-            extract('year', Booking.date) == year,
-            extract('month', Booking.date) == month,
-            Booking.status != '취소'
-        ).all()
-
-        bookings_by_day = {}
-        for b in bookings_in_month:
-            date_key = b.date.isoformat()
-            if date_key not in bookings_by_day:
-                bookings_by_day[date_key] = []
-            bookings_by_day[date_key].append(b)
-
-        availability_data = {}
-        num_days_in_month = calendar.monthrange(year, month)[1]
-
-        for day in range(1, num_days_in_month + 1):
-            date_obj = datetime(year, month, day).date()
-            date_key = date_obj.isoformat() 
-            
-            day_bookings = bookings_by_day.get(date_key, [])
-            booked_count = _calculate_booked_slots_count(day_bookings, all_slots_template)
-            
-            period_status = _calculate_period_status(day_bookings, all_slots_template)
-            
-            percentage = 0.0
-            status = "available"
-            
-            if booked_count > 0:
-                percentage = round(booked_count / total_slots_count, 2)
-                if booked_count >= total_slots_count:
-                    status = "booked"
-                    percentage = 1.0
-                else:
-                    status = "partial"
-            
-            availability_data[date_key] = {
-                "status": status,
-                "percentage": percentage,
-                "period_status": period_status 
-            }
-            
-        return jsonify(availability_data), 200
+        month_start, next_month_start = month_date_range(year, month)
+        # ETag 와 캐시 키에 같은 DB 버전을 사용해야 본문이 항상 ETag 와 일치합니다. (여러 프로세스에서도)
+        # 버전은 본문보다 먼저, 같은 세션에서 읽습니다. (@use_replica 이면 둘 다 복제본에서 읽으므로
+        # 본문이 버전보다 오래될 수 없습니다)
+        versions = [get_data_version(SPACE_CATALOG), month_version(room_id, month_start, next_month_start)]
+        etag = make_etag('monthly', versions[0], room_id, f"{year}-{month:02d}", versions[1])
+        unchanged = not_modified(etag)
+        if unchanged:
+            return unchanged
+
+        availability_data = availability_cache.get_or_compute(
+            f"monthly:{room_id}:{year}-{month:02d}",
+            versions,
+            lambda: _build_monthly_availability(room_id, year, month)
+        )
+        return set_etag(jsonify(availability_data), etag), 200
 
     except Exception as e:
         return jsonify({"error": "월별 현황 조회 중 오류 발생", "details": str(e)}), 500
@@ -185,6 +197,7 @@ def get_monthly_availability():
 
 #  API 3: 일별 현황 (시간표) 
 @space_bp.route("/availability/daily", methods=['GET'])
+@use_replica
 def get_daily_availability():
     try:
         room_id = request.args.get('roomId', type=int)
@@ -199,29 +212,25 @@ def get_daily_availability():
         return jsonify({"error": "잘못된 파라미터 타입 또는 날짜 형식입니다."}), 400
 
     try:
-        time_slot_status = get_all_10_min_slots() 
-        
-        bookings = Booking.query.filter(
-            Booking.space_id == room_id,
-            Booking.date == date_obj,
-            Booking.status != '취소'
-        ).all()
-
-        if bookings:
-            for slot_time_str in time_slot_status:
-                slot_time_obj = datetime.strptime(slot_time_str, '%H:%M').time()
-                for booking in bookings:
-                    if slot_time_obj >= booking.start_time and slot_time_obj < booking.end_time:
-                        time_slot_status[slot_time_str] = False
-                        break 
-                        
-        return jsonify(time_slot_status), 200
+        versions = [get_data_version(SPACE_CATALOG), day_version(room_id, date_obj)]
+        etag = make_etag('daily', versions[0], room_id, date_obj.isoformat(), versions[1])
+        unchanged = not_modified(etag)
+        if unchanged:
+            return unchanged
+
+        time_slot_status = availability_cache.get_or_compute(
+            f"daily:{room_id}:{date_obj.isoformat()}",
+            versions,
+            lambda: _build_daily_availability(room_id, date_obj)
+        )
+        return set_etag(jsonify(time_slot_status), etag), 200
     except Exception as e:
         return jsonify({"error": "일별 현황 조회 중 오류 발생", "details": str(e)}), 500
 
 
 # API 4: 시간 우선 예약 (사용 가능한 장소 조회) 
 @space_bp.route("/spaces/available", methods=['GET'])
+@use_replica
 def get_available_spaces_for_time():
     try:
         date_str = request.args.get('date', type=str)
@@ -246,35 +255,21 @@ def get_available_spaces_for_time():
         return jsonify({"error": "잘못된 파라미터입니다.", "details": str(e)}), 400
     
     try:
-        conflicting_bookings_query = db.session.query(Booking.space_id)\
-            .filter(
-                Booking.date == date_obj, 
-                Booking.status != '취소',
-                and_(
-                    Booking.start_time < end_obj,  
-                    Booking.end_time > start_obj   
-                )
-            )\
-            .distinct()
-
-        conflicting_space_ids = [b[0] for b in conflicting_bookings_query.all()]
-
-        available_spaces = Space.query.filter(
-            Space.id.notin_(conflicting_space_ids)
-        ).all()
-        
-        results = []
-        for space in available_spaces:
-            results.append({
-                "id": space.id,
-                "name": space.name,
-                "category": space.category,
-                "subCategory": space.subCategory,
-                "location": space.location,
-                "capacity": space.capacity
-            })
+        # 결과는 그날의 모든 장소 예약과 장소 목록(seed.py, generate-data 가 바꿈)에 의존합니다.
+        results = availability_cache.get_or_compute(
+            f"available:{date_obj.isoformat()}:{start_obj.strftime('%H:%M')}-{end_obj.strftime('%H:%M')}",
+            [get_data_version(SPACE_CATALOG), date_version(date_obj)],
+            lambda: _build_available_spaces(date_obj, start_obj, end_obj)
+        )
 
         return jsonify(results), 200
 
     except Exception as e:
-        return jsonify({"error": "사용 가능한 장소 조회 중 오류 발생", "details": str(e)}), 500
\ No newline at end of file
+        return jsonify({"error": "사용 가능한 장소 조회 중 오류 발생", "details": str(e)}), 500
+
+
+@space_bp.route("/availability/cache-stats", methods=['GET'])
+@admin_required
+def get_availability_cache_stats():
+    """캐시 크기 조정을 위한 적중/미적중 통계 (관리자 전용)"""
+    return jsonify(availability_cache.stats()), 200
\ No newline at end of file
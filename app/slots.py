@@ -0,0 +1,136 @@
+"""
+10분 단위 예약 슬롯 엔진
+
+07:00 부터 21:50 까지의 10분 슬롯을 정수 비트마스크 한 개로 표현합니다.
+i번째 비트가 1이면 (07:00 + 10분 * i) 슬롯이 예약된 상태입니다.
+예약 한 건은 start/end 를 한 번만 분 단위로 변환해 연속된 비트 구간으로 바꾸고,
+하루치 예약은 그 마스크들을 OR 하여 하나의 정수로 합칩니다.
+"""
+
+SLOT_MINUTES = 10
+DAY_START_MINUTES = 7 * 60    # 07:00
+DAY_END_MINUTES = 22 * 60     # 22:00 (마지막 슬롯은 21:50)
+SLOT_COUNT = (DAY_END_MINUTES - DAY_START_MINUTES) // SLOT_MINUTES
+
+# 슬롯 인덱스 -> "HH:MM" 문자열
+SLOT_LABELS = tuple(
+    f"{str(m // 60).zfill(2)}:{str(m % 60).zfill(2)}"
+    for m in range(DAY_START_MINUTES, DAY_END_MINUTES, SLOT_MINUTES)
+)
+
+FULL_MASK = (1 << SLOT_COUNT) - 1
+
+
+def _range_mask(lo, hi):
+    """[lo, hi) 슬롯 인덱스 구간에 해당하는 비트마스크"""
+    if hi <= lo:
+        return 0
+    return ((1 << hi) - 1) ^ ((1 << lo) - 1)
+
+
+def _minutes_to_index(minutes):
+    return (minutes - DAY_START_MINUTES) // SLOT_MINUTES
+
+
+# 오전(07:00-12:00), 오후(12:00-17:00), 저녁(17:00-22:00)
+PERIODS = (
+    ("morning", _range_mask(0, _minutes_to_index(12 * 60))),
+    ("afternoon", _range_mask(_minutes_to_index(12 * 60), _minutes_to_index(17 * 60))),
+    ("evening", _range_mask(_minutes_to_index(17 * 60), SLOT_COUNT)),
+)
+
+
+def _popcount(mask):
+    return bin(mask).count("1")
+
+
+PERIOD_TOTALS = {name: _popcount(mask) for name, mask in PERIODS}
+
+
+def time_to_minutes(t):
+    return t.hour * 60 + t.minute
+
+
+def is_slot_aligned(t):
+    """t 가 10분 슬롯 경계(예: 09:00, 09:10)에 있는지 확인합니다."""
+    return time_to_minutes(t) % SLOT_MINUTES == 0 and not t.second and not t.microsecond
+
+
+def booking_mask(start_time, end_time):
+    """
+    예약 시간 [start_time, end_time) 에 걸치는 슬롯들의 비트마스크를 반환합니다.
+    슬롯 시각 s 에 대해 start_time <= s < end_time 이면 예약된 것으로 봅니다.
+    """
+    start = time_to_minutes(start_time) + (1 if start_time.second or start_time.microsecond else 0)
+    end = time_to_minutes(end_time) + (1 if end_time.second or end_time.microsecond else 0)
+
+    # 구간에 포함되는 첫 슬롯 / 포함되지 않는 첫 슬롯 (올림 나눗셈)
+    lo = -((DAY_START_MINUTES - start) // SLOT_MINUTES)
+    hi = -((DAY_START_MINUTES - end) // SLOT_MINUTES)
+
+    lo = max(lo, 0)
+    hi = min(hi, SLOT_COUNT)
+    return _range_mask(lo, hi)
+
+
+class DayOccupancy:
+    """
+    하루치 예약 점유 상태. 예약 건수와 무관하게 정수 한 개만 유지합니다.
+    """
+    __slots__ = ("mask",)
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    @classmethod
+    def from_bookings(cls, bookings):
+        occupancy = cls()
+        for booking in bookings:
+            occupancy.add(booking.start_time, booking.end_time)
+        return occupancy
+
+    def add(self, start_time, end_time):
+        self.mask |= booking_mask(start_time, end_time)
+        return self
+
+    @property
+    def booked_count(self):
+        return _popcount(self.mask)
+
+    def period_counts(self):
+        return {name: _popcount(self.mask & period_mask) for name, period_mask in PERIODS}
+
+    def period_status(self):
+        """
+        오전/오후/저녁 각각의 상태(available, partial, booked)를 계산합니다.
+        """
+        result = {}
+        for name, booked in self.period_counts().items():
+            result[name] = period_status_from_count(booked, PERIOD_TOTALS[name])
+        return result
+
+    def slot_map(self):
+        """
+        {"07:00": True, "07:10": False, ...} 형태의 일별 시간표 (True = 예약 가능)
+        """
+        mask = self.mask
+        return {label: not (mask >> i) & 1 for i, label in enumerate(SLOT_LABELS)}
+
+
+def period_status_from_count(booked, total):
+    if booked == 0:
+        return "available"
+    if total > 0 and booked >= total:
+        return "booked"
+    return "partial"
+
+
+def claim_slot_indexes(start_time, end_time):
+    """
+    예약이 걸치는 하루 전체(00:00 기준) 10분 슬롯 인덱스 범위.
+    booking_slot 테이블의 고유 키로 중복 예약을 막을 때 사용합니다.
+    시작/종료가 슬롯 경계에 있을 때(create_booking 에서 검사) booking_mask 와 같은 슬롯을 가리킵니다.
+    """
+    start = time_to_minutes(start_time)
+    end = time_to_minutes(end_time) + (1 if end_time.second or end_time.microsecond else 0)
+    return range(start // SLOT_MINUTES, -(-end // SLOT_MINUTES))
@@ -0,0 +1,94 @@
+"""
+사용자 정보 캐시 (JWT current_user)
+
+인증이 필요한 요청마다 토큰의 사용자(id, username)를 User 테이블에서 다시 읽지 않도록,
+프로세스 내 LRU + TTL 캐시에 담아 두고 Flask-JWT-Extended 의 current_user 로 제공합니다.
+
+User 행이 수정/삭제되면 커밋(또는 롤백) 직후 해당 사용자의 캐시를 지웁니다. (SQLAlchemy 세션 이벤트)
+프로세스마다 캐시가 따로 있으므로, 다른 프로세스의 변경은 최대 USER_CACHE_TTL 초 늦게 반영됩니다.
+
+설정 (config.Config)
+    USER_CACHE_TTL           캐시 유지 시간(초), 0 이면 캐시하지 않음
+    USER_CACHE_MAX_ENTRIES   최대 사용자 수 (LRU)
+"""
+from flask import jsonify
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import db
+from app.cache import MemoryCacheBackend, NullCacheBackend
+from app.models import User
+
+_PENDING_KEY = 'user_cache_invalidate'
+
+
+class CachedUser:
+    """current_user 로 쓰이는 읽기 전용 사용자 정보"""
+    __slots__ = ('id', 'username')
+
+    def __init__(self, id, username):
+        self.id = id
+        self.username = username
+
+    def __repr__(self):
+        return f"<CachedUser {self.id}>"
+
+
+class UserCache:
+
+    def __init__(self, app=None):
+        self.backend = NullCacheBackend()
+        self.ttl = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.ttl = app.config.get('USER_CACHE_TTL', 60)
+        if self.ttl > 0:
+            self.backend = MemoryCacheBackend(app.config.get('USER_CACHE_MAX_ENTRIES', 10000))
+        else:
+            self.backend = NullCacheBackend()
+
+    def get(self, user_id):
+        """사용자 정보를 반환합니다. 없는 사용자면 None (없는 결과는 캐시하지 않습니다)"""
+        user = self.backend.get(user_id)
+        if user is not None:
+            return user
+
+        row = db.session.query(User.id, User.username).filter(User.id == user_id).first()
+        if row is None:
+            return None
+        user = CachedUser(row.id, row.username)
+        self.backend.set(user_id, user, self.ttl)
+        return user
+
+    def invalidate(self, user_id):
+        self.backend.delete(user_id)
+
+
+user_cache = UserCache()
+
+
+def load_current_user(jwt_header, jwt_data):
+    """Flask-JWT-Extended user_lookup_loader"""
+    return user_cache.get(jwt_data['sub'])
+
+
+def user_lookup_error(jwt_header, jwt_data):
+    """토큰은 유효하지만 사용자가 없는 경우 (탈퇴 등)"""
+    return jsonify({"error": "사용자를 찾을 수 없습니다."}), 404
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_changed_users(session, flush_context):
+    changed = {obj.id for obj in list(session.dirty) + list(session.deleted) if isinstance(obj, User)}
+    if changed:
+        session.info.setdefault(_PENDING_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_rollback')
+def _invalidate_changed_users(session):
+    # 롤백된 경우에도 지웁니다. (불필요하게 지워도 다음 조회에서 다시 읽을 뿐입니다)
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        user_cache.invalidate(user_id)
@@ -0,0 +1,34 @@
+"""
+data_version 테이블 헬퍼
+
+여러 프로세스(웹 서버, seed.py 등)가 공유해야 하는 변경 버전을 DB에 저장합니다.
+"""
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.models import DataVersion
+
+SPACE_CATALOG = 'space_catalog'
+
+
+def get_data_version(name):
+    version = db.session.query(DataVersion.version).filter(DataVersion.name == name).scalar()
+    return version or 0
+
+
+def bump_data_version(name):
+    """
+    버전을 1 증가시킵니다. 커밋은 호출한 쪽 트랜잭션에서 합니다.
+    """
+    updated = db.session.query(DataVersion).filter(DataVersion.name == name)\
+        .update({DataVersion.version: DataVersion.version + 1}, synchronize_session=False)
+    if updated:
+        return
+
+    try:
+        with db.session.begin_nested():
+            db.session.add(DataVersion(name=name, version=1))
+    except IntegrityError:
+        # 다른 프로세스가 먼저 행을 만든 경우
+        db.session.query(DataVersion).filter(DataVersion.name == name)\
+            .update({DataVersion.version: DataVersion.version + 1}, synchronize_session=False)
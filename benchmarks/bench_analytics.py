@@ -0,0 +1,126 @@
+"""
+이용률 분석(관리자 analytics) 벤치마크
+
+1년치 예약을 채운 뒤(booking, booking_slot, space_day_occupancy),
+GET /api/admin/analytics/utilization 이 사용하는 utilization_report() 의 실행 시간을 측정합니다.
+
+    export DATABASE_URI="mysql+pymysql://<유저>:<비밀번호>@localhost/decom_bench"
+    python benchmarks/bench_analytics.py --days 365 --per-day 6
+
+주의: 대상 DB의 user / space / booking 관련 테이블 데이터를 모두 지우고 다시 채웁니다.
+운영 DB에서 실행하지 마세요. DATABASE_URI 가 없으면 임시 SQLite 파일을 사용합니다.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time as timer
+from datetime import date, datetime, time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.environ.get('DATABASE_URI'):
+    os.environ['DATABASE_URI'] = 'sqlite:///' + os.path.join(tempfile.gettempdir(), 'decom_bench_analytics.db')
+
+from sqlalchemy import insert  # noqa: E402
+
+from app import create_app, db  # noqa: E402
+from app.analytics import utilization_report  # noqa: E402
+from app.booking_slots import rebuild_booking_slots  # noqa: E402
+from app.models import Booking, BookingArchive, BookingSlot, NotificationLog, Space, SpaceDayOccupancy, User  # noqa: E402
+from app.occupancy import rebuild_occupancy  # noqa: E402
+from seed import CATEGORY_MAP, spaces_data  # noqa: E402
+
+BENCH_USER_ID = '99999999'
+
+
+def seed(start_day, days, per_day, seed_value, batch_size=20000):
+    """장소마다 하루 최대 per_day 건의 겹치지 않는 예약을 채웁니다."""
+    random.seed(seed_value)
+    for table in (BookingSlot.__table__, NotificationLog.__table__, SpaceDayOccupancy.__table__):
+        db.session.execute(table.delete())
+    db.session.execute(Booking.__table__.delete())
+    db.session.execute(BookingArchive.__table__.delete())
+    db.session.execute(Space.__table__.delete())
+    db.session.execute(User.__table__.delete())
+    db.session.execute(insert(User.__table__), [{'id': BENCH_USER_ID, 'username': 'bench', 'password': 'x'}])
+    db.session.execute(insert(Space.__table__), [{
+        'name': name, 'category': CATEGORY_MAP.get(sub_cat, '기타'), 'subCategory': sub_cat,
+        'location': loc, 'capacity': cap
+    } for name, sub_cat, loc, cap in spaces_data])
+    db.session.commit()
+    space_ids = [row[0] for row in db.session.query(Space.id)]
+
+    buffer, inserted = [], 0
+    for offset in range(days):
+        booking_date = start_day + timedelta(days=offset)
+        for space_id in space_ids:
+            minute = 7 * 60 + random.choice([0, 30, 60, 120])
+            for _ in range(random.randint(0, per_day)):
+                end = minute + random.choice([30, 60, 60, 90, 120])
+                if end > 22 * 60:
+                    break
+                status = random.choice(['확정', '확정', '확정', '이용중', '취소', '확정대기'])
+                checked_in = status == '이용중' or (status == '확정' and random.random() < 0.7)
+                buffer.append({
+                    'user_id': BENCH_USER_ID, 'space_id': space_id, 'date': booking_date,
+                    'start_time': time(minute // 60, minute % 60), 'end_time': time(end // 60, end % 60),
+                    'organizationType': '개인', 'organizationName': 'bench', 'phone': '010',
+                    'email': 'bench@example.com', 'event_name': 'bench', 'num_people': 2, 'ac_use': 'no',
+                    'status': status,
+                    'check_in_time': datetime.combine(booking_date, time(minute // 60, minute % 60)) if checked_in else None,
+                })
+                inserted += 1
+                minute = end + random.choice([0, 10, 30, 60])
+                if len(buffer) >= batch_size:
+                    db.session.execute(insert(Booking.__table__), buffer)
+                    db.session.commit()
+                    buffer = []
+    if buffer:
+        db.session.execute(insert(Booking.__table__), buffer)
+        db.session.commit()
+    return inserted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--per-day', type=int, default=6, help='장소별 하루 최대 예약 수')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skip-seed', action='store_true', help='이미 채워진 데이터를 그대로 사용')
+    args = parser.parse_args()
+
+    start_day = date(2024, 3, 1)
+    end_day = start_day + timedelta(days=args.days - 1)
+
+    app = create_app()
+    with app.app_context():
+        print(f"[INFO] 대상 DB: {db.engine.url.render_as_string(hide_password=True)}")
+        if not args.skip_seed:
+            started = timer.perf_counter()
+            inserted = seed(start_day, args.days, args.per_day, args.seed)
+            created_slots, _ = rebuild_booking_slots()
+            created_days = rebuild_occupancy()
+            print(f"[INFO] 예약 {inserted}건, 슬롯 {created_slots}건, 점유 요약 {created_days}건 생성 "
+                  f"({timer.perf_counter() - started:.1f}s)")
+
+        now = datetime.combine(end_day + timedelta(days=1), time(0, 0))
+        timings = []
+        for _ in range(args.repeat):
+            db.session.commit()
+            started = timer.perf_counter()
+            report = utilization_report(start_day, end_day, now)
+            timings.append(timer.perf_counter() - started)
+
+        timings.sort()
+        print(f"utilization_report ({args.days}일, 장소 {len(report['spaces'])}곳): "
+              f"최소 {timings[0] * 1000:.0f} ms / 중앙값 {timings[len(timings) // 2] * 1000:.0f} ms")
+        for category in report['categories']:
+            print(f"  {category['category']:<6} 이용률 {category['utilization']:.1%}, 노쇼율 {category['noShowRate']:.1%}")
+        print("  피크 시간대:", ", ".join(f"{p['weekday']} {p['hour']}시 {p['utilization']:.0%}" for p in report['peakHours']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+"""
+예약 동시성(경합) 벤치마크
+
+로컬 DB로 앱을 실제 HTTP 서버로 띄우고, N개의 동시 클라이언트가 POST /api/bookings 를 호출합니다.
+--overlap 비율만큼의 요청은 같은 장소/같은 시간(인기 코트 09:00)을 노리고, 나머지는 서로 겹치지 않는 시간대를 예약합니다.
+
+처리량, 지연 시간(p50/p95/p99), 응답 코드별 비율(409/503 등)을 출력하고,
+마지막으로 DB에 겹치는 예약(이중 예약)이 하나도 없는지 검증합니다.
+두 전략 모두 같은 (장소, 날짜)의 요약 행(space_day_occupancy) 갱신은 행 락으로 직렬화되므로,
+slot_claim 의 이점은 서로 다른 날짜 또는 중복 검사 단계에서만 나타납니다.
+
+    export DATABASE_URI="mysql+pymysql://<유저>:<비밀번호>@localhost/decom_bench"
+    python benchmarks/bench_booking_contention.py --requests 1000 --concurrency 200 --overlap 0.3 --strategy both
+
+주의: 대상 DB의 user / space / booking 관련 테이블 데이터를 모두 지우고 다시 채웁니다.
+운영 DB에서 실행하지 마세요. DATABASE_URI 가 없으면 임시 SQLite 파일을 사용합니다.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time as timer
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.environ.get('DATABASE_URI'):
+    os.environ['DATABASE_URI'] = 'sqlite:///' + os.path.join(tempfile.gettempdir(), 'decom_bench_contention.db')
+
+from flask_jwt_extended import create_access_token  # noqa: E402
+from sqlalchemy import insert, text  # noqa: E402
+from werkzeug.serving import make_server  # noqa: E402
+
+from app import create_app, db, bcrypt  # noqa: E402
+from app.models import Booking, BookingArchive, BookingSlot, NotificationLog, Space, SpaceDayOccupancy, User  # noqa: E402
+from seed import CATEGORY_MAP, spaces_data  # noqa: E402
+
+HOT_START, HOT_END = '09:00', '10:00'
+# 겹치지 않는 예약에 쓰는 1시간 단위 시간대 (인기 시간대 09:00 제외)
+FREE_HOURS = [h for h in range(7, 21) if h != 9]
+BASE_DATE = date.today() + timedelta(days=30)
+
+
+def reset_database(num_users):
+    """seed.py 와 같은 장소 데이터와 벤치마크용 사용자를 채웁니다."""
+    db.session.query(BookingSlot).delete()
+    db.session.query(NotificationLog).delete()
+    db.session.query(SpaceDayOccupancy).delete()
+    db.session.query(Booking).delete()
+    db.session.query(BookingArchive).delete()
+    db.session.query(Space).delete()
+    db.session.query(User).delete()
+
+    db.session.execute(insert(Space.__table__), [{
+        'name': name, 'category': CATEGORY_MAP.get(sub_cat, '기타'), 'subCategory': sub_cat,
+        'location': loc, 'capacity': cap
+    } for name, sub_cat, loc, cap in spaces_data])
+
+    # bcrypt 비용을 피하기 위해 해시는 한 번만 만들어 모든 사용자에게 씁니다.
+    password_hash = bcrypt.generate_password_hash('bench-password').decode('utf-8')
+    db.session.execute(insert(User.__table__), [{
+        'id': f"9{i:07d}", 'username': f"bench{i}", 'password': password_hash
+    } for i in range(num_users)])
+    db.session.commit()
+
+    return [(space.name, space.location) for space in Space.query.order_by(Space.id)]
+
+
+def build_requests(total, overlap, spaces, seed_value):
+    """
+    (장소, 날짜, 시작, 종료) 요청 목록을 만듭니다.
+    인기 요청은 모두 첫 번째 장소의 HOT 시간대를, 나머지는 서로 겹치지 않는 시간대를 노립니다.
+    """
+    random.seed(seed_value)
+    hot_space = spaces[0]
+    other_spaces = spaces[1:] or spaces
+
+    requests = []
+    free_index = 0
+    for _ in range(total):
+        if random.random() < overlap:
+            requests.append((hot_space, BASE_DATE.isoformat(), HOT_START, HOT_END, True))
+            continue
+        space = other_spaces[free_index % len(other_spaces)]
+        slot = free_index // len(other_spaces)
+        hour = FREE_HOURS[slot % len(FREE_HOURS)]
+        booking_date = BASE_DATE + timedelta(days=slot // len(FREE_HOURS))
+        requests.append((space, booking_date.isoformat(), f"{hour:02d}:00", f"{hour + 1:02d}:00", False))
+        free_index += 1
+    return requests
+
+
+def post_booking(base_url, token, space, date_str, start, end):
+    body = json.dumps({
+        'roomName': space[0], 'roomLocation': space[1], 'date': date_str,
+        'startTime': start, 'endTime': end, 'organizationType': '개인', 'applicant': 'bench',
+        'phone': '010-0000-0000', 'email': 'bench@example.com', 'eventName': 'bench',
+        'numPeople': 2, 'acUse': 'no'
+    }).encode('utf-8')
+    req = urllib.request.Request(base_url + '/api/bookings', data=body, method='POST', headers={
+        'Content-Type': 'application/json', 'Authorization': 'Bearer ' + token
+    })
+    started = timer.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=60) as response:
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except Exception:
+        status = 'error'
+    return status, timer.perf_counter() - started
+
+
+def count_double_bookings():
+    """같은 장소/날짜에서 시간이 겹치는 (취소되지 않은) 예약 쌍의 수"""
+    return db.session.execute(text("""
+        SELECT COUNT(*) FROM booking a
+        JOIN booking b ON a.space_id = b.space_id AND a.date = b.date AND a.id < b.id
+        WHERE a.status != '취소' AND b.status != '취소'
+          AND a.start_time < b.end_time AND a.end_time > b.start_time
+    """)).scalar()
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run(app, strategy, args):
+    app.config['BOOKING_CONFLICT_STRATEGY'] = strategy
+
+    with app.app_context():
+        spaces = reset_database(args.users)
+        tokens = [create_access_token(identity=f"9{i:07d}") for i in range(args.users)]
+    requests = build_requests(args.requests, args.overlap, spaces, args.seed)
+
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    start_signal = threading.Event()
+
+    def client(i):
+        start_signal.wait()
+        space, date_str, start, end, is_hot = requests[i]
+        status, elapsed = post_booking(base_url, tokens[i % len(tokens)], space, date_str, start, end)
+        return status, elapsed, is_hot
+
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            futures = [pool.submit(client, i) for i in range(len(requests))]
+            started = timer.perf_counter()
+            start_signal.set()
+            results = [f.result() for f in futures]
+            wall = timer.perf_counter() - started
+    finally:
+        server.shutdown()
+
+    latencies = sorted(elapsed for _, elapsed, _ in results)
+    statuses = Counter(status for status, _, _ in results)
+    hot_total = sum(1 for _, _, is_hot in results if is_hot)
+    expected_success = (len(results) - hot_total) + (1 if hot_total else 0)
+
+    with app.app_context():
+        double_bookings = count_double_bookings()
+        stored = Booking.query.filter(Booking.status != '취소').count()
+
+    total = len(results)
+    print(f"\n===== strategy={strategy} (요청 {total}건, 동시성 {args.concurrency}, 겹침 비율 {args.overlap}) =====")
+    print(f"처리량       : {total / wall:.1f} req/s (총 {wall:.2f}s)")
+    print(f"지연 시간    : p50 {percentile(latencies, 50) * 1000:.1f} ms / "
+          f"p95 {percentile(latencies, 95) * 1000:.1f} ms / p99 {percentile(latencies, 99) * 1000:.1f} ms")
+    for status, count in sorted(statuses.items(), key=lambda item: str(item[0])):
+        print(f"HTTP {status:<8}: {count}건 ({count / total:.1%})")
+    print(f"성공 예상/실제: {expected_success} / {statuses.get(201, 0)} (DB 저장 {stored}건)")
+    if strategy == 'slot_claim':
+        print("[INFO] slot_claim 도 같은 (장소, 날짜)의 요약 행(space_day_occupancy) 갱신은 행 락으로 직렬화됩니다.")
+    if double_bookings:
+        print(f"[ERROR] 이중 예약 {double_bookings}쌍이 발견되었습니다!")
+    else:
+        print("[SUCCESS] 이중 예약 없음")
+    return double_bookings == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=500, help='총 예약 요청 수')
+    parser.add_argument('--concurrency', type=int, default=100, help='동시 클라이언트 수')
+    parser.add_argument('--overlap', type=float, default=0.3, help='같은 장소/시간을 노리는 요청 비율 (0~1)')
+    parser.add_argument('--users', type=int, default=200, help='벤치마크용 사용자 수')
+    parser.add_argument('--strategy', choices=['lock', 'slot_claim', 'both'], default='both')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    # 요청마다 찍히는 접근 로그는 끕니다.
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+    app = create_app()
+    with app.app_context():
+        print(f"[INFO] 대상 DB: {db.engine.url.render_as_string(hide_password=True)}")
+
+    strategies = ['lock', 'slot_claim'] if args.strategy == 'both' else [args.strategy]
+    ok = all([run(app, strategy, args) for strategy in strategies])
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
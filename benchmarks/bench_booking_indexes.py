@@ -0,0 +1,228 @@
+"""
+Booking 핫 쿼리 인덱스 벤치마크
+
+대량의 예약 데이터를 채운 뒤, 복합 인덱스가 없을 때(before)와 있을 때(after)의
+실행 계획(EXPLAIN)과 평균 실행 시간을 비교합니다.
+
+    export DATABASE_URI="mysql+pymysql://<유저>:<비밀번호>@localhost/decom_bench"
+    python benchmarks/bench_booking_indexes.py --rows 1000000
+
+주의: 대상 DB의 booking / space / user 테이블 데이터를 모두 지우고 다시 채웁니다.
+운영 DB에서 실행하지 마세요.
+"""
+import argparse
+import os
+import random
+import sys
+import time as timer
+from datetime import date, time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect, insert, text  # noqa: E402
+from sqlalchemy.sql import and_, extract  # noqa: E402
+
+from app import create_app, db  # noqa: E402
+from app.models import Booking, BookingArchive, BookingSlot, NotificationLog, Space, SpaceDayOccupancy, User  # noqa: E402
+
+BENCH_USER_ID = '99999999'
+# 비교 대상: 7b9d35b54b2e 마이그레이션이 추가한 복합 인덱스 (다른 인덱스는 그대로 둡니다)
+BENCH_INDEX_NAMES = ('ix_booking_space_date_start', 'ix_booking_date_start_status')
+BOOKING_INDEXES = [index for index in Booking.__table__.indexes if index.name in BENCH_INDEX_NAMES]
+
+
+def seed(rows, spaces, seed_value, batch_size=20000):
+    """
+    장소마다 하루 여러 건의 예약을 시간 겹침 없이 채웁니다.
+    """
+    random.seed(seed_value)
+
+    # 벤치마크 대상은 booking 테이블의 조회 경로뿐이므로 파생 테이블은 비워 둡니다.
+    for table in (BookingSlot.__table__, NotificationLog.__table__, SpaceDayOccupancy.__table__):
+        db.session.execute(table.delete())
+    db.session.execute(Booking.__table__.delete())
+    db.session.execute(BookingArchive.__table__.delete())
+    db.session.execute(Space.__table__.delete())
+    db.session.execute(User.__table__.delete())
+    db.session.execute(insert(User.__table__), [{
+        'id': BENCH_USER_ID, 'username': 'bench', 'password': 'x'
+    }])
+    db.session.execute(insert(Space.__table__), [{
+        'id': i, 'name': f'bench-space-{i}', 'category': '스터디룸', 'subCategory': '스터디룸',
+        'location': f'bench-{i}', 'capacity': 4
+    } for i in range(1, spaces + 1)])
+    db.session.commit()
+
+    statuses = ['확정', '확정', '확정', '확정대기', '취소', '이용중']
+    start_day = date(2024, 1, 1)
+    buffer = []
+    inserted = 0
+    day_offset = 0
+    while inserted < rows:
+        booking_date = start_day + timedelta(days=day_offset)
+        for space_id in range(1, spaces + 1):
+            minute = 7 * 60
+            while minute < 21 * 60 and inserted < rows:
+                length = random.choice([30, 60, 60, 90, 120])
+                end = min(minute + length, 22 * 60)
+                buffer.append({
+                    'user_id': BENCH_USER_ID, 'space_id': space_id, 'date': booking_date,
+                    'start_time': time(minute // 60, minute % 60), 'end_time': time(end // 60, end % 60),
+                    'organizationType': '개인', 'organizationName': 'bench', 'phone': '010',
+                    'email': 'bench@example.com', 'event_name': 'bench', 'num_people': 2,
+                    'ac_use': 'no', 'status': random.choice(statuses),
+                })
+                inserted += 1
+                minute = end + random.choice([0, 10, 30, 60])
+                if len(buffer) >= batch_size:
+                    db.session.execute(insert(Booking.__table__), buffer)
+                    db.session.commit()
+                    buffer = []
+            if inserted >= rows:
+                break
+        day_offset += 1
+    if buffer:
+        db.session.execute(insert(Booking.__table__), buffer)
+        db.session.commit()
+    print(f"[INFO] {inserted}건 예약 생성 완료 ({day_offset}일 x {spaces}개 장소)")
+    return start_day + timedelta(days=day_offset // 2)
+
+
+def hot_queries(sample_date):
+    year, month = sample_date.year, sample_date.month
+    month_start = date(year, month, 1)
+    next_month_start = date(year + (month // 12), month % 12 + 1, 1)
+    start_obj, end_obj = time(9, 0), time(10, 0)
+
+    return {
+        "월별 현황 (extract)": db.session.query(Booking.date, Booking.start_time, Booking.end_time).filter(
+            Booking.space_id == 1,
+            extract('year', Booking.date) == year,
+            extract('month', Booking.date) == month,
+            Booking.status != '취소'
+        ),
+        "월별 현황 (날짜 범위)": db.session.query(Booking.date, Booking.start_time, Booking.end_time).filter(
+            Booking.space_id == 1,
+            Booking.date >= month_start,
+            Booking.date < next_month_start,
+            Booking.status != '취소'
+        ),
+        "중복 예약 검사": db.session.query(Booking.id).filter(
+            Booking.space_id == 1,
+            Booking.date == sample_date,
+            Booking.status != '취소',
+            and_(Booking.start_time < end_obj, Booking.end_time > start_obj)
+        ),
+        "사용 가능 장소 조회": db.session.query(Booking.space_id).filter(
+            Booking.date == sample_date,
+            Booking.status != '취소',
+            and_(Booking.start_time < end_obj, Booking.end_time > start_obj)
+        ).distinct(),
+        "예약 알림 대상": db.session.query(Booking.id).filter(
+            Booking.date == sample_date,
+            Booking.start_time == start_obj,
+            Booking.status.in_(['확정', '확정대기'])
+        ),
+    }
+
+
+def explain(query):
+    dialect = db.engine.dialect
+    sql = str(query.statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    prefix = 'EXPLAIN QUERY PLAN ' if dialect.name == 'sqlite' else 'EXPLAIN '
+    return db.session.execute(text(prefix + sql)).fetchall()
+
+
+def measure(query, repeat):
+    started = timer.perf_counter()
+    for _ in range(repeat):
+        query.all()
+    return (timer.perf_counter() - started) / repeat * 1000
+
+
+def report(label, sample_date, repeat):
+    print(f"\n===== {label} =====")
+    for name, query in hot_queries(sample_date).items():
+        elapsed_ms = measure(query, repeat)
+        print(f"\n--- {name}: 평균 {elapsed_ms:.2f} ms")
+        for row in explain(query):
+            print("   ", tuple(row))
+
+
+def _fk_column_indexes():
+    """
+    비교 대상 인덱스를 지워도 외래 키 컬럼이 다른 인덱스의 첫 컬럼으로 남도록 필요한 단일 컬럼 인덱스 이름과 컬럼.
+    MySQL 은 외래 키가 사용하는 인덱스를 지울 수 없습니다. (오류 1553, 마이그레이션 downgrade 와 같은 처리)
+    """
+    if db.engine.dialect.name != 'mysql':
+        return {}
+    inspector = inspect(db.engine)
+    remaining = [index['column_names'] for index in inspector.get_indexes('booking')
+                 if index['name'] not in BENCH_INDEX_NAMES]
+    needed = {}
+    for foreign_key in inspector.get_foreign_keys('booking'):
+        column = foreign_key['constrained_columns'][0]
+        if not any(columns[:1] == [column] for columns in remaining):
+            needed[f'ix_booking_{column}'] = column
+    return needed
+
+
+# drop_indexes() 가 만든 단일 컬럼 인덱스 (create_indexes() 가 다시 지움)
+_helper_indexes = []
+
+
+def drop_indexes():
+    for name, column in _fk_column_indexes().items():
+        with db.engine.begin() as conn:
+            conn.execute(text(f"CREATE INDEX {name} ON booking ({column})"))
+        _helper_indexes.append(name)
+    for index in BOOKING_INDEXES:
+        index.drop(bind=db.engine, checkfirst=True)
+
+
+def create_indexes():
+    for index in BOOKING_INDEXES:
+        index.create(bind=db.engine, checkfirst=True)
+    while _helper_indexes:
+        with db.engine.begin() as conn:
+            conn.execute(text(f"DROP INDEX {_helper_indexes.pop()} ON booking"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='생성할 예약 건수')
+    parser.add_argument('--spaces', type=int, default=60, help='장소 개수')
+    parser.add_argument('--repeat', type=int, default=20, help='쿼리당 반복 실행 횟수')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skip-seed', action='store_true', help='이미 채워진 데이터를 그대로 사용')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        print(f"[INFO] 대상 DB: {db.engine.url.render_as_string(hide_password=True)}")
+        db.session.commit()
+        drop_indexes()
+
+        if args.skip_seed:
+            sample_date = db.session.query(Booking.date).order_by(Booking.id.desc()).limit(1).scalar()
+        else:
+            sample_date = seed(args.rows, args.spaces, args.seed)
+        db.session.commit()
+
+        report("before: 복합 인덱스 없음", sample_date, args.repeat)
+
+        db.session.commit()
+        started = timer.perf_counter()
+        create_indexes()
+        print(f"\n[INFO] 인덱스 생성 {timer.perf_counter() - started:.1f}s")
+        if db.engine.dialect.name == 'mysql':
+            db.session.execute(text('ANALYZE TABLE booking'))
+        elif db.engine.dialect.name == 'sqlite':
+            db.session.execute(text('ANALYZE'))
+        db.session.commit()
+
+        report("after: 복합 인덱스 적용", sample_date, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
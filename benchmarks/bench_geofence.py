@@ -0,0 +1,102 @@
+"""
+체크인 지오펜스 거리 계산 벤치마크
+
+seed.py 의 캠퍼스 장소 좌표(COORDINATE_MAP) 주변에 무작위 사용자 위치를 만들고,
+geopy geodesic(타원체 측지선)과 app.geofence 의 평면 근사 거리를 비교합니다.
+
+  - 반경 --max-distance 이내 점에서 두 거리의 차이가 --tolerance(m) 이하인지 검증합니다.
+  - 체크인 반경(50m) 안/밖 판정이 일치하는지 검증합니다. (경계에서 허용 오차 이내인 점은 제외)
+  - 호출당 평균 시간을 비교합니다.
+
+DB 없이 실행됩니다. 비교 기준으로 geopy 가 필요합니다. (앱에서는 사용하지 않으므로 requirements.txt 에는 없습니다)
+
+    pip install geopy
+
+    python benchmarks/bench_geofence.py --points 20000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from geopy.distance import geodesic  # noqa: E402
+except ImportError:
+    geodesic = None
+
+from app.geofence import SpaceFence  # noqa: E402
+from app.routes.booking import GPS_THRESHOLD_METERS  # noqa: E402
+from seed import COORDINATE_MAP  # noqa: E402
+
+
+def make_points(count, max_distance, seed_value):
+    """(장소 좌표, 사용자 좌표) 목록. 사용자 위치는 장소에서 무작위 방향/거리로 떨어진 점입니다."""
+    random.seed(seed_value)
+    origins = list(COORDINATE_MAP.values())
+    points = []
+    for i in range(count):
+        origin = origins[i % len(origins)]
+        destination = geodesic(meters=random.uniform(0, max_distance)).destination(origin, random.uniform(0, 360))
+        points.append((origin, (destination.latitude, destination.longitude)))
+    return points
+
+
+def measure(func, points, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for origin, user in points:
+            func(origin, user)
+    return (time.perf_counter() - started) / (repeat * len(points)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, default=20000)
+    parser.add_argument('--max-distance', type=float, default=500.0, help='사용자 위치의 최대 거리(m)')
+    parser.add_argument('--tolerance', type=float, default=0.05, help='허용 오차(m)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if geodesic is None:
+        print("[ERROR] geopy 가 설치되어 있지 않습니다. (pip install geopy)")
+        sys.exit(1)
+
+    points = make_points(args.points, args.max_distance, args.seed)
+    fences = {origin: SpaceFence(*origin) for origin in COORDINATE_MAP.values()}
+    radius = GPS_THRESHOLD_METERS
+
+    max_error = 0.0
+    mismatches = 0
+    for origin, user in points:
+        reference = geodesic(origin, user).meters
+        approx = fences[origin].distance(*user)
+        max_error = max(max_error, abs(reference - approx))
+
+        inside, _ = fences[origin].check(user[0], user[1], radius)
+        if inside != (reference <= radius) and abs(reference - radius) > args.tolerance:
+            mismatches += 1
+
+    geodesic_us = measure(lambda origin, user: geodesic(origin, user).meters, points, args.repeat)
+    fence_us = measure(lambda origin, user: fences[origin].check(user[0], user[1], radius), points, args.repeat)
+    # 장소별 환산 계수를 미리 계산하지 않고 매번 만드는 경우
+    cold_us = measure(lambda origin, user: SpaceFence(*origin).check(user[0], user[1], radius), points, args.repeat)
+
+    print(f"[INFO] 장소 {len(fences)}곳, 사용자 위치 {len(points)}개 (최대 {args.max_distance:.0f}m)")
+    print(f"최대 거리 오차     : {max_error * 100:.2f} cm (허용 {args.tolerance * 100:.0f} cm)")
+    print(f"반경 판정 불일치   : {mismatches}건")
+    print(f"geodesic           : {geodesic_us:.2f} us/회")
+    print(f"geofence (사전계산): {fence_us:.2f} us/회 ({geodesic_us / fence_us:.0f}배)")
+    print(f"geofence (매번계산): {cold_us:.2f} us/회")
+
+    if max_error > args.tolerance or mismatches:
+        print("[ERROR] geodesic 과의 차이가 허용 오차를 넘었습니다.")
+        sys.exit(1)
+    print("[SUCCESS] geodesic 과 허용 오차 이내에서 일치합니다.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+JSON 응답 직렬화 벤치마크
+
+월별 현황, 일별 현황, 내 예약 목록, 장소 목록과 같은 모양의 응답을 만들어
+Flask 기본 JSON 제공자와 orjson 제공자(app.json_provider)의 jsonify 시간을 비교합니다.
+장소 목록은 미리 직렬화한 본문(bytes)으로 응답을 만드는 경우도 함께 측정합니다. DB 없이 실행됩니다.
+
+    python benchmarks/bench_json_serialization.py --bookings 500 --repeat 2000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify  # noqa: E402
+
+from app.json_provider import OrjsonProvider, json_bytes, orjson  # noqa: E402
+from app.slots import SLOT_LABELS  # noqa: E402
+from seed import CATEGORY_MAP, spaces_data  # noqa: E402
+
+
+def monthly_payload():
+    statuses = ['available', 'partial', 'booked']
+    start = date(2025, 3, 1)
+    return {
+        (start + timedelta(days=i)).isoformat(): {
+            "status": statuses[i % 3],
+            "percentage": round((i % 10) / 10, 2),
+            "period_status": {"morning": statuses[i % 3], "afternoon": statuses[(i + 1) % 3],
+                              "evening": statuses[(i + 2) % 3]},
+        } for i in range(31)
+    }
+
+
+def daily_payload():
+    return {label: i % 4 != 0 for i, label in enumerate(SLOT_LABELS)}
+
+
+def my_bookings_payload(count):
+    start = date(2025, 3, 1)
+    return [{
+        "id": i, "space_id": i % 60 + 1, "date": (start + timedelta(days=i // 3)).isoformat(),
+        "startTime": "09:00", "endTime": "10:30", "room": "해동 스터디룸 A", "location": "하-132A",
+        "applicant": "인하대학교 동아리", "phone": "010-1234-5678", "email": "club@inha.edu",
+        "eventName": "정기 모임", "numPeople": 6, "acUse": "no", "status": "확정",
+        "cancelReason": None, "organizationType": "동아리",
+    } for i in range(count)]
+
+
+def catalog_payload():
+    return [{
+        "id": i + 1, "name": name, "category": CATEGORY_MAP.get(sub_cat, '기타'), "subCategory": sub_cat,
+        "location": loc, "capacity": cap,
+    } for i, (name, sub_cat, loc, cap) in enumerate(spaces_data)]
+
+
+def measure(app, func, repeat):
+    with app.test_request_context():
+        func()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bookings', type=int, default=500, help='내 예약 목록 건수')
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    if orjson is None:
+        print("[ERROR] orjson 이 설치되어 있지 않습니다. (pip install orjson)")
+        sys.exit(1)
+
+    default_app = Flask('bench_default')
+    orjson_app = Flask('bench_orjson')
+    orjson_app.json = OrjsonProvider(orjson_app)
+
+    payloads = {
+        "월별 현황 (31일)": monthly_payload(),
+        "일별 현황 (90 슬롯)": daily_payload(),
+        f"내 예약 목록 ({args.bookings}건)": my_bookings_payload(args.bookings),
+        f"장소 목록 ({len(spaces_data)}곳)": catalog_payload(),
+    }
+
+    print(f"{'응답':<24} | {'기본 (us)':>10} | {'orjson (us)':>11} | {'배속':>6} | {'크기 (bytes)':>14}")
+    for name, payload in payloads.items():
+        default_us = measure(default_app, lambda: jsonify(payload), args.repeat)
+        orjson_us = measure(orjson_app, lambda: jsonify(payload), args.repeat)
+        with default_app.app_context():
+            default_size = len(jsonify(payload).data)
+        with orjson_app.app_context():
+            orjson_size = len(jsonify(payload).data)
+        print(f"{name:<24} | {default_us:>10.1f} | {orjson_us:>11.1f} | {default_us / orjson_us:>5.1f}x | "
+              f"{default_size:>6} / {orjson_size:<6}")
+
+    # 장소 목록: 매번 직렬화 vs 미리 직렬화한 본문으로 응답 생성
+    catalog = catalog_payload()
+    with orjson_app.app_context():
+        body = json_bytes(catalog)
+    blob_us = measure(orjson_app, lambda: orjson_app.response_class(body, mimetype='application/json'), args.repeat)
+    print(f"\n장소 목록 미리 직렬화한 본문으로 응답 생성: {blob_us:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+비밀번호 해시(bcrypt) 로그인 처리량 벤치마크
+
+cost(BCRYPT_LOG_ROUNDS)별로 로그인 1건에 해당하는 비밀번호 검증을
+  1) 요청 스레드에서 직접 계산 (BCRYPT_POOL_SIZE=0, 기존 방식)
+  2) 스레드 풀(app.passwords.PasswordHasher)로 계산
+하여 초당 로그인 수와 코어당 초당 로그인 수를 출력합니다. DB 없이 실행됩니다.
+
+    python benchmarks/bench_password_hashing.py --rounds 10 11 12 13 --pool-size 4 --concurrency 32
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.passwords import PasswordHasher  # noqa: E402
+
+PASSWORD = 'bench-password-1234'
+
+
+def logins_per_second(hasher, pw_hash, logins, concurrency):
+    """concurrency 개의 요청 스레드가 동시에 로그인(비밀번호 검증)할 때의 초당 처리 수"""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda _: hasher.check(pw_hash, PASSWORD), range(logins)))
+    elapsed = time.perf_counter() - started
+    assert all(results)
+    return logins / elapsed
+
+
+def main():
+    cpu_count = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, nargs='+', default=[10, 11, 12, 13])
+    parser.add_argument('--pool-size', type=int, default=cpu_count, help='해시 계산 스레드 수')
+    parser.add_argument('--concurrency', type=int, default=32, help='동시 로그인 요청 스레드 수')
+    parser.add_argument('--seconds', type=float, default=3.0, help='cost 별 목표 측정 시간(초)')
+    args = parser.parse_args()
+
+    cores = min(args.pool_size, cpu_count)
+    print(f"[INFO] CPU {cpu_count}개, 스레드 풀 {args.pool_size}개, 동시 요청 {args.concurrency}개")
+    print(f"{'cost':>4} | {'직접 계산 login/s':>18} | {'풀 login/s':>12} | {'풀 login/s/core':>16} | {'해시 1회':>10}")
+
+    inline = PasswordHasher()
+    for rounds in args.rounds:
+        inline.configure(rounds=rounds, pool_size=0)
+        pooled = PasswordHasher()
+        pooled.configure(rounds=rounds, pool_size=args.pool_size)
+
+        started = time.perf_counter()
+        pw_hash = inline.hash(PASSWORD)
+        single = time.perf_counter() - started
+        # 목표 측정 시간에 맞춰 로그인 횟수를 정합니다. (최소 동시 요청 수만큼)
+        logins = max(args.concurrency, int(args.seconds / single * cores))
+
+        # 작업 스레드를 미리 띄워 둡니다.
+        logins_per_second(pooled, pw_hash, args.pool_size, args.pool_size)
+
+        inline_rate = logins_per_second(inline, pw_hash, max(args.concurrency, int(args.seconds / single)),
+                                        args.concurrency)
+        pooled_rate = logins_per_second(pooled, pw_hash, logins, args.concurrency)
+        pooled.shutdown()
+
+        print(f"{rounds:>4} | {inline_rate:>18.1f} | {pooled_rate:>12.1f} | {pooled_rate / cores:>16.1f} | "
+              f"{single * 1000:>8.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+알림 메일 발송 벤치마크
+
+로컬 SMTP 대역(stand-in) 서버를 띄우고, 같은 메시지 묶음을
+  1) 메시지마다 mail.send() (메시지마다 새 연결, 기존 방식)
+  2) deliver_batch() (묶음마다 연결 재사용 + 스레드 풀)
+로 보내 걸린 시간을 비교합니다. 실제 메일은 발송되지 않습니다.
+
+--connect-delay 로 연결 수립(TLS 핸드셰이크 등) 비용을, --send-delay 로 메시지당 서버 처리 시간을 흉내 냅니다.
+
+    python benchmarks/bench_reminder_delivery.py --messages 200 --connect-delay 0.3
+"""
+import argparse
+import os
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.environ.get('DATABASE_URI'):
+    os.environ['DATABASE_URI'] = 'sqlite:///' + os.path.join(tempfile.gettempdir(), 'decom_bench_mail.db')
+
+from flask_mail import Message  # noqa: E402
+
+from app import create_app, mail  # noqa: E402
+from app.mailer import deliver_batch  # noqa: E402
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """메시지를 받기만 하고 버리는 최소한의 SMTP 서버"""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, connect_delay, send_delay):
+        super().__init__(address, SMTPSinkHandler)
+        self.connect_delay = connect_delay
+        self.send_delay = send_delay
+        self.received = 0
+        self.connections = 0
+        self.lock = threading.Lock()
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+
+    def reply(self, line):
+        self.wfile.write((line + '\r\n').encode('ascii'))
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        time.sleep(server.connect_delay)
+        self.reply('220 localhost bench SMTP')
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('utf-8', 'replace').strip().upper()
+            if command.startswith('EHLO') or command.startswith('HELO'):
+                self.reply('250 localhost')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line in (b'.\r\n', b'.\n'):
+                        break
+                time.sleep(server.send_delay)
+                with server.lock:
+                    server.received += 1
+                self.reply('250 OK')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                # MAIL FROM, RCPT TO, RSET, NOOP ...
+                self.reply('250 OK')
+
+
+def build_messages(count):
+    return [
+        (i, Message(subject=f"[bench] 예약 알림 {i}", recipients=[f"user{i}@example.com"], body="bench"))
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--messages', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--chunk-size', type=int, default=50)
+    parser.add_argument('--connect-delay', type=float, default=0.2, help='연결 수립 지연(초)')
+    parser.add_argument('--send-delay', type=float, default=0.005, help='메시지당 처리 지연(초)')
+    args = parser.parse_args()
+
+    sink = SMTPSink(('127.0.0.1', 0), args.connect_delay, args.send_delay)
+    threading.Thread(target=sink.serve_forever, daemon=True).start()
+
+    app = create_app()
+    app.config.update(
+        MAIL_SERVER='127.0.0.1', MAIL_PORT=sink.server_address[1], MAIL_USE_TLS=False,
+        MAIL_USE_SSL=False, MAIL_USERNAME=None, MAIL_PASSWORD=None,
+        MAIL_DEFAULT_SENDER=('INHA-DECOM', 'bench@example.com'), MAIL_SUPPRESS_SEND=False,
+    )
+    mail.init_app(app)
+
+    print(f"[INFO] 메시지 {args.messages}건, 연결 지연 {args.connect_delay}s, 메시지당 지연 {args.send_delay}s")
+
+    # 1) 기존 방식: 메시지마다 mail.send()
+    with app.app_context():
+        started = time.perf_counter()
+        for _, message in build_messages(args.messages):
+            mail.send(message)
+        sequential = time.perf_counter() - started
+    print(f"순차 발송 (메시지마다 연결) : {sequential:.2f}s, 연결 {sink.connections}개")
+
+    # 2) 배치 발송
+    sink.connections = 0
+    with app.app_context():
+        messages = build_messages(args.messages)
+    report = deliver_batch(app, messages, workers=args.workers, chunk_size=args.chunk_size)
+    print(f"배치 발송 (연결 재사용)     : {report.elapsed:.2f}s, 연결 {report.connections}개, "
+          f"성공 {len(report.sent)} / 실패 {len(report.failed)}")
+    print(f"속도 향상: {sequential / report.elapsed:.1f}배, SMTP 서버 수신 합계 {sink.received}건")
+
+    sink.shutdown()
+    if report.failed or sink.received != args.messages * 2:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+앱 시작 시간 벤치마크
+
+새 파이썬 프로세스에서 `import app` 시간과 create_app() 시간을 재고, create_app() 이 실행한 SQL 문 수를 셉니다.
+(gunicorn 워커 생성, seed.py 실행처럼 프로세스마다 한 번씩 드는 비용)
+SCHEMA_AUTO_CREATE=true (db.create_all) 와 false 를 비교합니다.
+
+    export DATABASE_URI="mysql+pymysql://<유저>:<비밀번호>@localhost/decom"
+    python benchmarks/bench_startup.py --repeat 10
+
+DATABASE_URI 가 없으면 임시 SQLite 파일을 사용합니다. (테이블이 없으면 먼저 만듭니다)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import json, sys, time
+started = time.perf_counter()
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+sqlalchemy_loaded = time.perf_counter()
+
+statements = []
+event.listen(Engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+from app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+print(json.dumps({
+    'import': imported - started,
+    'create_app': created - imported,
+    'statements': len(statements),
+    'alembic': 'alembic' in sys.modules,
+    'pytz': 'pytz' in sys.modules,
+}))
+"""
+
+
+def run_once(env):
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD], cwd=ROOT, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if not env.get('DATABASE_URI'):
+        env['DATABASE_URI'] = 'sqlite:///' + os.path.join(tempfile.gettempdir(), 'decom_bench_startup.db')
+    env.setdefault('SCHEDULER_AUTOSTART', 'false')
+
+    # 테이블 준비 (첫 실행)
+    run_once({**env, 'SCHEMA_AUTO_CREATE': 'true'})
+
+    print(f"{'SCHEMA_AUTO_CREATE':<20} | {'import (ms)':>11} | {'create_app (ms)':>15} | {'합계 (ms)':>9} | {'SQL 문':>6}")
+    for auto_create in ('true', 'false'):
+        results = [run_once({**env, 'SCHEMA_AUTO_CREATE': auto_create}) for _ in range(args.repeat)]
+        import_ms = statistics.median(r['import'] for r in results) * 1000
+        create_ms = statistics.median(r['create_app'] for r in results) * 1000
+        print(f"{auto_create:<20} | {import_ms:>11.1f} | {create_ms:>15.1f} | {import_ms + create_ms:>9.1f} | "
+              f"{results[0]['statements']:>6}")
+
+    print(f"\nalembic 로드 여부: {results[0]['alembic']}, pytz 로드 여부: {results[0]['pytz']}")
+
+
+if __name__ == '__main__':
+    main()
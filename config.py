@@ -1,11 +1,53 @@
 import os # 환경 변수를 사용
 
+
+def _engine_options():
+    """
+    연결 풀 설정. pool_size / max_overflow / pool_timeout 은 환경 변수가 있을 때만 넘깁니다.
+    (SQLite 메모리 DB 처럼 크기 설정이 없는 풀도 있으므로)
+    """
+    options = {
+        # MySQL 이 오래 쉬던 연결을 끊어도(wait_timeout) 요청이 실패하지 않도록
+        'pool_pre_ping': (os.environ.get('DB_POOL_PRE_PING') or 'true').lower() == 'true',
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE') or 1800),
+    }
+    for option, env in (('pool_size', 'DB_POOL_SIZE'), ('max_overflow', 'DB_MAX_OVERFLOW'),
+                        ('pool_timeout', 'DB_POOL_TIMEOUT')):
+        if os.environ.get(env):
+            options[option] = int(os.environ[env])
+    return options
+
+
 class Config:
    
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'a_very_very_secret_key'
 
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URI') or 'mysql+pymysql://root@localhost/decom'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options()
+    # 앱을 만들 때마다 db.create_all() 로 빠진 테이블을 만들지 여부 (false: migrations/ 로만 관리, 시작이 빨라짐)
+    SCHEMA_AUTO_CREATE = (os.environ.get('SCHEMA_AUTO_CREATE') or 'true').lower() == 'true'
+
+    # 읽기 전용 복제본 (설정하면 조회 API 의 SELECT 문을 복제본으로 보냅니다, app/db_routing.py)
+    SQLALCHEMY_BINDS = {'replica': os.environ['DATABASE_REPLICA_URI']} if os.environ.get('DATABASE_REPLICA_URI') else {}
+
+    # JSON 직렬화 ('auto': orjson 이 설치되어 있으면 사용, 'orjson', 'default': Flask 기본)
+    JSON_PROVIDER = os.environ.get('JSON_PROVIDER') or 'auto'
+
+    # 관리자 학번 목록 (쉼표로 구분, 예: "12345678,23456789")
+    ADMIN_USER_IDS = [user_id.strip() for user_id in (os.environ.get('ADMIN_USER_IDS') or '').split(',') if user_id.strip()]
+
+    # 관리자 예약 내보내기: DB에서 한 번에 가져올 행 수 (서버 측 커서)
+    EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE') or 1000)
+
+    # 지난 예약 보관 (flask archive-bookings): 며칠 지난 예약을 booking_archive 로 옮길지, 한 트랜잭션에서 옮길 예약 수
+    ARCHIVE_AFTER_DAYS = int(os.environ.get('ARCHIVE_AFTER_DAYS') or 180)
+    ARCHIVE_BATCH_SIZE = int(os.environ.get('ARCHIVE_BATCH_SIZE') or 1000)
+
+    # 비밀번호 해시 (bcrypt cost, 해시 계산 스레드 수 - 0 이면 요청 스레드에서 직접 계산)
+    # cost 를 바꾸면 기존 사용자는 다음 로그인 때 새 cost 로 다시 해시됩니다.
+    BCRYPT_LOG_ROUNDS = int(os.environ.get('BCRYPT_LOG_ROUNDS') or 12)
+    BCRYPT_POOL_SIZE = int(os.environ.get('BCRYPT_POOL_SIZE') or 2)
 
     
     # Flask-Mail 설정 
@@ -18,3 +60,53 @@ class Config:
     MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
     MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
     MAIL_DEFAULT_SENDER = ('INHA-DECOM', os.environ.get('MAIL_USERNAME'))
+
+    # 알림 메일 배치 발송 (동시 SMTP 연결 수, 연결 하나로 보낼 최대 메시지 수)
+    MAIL_BATCH_WORKERS = int(os.environ.get('MAIL_BATCH_WORKERS') or 4)
+    MAIL_BATCH_CHUNK_SIZE = int(os.environ.get('MAIL_BATCH_CHUNK_SIZE') or 50)
+
+    # 알림 발송 방식
+    # 'inline': 스케줄러가 웹 프로세스 안에서 직접 발송 (기본)
+    # 'outbox': outbox 테이블에 넣고 별도 워커(flask outbox-worker)가 발송
+    NOTIFICATION_DELIVERY = os.environ.get('NOTIFICATION_DELIVERY') or 'inline'
+    OUTBOX_BATCH_SIZE = int(os.environ.get('OUTBOX_BATCH_SIZE') or 100)
+    OUTBOX_POLL_INTERVAL = float(os.environ.get('OUTBOX_POLL_INTERVAL') or 5)
+    OUTBOX_MAX_ATTEMPTS = int(os.environ.get('OUTBOX_MAX_ATTEMPTS') or 6)
+    OUTBOX_BACKOFF_SECONDS = int(os.environ.get('OUTBOX_BACKOFF_SECONDS') or 30)
+    OUTBOX_BACKOFF_MAX_SECONDS = int(os.environ.get('OUTBOX_BACKOFF_MAX_SECONDS') or 3600)
+    OUTBOX_LOCK_TIMEOUT = int(os.environ.get('OUTBOX_LOCK_TIMEOUT') or 300)
+    # 예약 알림을 선점한 뒤 이 시간(초)이 지나도록 발송 결과가 없으면 다음 실행이 다시 가져갑니다 (inline 발송)
+    REMINDER_CLAIM_TIMEOUT = int(os.environ.get('REMINDER_CLAIM_TIMEOUT') or 300)
+
+    # 스케줄러 리더 선출 (여러 웹 프로세스 중 하나만 예약 작업 실행)
+    SCHEDULER_LEADER_ELECTION = (os.environ.get('SCHEDULER_LEADER_ELECTION') or 'true').lower() == 'true'
+    SCHEDULER_LEASE_TTL = int(os.environ.get('SCHEDULER_LEASE_TTL') or 45)
+    SCHEDULER_LEASE_HEARTBEAT = int(os.environ.get('SCHEDULER_LEASE_HEARTBEAT') or 15)
+    # gunicorn 등 WSGI 서버로 실행할 때 run.py 를 불러오는 시점에 스케줄러 시작
+    SCHEDULER_AUTOSTART = (os.environ.get('SCHEDULER_AUTOSTART') or 'false').lower() == 'true'
+
+    # 중복 예약 감지 전략
+    # 'lock': 장소(Space) 행에 SELECT ... FOR UPDATE 락을 잡고 검사 (기본)
+    # 'slot_claim': 락 없이 booking_slot 고유 키 위반으로 감지 (겹치지 않는 예약은 병렬 처리)
+    #   단, 두 전략 모두 커밋 직전에 space_day_occupancy 요약 행을 행 락으로 갱신하므로,
+    #   같은 (장소, 날짜)의 예약은 그 갱신과 커밋 구간에서 한 건씩 직렬화됩니다.
+    BOOKING_CONFLICT_STRATEGY = os.environ.get('BOOKING_CONFLICT_STRATEGY') or 'lock'
+
+    # 사용자 정보 캐시 (JWT current_user, 0 이면 캐시하지 않음)
+    USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL') or 60)
+    USER_CACHE_MAX_ENTRIES = int(os.environ.get('USER_CACHE_MAX_ENTRIES') or 10000)
+
+    # 요청 / DB / 스케줄러 계측 (GET /metrics, 토큰을 설정하면 Bearer 토큰 필요)
+    METRICS_ENABLED = (os.environ.get('METRICS_ENABLED') or 'true').lower() == 'true'
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+    # 느린 쿼리 / N+1 감지 (개발, 스테이징용)
+    QUERY_INSPECTOR = (os.environ.get('QUERY_INSPECTOR') or 'false').lower() == 'true'
+    SLOW_QUERY_MS = int(os.environ.get('SLOW_QUERY_MS') or 200)
+    N_PLUS_ONE_THRESHOLD = int(os.environ.get('N_PLUS_ONE_THRESHOLD') or 5)
+
+    # 예약 현황 캐시 ('memory', 'redis', 'null')
+    AVAILABILITY_CACHE_TYPE = os.environ.get('AVAILABILITY_CACHE_TYPE') or 'memory'
+    AVAILABILITY_CACHE_REDIS_URL = os.environ.get('AVAILABILITY_CACHE_REDIS_URL') or 'redis://localhost:6379/0'
+    AVAILABILITY_CACHE_TTL = int(os.environ.get('AVAILABILITY_CACHE_TTL') or 60)
+    AVAILABILITY_CACHE_MAX_ENTRIES = int(os.environ.get('AVAILABILITY_CACHE_MAX_ENTRIES') or 4096)
@@ -0,0 +1,87 @@
+"""add space_day_occupancy
+
+Revision ID: 0a457b9f271a
+Revises: 7b9d35b54b2e
+Create Date: 2026-10-17 11:03:27.640918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a457b9f271a'
+down_revision = '7b9d35b54b2e'
+branch_labels = None
+depends_on = None
+
+
+BATCH_SIZE = 5000
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def _backfill(table):
+    """
+    기존 예약으로 요약 행을 채웁니다. (app/occupancy.py 와 같은 계산)
+    이 리비전에는 version 컬럼과 booking_archive 테이블이 없으므로 모델 대신 테이블을 직접 읽습니다.
+    """
+    from app.slots import DayOccupancy
+
+    booking = sa.table(
+        'booking',
+        sa.column('space_id', sa.Integer()),
+        sa.column('date', sa.Date()),
+        sa.column('start_time', sa.Time()),
+        sa.column('end_time', sa.Time()),
+        sa.column('status', sa.String()),
+    )
+    bookings = op.get_bind().execute(
+        sa.select(booking.c.space_id, booking.c.date, booking.c.start_time, booking.c.end_time)
+        .where(booking.c.status != '취소')
+        .execution_options(yield_per=BATCH_SIZE)
+    )
+    occupancies = {}
+    for space_id, date, start_time, end_time in bookings:
+        occupancies.setdefault((space_id, date), DayOccupancy()).add(start_time, end_time)
+
+    rows = []
+    for (space_id, date), occupancy in occupancies.items():
+        counts = occupancy.period_counts()
+        rows.append({
+            'space_id': space_id,
+            'date': date,
+            'booked_slots': occupancy.booked_count,
+            'morning_slots': counts['morning'],
+            'afternoon_slots': counts['afternoon'],
+            'evening_slots': counts['evening'],
+            'slot_mask': format(occupancy.mask, 'x'),
+        })
+    for offset in range(0, len(rows), BATCH_SIZE):
+        op.bulk_insert(table, rows[offset:offset + BATCH_SIZE])
+
+
+def upgrade():
+    # create_app()의 db.create_all()이 이미 테이블을 만들었을 수 있습니다. (그때 기존 예약도 함께 채웁니다)
+    if _has_table('space_day_occupancy'):
+        return
+    table = op.create_table(
+        'space_day_occupancy',
+        sa.Column('space_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('booked_slots', sa.Integer(), nullable=False),
+        sa.Column('morning_slots', sa.Integer(), nullable=False),
+        sa.Column('afternoon_slots', sa.Integer(), nullable=False),
+        sa.Column('evening_slots', sa.Integer(), nullable=False),
+        sa.Column('slot_mask', sa.String(length=32), nullable=False),
+        sa.ForeignKeyConstraint(['space_id'], ['space.id'], ),
+        sa.PrimaryKeyConstraint('space_id', 'date')
+    )
+    _backfill(table)
+
+
+def downgrade():
+    if _has_table('space_day_occupancy'):
+        op.drop_table('space_day_occupancy')
@@ -0,0 +1,94 @@
+"""add booking_slot
+
+Revision ID: 217eaf2e2c00
+Revises: f0a275c20c60
+Create Date: 2026-10-17 13:20:54.803117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '217eaf2e2c00'
+down_revision = 'f0a275c20c60'
+branch_labels = None
+depends_on = None
+
+
+BATCH_SIZE = 2000
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def _insert_ignore(table):
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        return sa.insert(table).prefix_with('IGNORE')
+    if dialect == 'sqlite':
+        return sa.insert(table).prefix_with('OR IGNORE')
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    return pg_insert(table).on_conflict_do_nothing()
+
+
+def _backfill(table):
+    """
+    취소되지 않은 기존 예약의 슬롯을 채웁니다. (app/booking_slots.py 의 rebuild_booking_slots 와 같은 계산)
+    이미 겹치는 예약이 있으면 먼저 만들어진 예약이 슬롯을 차지합니다.
+    """
+    from app.slots import claim_slot_indexes
+
+    booking = sa.table(
+        'booking',
+        sa.column('id', sa.Integer()),
+        sa.column('space_id', sa.Integer()),
+        sa.column('date', sa.Date()),
+        sa.column('start_time', sa.Time()),
+        sa.column('end_time', sa.Time()),
+        sa.column('status', sa.String()),
+    )
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        bookings = bind.execute(
+            sa.select(booking.c.id, booking.c.space_id, booking.c.date, booking.c.start_time, booking.c.end_time)
+            .where(booking.c.status != '취소', booking.c.id > last_id)
+            .order_by(booking.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not bookings:
+            break
+        rows = [
+            {'space_id': space_id, 'date': date, 'slot_idx': slot_idx, 'booking_id': booking_id}
+            for booking_id, space_id, date, start_time, end_time in bookings
+            for slot_idx in claim_slot_indexes(start_time, end_time)
+        ]
+        if rows:
+            bind.execute(_insert_ignore(table), rows)
+        last_id = bookings[-1][0]
+
+
+def upgrade():
+    # create_app()의 db.create_all()이 이미 테이블을 만들었을 수 있습니다. (그때 기존 예약의 슬롯도 함께 채웁니다)
+    if _has_table('booking_slot'):
+        return
+    table = op.create_table(
+        'booking_slot',
+        sa.Column('space_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('slot_idx', sa.SmallInteger(), autoincrement=False, nullable=False),
+        sa.Column('booking_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['booking_id'], ['booking.id'], ),
+        sa.ForeignKeyConstraint(['space_id'], ['space.id'], ),
+        sa.PrimaryKeyConstraint('space_id', 'date', 'slot_idx')
+    )
+    op.create_index(op.f('ix_booking_slot_booking_id'), 'booking_slot', ['booking_id'], unique=False)
+    _backfill(table)
+
+
+def downgrade():
+    if _has_table('booking_slot'):
+        op.drop_index(op.f('ix_booking_slot_booking_id'), table_name='booking_slot')
+        op.drop_table('booking_slot')
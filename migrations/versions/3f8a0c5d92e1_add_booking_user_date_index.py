@@ -0,0 +1,45 @@
+"""add booking (user_id, date, start_time) index
+
+Revision ID: 3f8a0c5d92e1
+Revises: 9e2b61f0d7a4
+Create Date: 2026-10-17 16:41:27.550934
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f8a0c5d92e1'
+down_revision = '9e2b61f0d7a4'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'ix_booking_user_date_start'
+
+
+def _existing_indexes():
+    # create_app()의 db.create_all()이 이미 인덱스를 만들었을 수 있으므로 확인 후 생성합니다.
+    inspector = sa.inspect(op.get_bind())
+    return {index['name']: index['column_names'] for index in inspector.get_indexes('booking')}
+
+
+def upgrade():
+    if INDEX_NAME not in _existing_indexes():
+        op.create_index(INDEX_NAME, 'booking', ['user_id', 'date', 'start_time'], unique=False)
+
+
+def downgrade():
+    existing = _existing_indexes()
+    if INDEX_NAME not in existing:
+        return
+
+    # MySQL은 user_id FK가 사용하는 인덱스를 지울 수 없으므로 단일 인덱스를 먼저 만들어 둡니다.
+    user_id_indexed = any(
+        columns[:1] == ['user_id'] for name, columns in existing.items() if name != INDEX_NAME
+    )
+    if op.get_bind().dialect.name == 'mysql' and not user_id_indexed:
+        op.create_index('ix_booking_user_id', 'booking', ['user_id'], unique=False)
+
+    op.drop_index(INDEX_NAME, table_name='booking')
@@ -0,0 +1,42 @@
+"""add notification_log
+
+Revision ID: 5373b5aadf0c
+Revises: 217eaf2e2c00
+Create Date: 2026-10-17 14:02:11.529730
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5373b5aadf0c'
+down_revision = '217eaf2e2c00'
+branch_labels = None
+depends_on = None
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade():
+    # create_app()의 db.create_all()이 이미 테이블을 만들었을 수 있습니다.
+    if _has_table('notification_log'):
+        return
+    op.create_table(
+        'notification_log',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('booking_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=30), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['booking_id'], ['booking.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('booking_id', 'kind', name='uq_notification_log_booking_kind')
+    )
+
+
+def downgrade():
+    if _has_table('notification_log'):
+        op.drop_table('notification_log')
@@ -0,0 +1,50 @@
+"""add booking composite indexes
+
+Revision ID: 7b9d35b54b2e
+Revises:
+Create Date: 2026-10-17 10:12:41.318201
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b9d35b54b2e'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+BOOKING_INDEXES = {
+    'ix_booking_space_date_start': ['space_id', 'date', 'start_time'],
+    'ix_booking_date_start_status': ['date', 'start_time', 'status'],
+}
+
+
+def _existing_indexes():
+    # create_app()의 db.create_all()이 이미 인덱스를 만들었을 수 있으므로 확인 후 생성합니다.
+    inspector = sa.inspect(op.get_bind())
+    return {index['name']: index['column_names'] for index in inspector.get_indexes('booking')}
+
+
+def upgrade():
+    existing = _existing_indexes()
+    for name, columns in BOOKING_INDEXES.items():
+        if name not in existing:
+            op.create_index(name, 'booking', columns, unique=False)
+
+
+def downgrade():
+    existing = _existing_indexes()
+
+    # MySQL은 space_id FK가 사용하는 인덱스를 지울 수 없으므로 단일 인덱스를 먼저 만들어 둡니다.
+    space_id_indexed = any(
+        columns[:1] == ['space_id'] for name, columns in existing.items() if name not in BOOKING_INDEXES
+    )
+    if op.get_bind().dialect.name == 'mysql' and not space_id_indexed:
+        op.create_index('ix_booking_space_id', 'booking', ['space_id'], unique=False)
+
+    for name in BOOKING_INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name='booking')
@@ -0,0 +1,39 @@
+"""add scheduler_lease
+
+Revision ID: 9e2b61f0d7a4
+Revises: c41d7e9a2b18
+Create Date: 2026-10-17 15:58:09.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e2b61f0d7a4'
+down_revision = 'c41d7e9a2b18'
+branch_labels = None
+depends_on = None
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade():
+    # create_app()의 db.create_all()이 이미 테이블을 만들었을 수 있습니다.
+    if _has_table('scheduler_lease'):
+        return
+    op.create_table(
+        'scheduler_lease',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('holder', sa.String(length=100), nullable=False),
+        sa.Column('acquired_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    if _has_table('scheduler_lease'):
+        op.drop_table('scheduler_lease')
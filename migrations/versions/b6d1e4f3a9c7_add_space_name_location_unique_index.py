@@ -0,0 +1,36 @@
+"""add space (name, location) unique index
+
+Revision ID: b6d1e4f3a9c7
+Revises: 3f8a0c5d92e1
+Create Date: 2026-10-17 19:52:08.114372
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6d1e4f3a9c7'
+down_revision = '3f8a0c5d92e1'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'uq_space_name_location'
+
+
+def _existing_indexes():
+    # create_app()의 db.create_all()이 이미 인덱스를 만들었을 수 있으므로 확인 후 생성합니다.
+    inspector = sa.inspect(op.get_bind())
+    return {index['name'] for index in inspector.get_indexes('space')}
+
+
+def upgrade():
+    # 같은 (이름, 위치) 장소가 이미 여러 개 있으면 인덱스를 만들 수 없으므로 먼저 정리해야 합니다.
+    if INDEX_NAME not in _existing_indexes():
+        op.create_index(INDEX_NAME, 'space', ['name', 'location'], unique=True)
+
+
+def downgrade():
+    if INDEX_NAME in _existing_indexes():
+        op.drop_index(INDEX_NAME, table_name='space')
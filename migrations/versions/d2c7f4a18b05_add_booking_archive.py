@@ -0,0 +1,60 @@
+"""add booking archive
+
+Revision ID: d2c7f4a18b05
+Revises: b6d1e4f3a9c7
+Create Date: 2026-10-17 20:41:37.502816
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2c7f4a18b05'
+down_revision = 'b6d1e4f3a9c7'
+branch_labels = None
+depends_on = None
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade():
+    # create_app()의 db.create_all()이 이미 테이블을 만들었을 수 있습니다.
+    if _has_table('booking_archive'):
+        return
+    op.create_table(
+        'booking_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('user_id', sa.String(length=8), nullable=False),
+        sa.Column('space_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('start_time', sa.Time(), nullable=False),
+        sa.Column('end_time', sa.Time(), nullable=False),
+        sa.Column('organizationType', sa.String(length=50), nullable=True),
+        sa.Column('organizationName', sa.String(length=100), nullable=False),
+        sa.Column('phone', sa.String(length=20), nullable=False),
+        sa.Column('email', sa.String(length=100), nullable=False),
+        sa.Column('event_name', sa.String(length=200), nullable=False),
+        sa.Column('num_people', sa.Integer(), nullable=False),
+        sa.Column('ac_use', sa.String(length=3), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('cancel_reason', sa.Text(), nullable=True),
+        sa.Column('check_in_time', sa.DateTime(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['space_id'], ['space.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_booking_archive_user_date_start', 'booking_archive',
+                    ['user_id', 'date', 'start_time'], unique=False)
+    op.create_index('ix_booking_archive_date_start', 'booking_archive', ['date', 'start_time'], unique=False)
+
+
+def downgrade():
+    # 보관된 예약이 함께 지워집니다. 필요하면 먼저 booking 테이블로 되돌리세요.
+    if _has_table('booking_archive'):
+        op.drop_index('ix_booking_archive_date_start', table_name='booking_archive')
+        op.drop_index('ix_booking_archive_user_date_start', table_name='booking_archive')
+        op.drop_table('booking_archive')
@@ -0,0 +1,35 @@
+"""add space_day_occupancy (date, version) index
+
+Revision ID: e8a3b61c4f27
+Revises: d2c7f4a18b05
+Create Date: 2026-10-17 22:06:51.384120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8a3b61c4f27'
+down_revision = 'd2c7f4a18b05'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'ix_space_day_occupancy_date_version'
+
+
+def _existing_indexes():
+    # create_app()의 db.create_all()이 이미 인덱스를 만들었을 수 있으므로 확인 후 생성합니다.
+    inspector = sa.inspect(op.get_bind())
+    return {index['name'] for index in inspector.get_indexes('space_day_occupancy')}
+
+
+def upgrade():
+    if INDEX_NAME not in _existing_indexes():
+        op.create_index(INDEX_NAME, 'space_day_occupancy', ['date', 'version'], unique=False)
+
+
+def downgrade():
+    if INDEX_NAME in _existing_indexes():
+        op.drop_index(INDEX_NAME, table_name='space_day_occupancy')
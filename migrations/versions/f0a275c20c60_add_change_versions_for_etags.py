@@ -0,0 +1,48 @@
+"""add change versions for etags
+
+Revision ID: f0a275c20c60
+Revises: 0a457b9f271a
+Create Date: 2026-10-17 11:48:05.172344
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f0a275c20c60'
+down_revision = '0a457b9f271a'
+branch_labels = None
+depends_on = None
+
+
+def _inspector():
+    return sa.inspect(op.get_bind())
+
+
+def _has_column(table, column):
+    return column in {c['name'] for c in _inspector().get_columns(table)}
+
+
+def upgrade():
+    # create_app()의 db.create_all()이 이미 만들었을 수 있으므로 확인 후 생성합니다.
+    if not _has_column('space_day_occupancy', 'version'):
+        with op.batch_alter_table('space_day_occupancy') as batch_op:
+            batch_op.add_column(sa.Column('version', sa.Integer(), nullable=False, server_default='0'))
+
+    if not _inspector().has_table('data_version'):
+        op.create_table(
+            'data_version',
+            sa.Column('name', sa.String(length=50), nullable=False),
+            sa.Column('version', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('name')
+        )
+
+
+def downgrade():
+    if _inspector().has_table('data_version'):
+        op.drop_table('data_version')
+
+    if _has_column('space_day_occupancy', 'version'):
+        with op.batch_alter_table('space_day_occupancy') as batch_op:
+            batch_op.drop_column('version')
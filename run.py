@@ -1,12 +1,15 @@
 import os
-from app import create_app, scheduler 
+from app import create_app
+from app.leader import start_scheduler
 
 app = create_app()
 
 if __name__ == '__main__':
 
-    with app.app_context():
-        scheduler.start()
-    print("[INFO] APScheduler started (Production Mode)...")
+    start_scheduler(app)
 
-    app.run(debug=False, port=5050)
\ No newline at end of file
+    app.run(debug=False, port=5050)
+
+elif app.config['SCHEDULER_AUTOSTART']:
+    # gunicorn 등이 run:app 을 불러오는 경우 (워커마다 실행되지만 작업은 리더 하나만 수행)
+    start_scheduler(app)
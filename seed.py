@@ -1,5 +1,8 @@
+import math
+
 from app import create_app, db
-from app.models import Space, Booking
+from app.models import Space
+from app.versions import bump_data_version, SPACE_CATALOG
 
 # (카테고리: 서브카테고리)
 CATEGORY_MAP = {
@@ -76,47 +79,111 @@ spaces_data = [
     ('피클볼 5코트', '피클볼 코트', '피클볼장', 4),
 ]
 
+SPACE_KEY_COLUMNS = ('name', 'location')
+SPACE_UPDATE_COLUMNS = ('category', 'subCategory', 'capacity', 'latitude', 'longitude')
+
+
+def build_space_rows():
+    """spaces_data 를 space 테이블 행(dict) 목록으로 바꿉니다."""
+    rows = []
+    for name, sub_cat, loc, cap in spaces_data:
+        lat, lng = COORDINATE_MAP.get(sub_cat, (None, None))
+        rows.append({
+            'name': name,
+            'category': CATEGORY_MAP.get(sub_cat, '기타'),
+            'subCategory': sub_cat,
+            'location': loc,
+            'capacity': cap,
+            'latitude': lat,
+            'longitude': lng,
+        })
+    return rows
+
+
+def _upsert_statement(rows):
+    """(name, location) 이 같은 행이 있으면 나머지 컬럼을 갱신하는 다중 행 INSERT 문"""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(Space.__table__).values(rows)
+        return stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in SPACE_UPDATE_COLUMNS})
+
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise RuntimeError(f"upsert 를 지원하지 않는 DB 입니다: {dialect}")
+    stmt = insert(Space.__table__).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=list(SPACE_KEY_COLUMNS),
+        set_={column: stmt.excluded[column] for column in SPACE_UPDATE_COLUMNS}
+    )
+
+
+def _same_values(current, new):
+    # MySQL FLOAT 은 단정밀도라 좌표를 다시 읽으면 조금 달라지므로 오차 범위 안이면 같은 값으로 봅니다.
+    for a, b in zip(current, new):
+        if isinstance(a, float) and isinstance(b, float):
+            if not math.isclose(a, b, rel_tol=1e-6):
+                return False
+        elif a != b:
+            return False
+    return True
+
+
+def upsert_spaces(rows):
+    """
+    장소를 (이름, 위치) 기준으로 추가하거나 갱신합니다. 예약과 장소 ID 는 그대로 유지됩니다.
+    바뀐 행만 INSERT ... ON DUPLICATE KEY UPDATE (또는 ON CONFLICT DO UPDATE) 한 문장으로 보냅니다.
+    커밋은 호출한 쪽에서 합니다.
+
+    반환값: {'inserted': n, 'updated': n, 'unchanged': n, 'not_in_seed': n}
+    """
+    key_columns = [getattr(Space, column) for column in SPACE_KEY_COLUMNS]
+    value_columns = [getattr(Space, column) for column in SPACE_UPDATE_COLUMNS]
+    existing = {
+        tuple(row[:len(key_columns)]): tuple(row[len(key_columns):])
+        for row in db.session.query(*key_columns, *value_columns)
+    }
+
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+    changed = []
+    seen = set()
+    for row in rows:
+        key = tuple(row[column] for column in SPACE_KEY_COLUMNS)
+        seen.add(key)
+        current = existing.get(key)
+        if current is None:
+            counts['inserted'] += 1
+        elif not _same_values(current, tuple(row[column] for column in SPACE_UPDATE_COLUMNS)):
+            counts['updated'] += 1
+        else:
+            counts['unchanged'] += 1
+            continue
+        changed.append(row)
+
+    if changed:
+        db.session.execute(_upsert_statement(changed))
+        # 장소 목록 ETag 무효화
+        bump_data_version(SPACE_CATALOG)
+
+    counts['not_in_seed'] = len(existing.keys() - seen)
+    return counts
+
+
 def initialize_spaces():
     app = create_app()
     with app.app_context():
         try:
-            
-            print("INFO: 기존 예약(Booking) 데이터를 모두 삭제합니다...")
-            db.session.query(Booking).delete()
-
-            
-            print("INFO: 기존 장소(Space) 데이터를 모두 삭제합니다...")
-            db.session.query(Space).delete()
-            
-            
-            spaces_to_add = []
-            for name, sub_cat, loc, cap in spaces_data:
-                category = CATEGORY_MAP.get(sub_cat, '기타')
-                
-          
-                coords = COORDINATE_MAP.get(sub_cat)
-                lat, lng = (None, None)
-                if coords:
-                    lat, lng = coords
-
-                new_space = Space(
-                    name=name,
-                    category=category,
-                    subCategory=sub_cat,
-                    location=loc,
-                    capacity=cap,
-                    latitude=lat,    
-                    longitude=lng
-                )
-                spaces_to_add.append(new_space)
-            
-           
-            print(f"INFO: 총 {len(spaces_to_add)}개의 새 장소 데이터를 추가합니다...")
-            db.session.add_all(spaces_to_add)
-            
-            
+            rows = build_space_rows()
+            print(f"INFO: 장소 {len(rows)}개를 (이름, 위치) 기준으로 추가/갱신합니다. (기존 예약은 유지됩니다)")
+            counts = upsert_spaces(rows)
             db.session.commit()
-            print("SUCCESS: 장소 데이터베이스가 성공적으로 초기화되었습니다.")
+
+            print(f"SUCCESS: 추가 {counts['inserted']}개, 갱신 {counts['updated']}개, 변경 없음 {counts['unchanged']}개")
+            if counts['not_in_seed']:
+                print(f"INFO: seed 데이터에 없는 기존 장소 {counts['not_in_seed']}개는 그대로 두었습니다.")
 
         except Exception as e:
             db.session.rollback()
@@ -0,0 +1,41 @@
+import os
+import tempfile
+
+import pytest
+
+# config.Config 는 불러올 때 환경 변수를 읽으므로, 앱을 불러오기 전에 테스트용 SQLite 파일 DB 를 지정합니다.
+os.environ['DATABASE_URI'] = 'sqlite:///' + os.path.join(tempfile.gettempdir(), 'decom_test.db')
+os.environ.setdefault('BCRYPT_LOG_ROUNDS', '4')
+os.environ.setdefault('BCRYPT_POOL_SIZE', '0')
+
+from flask_jwt_extended import create_access_token  # noqa: E402
+
+from app import create_app, db  # noqa: E402
+from app.models import Space, User  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.add(Space('테스트룸', '스터디룸', '스터디룸', '테스트관', 4))
+        db.session.add(User('12345678', 'tester', 'password'))
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_headers(app):
+    with app.app_context():
+        return {'Authorization': 'Bearer ' + create_access_token(identity='12345678')}
@@ -0,0 +1,31 @@
+import pytest
+
+
+def _book(client, headers, start, end, date='2030-05-03'):
+    return client.post('/api/bookings', headers=headers, json={
+        'roomName': '테스트룸', 'roomLocation': '테스트관', 'date': date,
+        'startTime': start, 'endTime': end, 'applicant': 'tester', 'phone': '010-0000-0000',
+        'email': 'tester@example.com', 'eventName': 'test', 'numPeople': 2, 'acUse': 'no'
+    })
+
+
+@pytest.mark.parametrize('strategy', ['lock', 'slot_claim'])
+def test_adjacent_bookings_do_not_conflict(app, client, auth_headers, strategy):
+    app.config['BOOKING_CONFLICT_STRATEGY'] = strategy
+
+    assert _book(client, auth_headers, '11:00', '11:10').status_code == 201
+    assert _book(client, auth_headers, '11:10', '11:30').status_code == 201
+    assert _book(client, auth_headers, '10:50', '11:00').status_code == 201
+
+    response = _book(client, auth_headers, '11:20', '11:40')
+    assert response.status_code == 409
+    assert response.get_json()['details'] == '기존 예약: 11:10~11:30'
+
+
+@pytest.mark.parametrize('strategy', ['lock', 'slot_claim'])
+@pytest.mark.parametrize('start, end', [('11:00', '11:05'), ('11:05', '11:30')])
+def test_unaligned_times_are_rejected(app, client, auth_headers, strategy, start, end):
+    app.config['BOOKING_CONFLICT_STRATEGY'] = strategy
+
+    assert _book(client, auth_headers, start, end).status_code == 400
+    assert _book(client, auth_headers, '11:00', '11:30').status_code == 201